@@ -35,6 +35,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Translation tables for single-pass path separator normalization
+_TO_WINDOWS_SEP = str.maketrans({'/': '\\'})
+_TO_POSIX_SEP = str.maketrans({'\\': '/'})
+
 
 def with_timeout(timeout_seconds: float):
     """Cross-platform timeout decorator"""
@@ -107,6 +111,7 @@ class MCPConfig:
     security_mode: str  # "strict", "moderate", "permissive"
     config_version: str
     last_modified: str
+    force_polling: bool = False  # Poll instead of native events (NFS/CIFS/SMB mounts)
     
     def __post_init__(self):
         if self.global_exclude_patterns is None:
@@ -202,17 +207,12 @@ class MCPConfigManager:
             path_str = str(resolved_path)
             
             # Normalize path separators for cross-platform compatibility
-            if platform.system() == "Windows":
-                path_str = path_str.replace("/", "\\")
-            else:
-                path_str = path_str.replace("\\", "/")
+            sep_table = _TO_WINDOWS_SEP if platform.system() == "Windows" else _TO_POSIX_SEP
+            path_str = path_str.translate(sep_table)
             
             # Check against known system directories
             for system_dir in self._system_directories:
-                if platform.system() == "Windows":
-                    system_dir_normalized = system_dir.replace("/", "\\")
-                else:
-                    system_dir_normalized = system_dir.replace("\\", "/")
+                system_dir_normalized = system_dir.translate(sep_table)
                 
                 # Check if the path starts with a system directory
                 if path_str.startswith(system_dir_normalized):
@@ -295,7 +295,8 @@ class MCPConfigManager:
                     audit_logging=data.get('audit_logging', True),
                     security_mode=data.get('security_mode', 'moderate'),
                     config_version=data.get('config_version', '2.0.0'),
-                    last_modified=data.get('last_modified', datetime.now().isoformat())
+                    last_modified=data.get('last_modified', datetime.now().isoformat()),
+                    force_polling=data.get('force_polling', False)
                 )
                 
                 # Validate configuration
@@ -9,35 +9,43 @@ Dodo payment events in real-time.
 import sqlite3
 import time
 import json
-from datetime import datetime
 from pathlib import Path
 
 class WebhookMonitor:
     def __init__(self):
         self.db_path = Path("prisma/dev.db")
-        self.last_check = datetime.now()
+        self._conn = None
         
+    def _get_connection(self):
+        """Open the database on first use and reuse the connection afterwards"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
+    
+    def close(self):
+        """Close the shared database connection, if one is open"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def get_recent_webhooks(self, minutes=5):
         """Get webhooks from the last N minutes"""
         if not self.db_path.exists():
             return []
             
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         try:
             cursor.execute("""
                 SELECT * FROM webhook_events 
-                WHERE createdAt > datetime('now', '-{} minutes')
+                WHERE createdAt > datetime('now', ?)
                 ORDER BY createdAt DESC
-            """.format(minutes))
+            """, (f"-{minutes} minutes",))
             
             webhooks = [dict(row) for row in cursor.fetchall()]
-            conn.close()
             return webhooks
         except sqlite3.OperationalError:
-            conn.close()
             return []
     
     def get_recent_subscriptions(self, minutes=10):
@@ -45,9 +53,7 @@ class WebhookMonitor:
         if not self.db_path.exists():
             return []
             
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         try:
             cursor.execute("""
@@ -55,15 +61,13 @@ class WebhookMonitor:
                 FROM subscriptions s
                 LEFT JOIN users u ON s.userId = u.id
                 LEFT JOIN licenses l ON s.licenseKey = l.licenseKey
-                WHERE s.createdAt > datetime('now', '-{} minutes')
+                WHERE s.createdAt > datetime('now', ?)
                 ORDER BY s.createdAt DESC
-            """.format(minutes))
+            """, (f"-{minutes} minutes",))
             
             subscriptions = [dict(row) for row in cursor.fetchall()]
-            conn.close()
             return subscriptions
         except sqlite3.OperationalError:
-            conn.close()
             return []
     
     def get_recent_licenses(self, minutes=10):
@@ -71,24 +75,62 @@ class WebhookMonitor:
         if not self.db_path.exists():
             return []
             
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         try:
             cursor.execute("""
                 SELECT l.*, u.email 
                 FROM licenses l
                 LEFT JOIN users u ON l.userId = u.id
-                WHERE l.createdAt > datetime('now', '-{} minutes')
+                WHERE l.createdAt > datetime('now', ?)
                 ORDER BY l.createdAt DESC
-            """.format(minutes))
+            """, (f"-{minutes} minutes",))
             
             licenses = [dict(row) for row in cursor.fetchall()]
-            conn.close()
             return licenses
         except sqlite3.OperationalError:
-            conn.close()
+            return []
+    
+    def get_webhook_stats(self, minutes=60):
+        """Count total, processed and failed webhooks from the last N minutes in one query"""
+        empty = {'total': 0, 'processed': 0, 'failed': 0}
+        if not self.db_path.exists():
+            return empty
+            
+        cursor = self._get_connection().cursor()
+        
+        try:
+            cursor.execute("""
+                SELECT COUNT(*) AS total,
+                       COALESCE(SUM(processed != 0), 0) AS processed,
+                       COALESCE(SUM(processed = 0 AND attempts > 0), 0) AS failed
+                FROM webhook_events 
+                WHERE createdAt > datetime('now', ?)
+            """, (f"-{minutes} minutes",))
+            
+            return dict(cursor.fetchone())
+        except sqlite3.OperationalError:
+            return empty
+    
+    def get_recent_failures(self, minutes=60, limit=3):
+        """Get the newest failed webhooks from the last N minutes, newest first"""
+        if not self.db_path.exists():
+            return []
+            
+        cursor = self._get_connection().cursor()
+        
+        try:
+            cursor.execute("""
+                SELECT eventType, error FROM webhook_events 
+                WHERE createdAt > datetime('now', ?)
+                  AND processed = 0 AND attempts > 0
+                ORDER BY createdAt DESC
+                LIMIT ?
+            """, (f"-{minutes} minutes", limit))
+            
+            failures = [dict(row) for row in cursor.fetchall()]
+            return failures
+        except sqlite3.OperationalError:
             return []
     
     def print_webhook_summary(self, webhooks):
@@ -149,7 +191,7 @@ class WebhookMonitor:
         try:
             while True:
                 # Clear screen and show current time
-                print(f"\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                print(f"\n🕐 {time.strftime('%Y-%m-%d %H:%M:%S')}")
                 print("-" * 50)
                 
                 # Get recent data
@@ -183,28 +225,29 @@ class WebhookMonitor:
         print("✅ Database connection OK")
         
         # Check recent webhook activity
-        webhooks = self.get_recent_webhooks(60)  # Last hour
-        successful_webhooks = [w for w in webhooks if w['processed']]
-        failed_webhooks = [w for w in webhooks if not w['processed'] and w['attempts'] > 0]
+        stats = self.get_webhook_stats(60)  # Last hour
         
-        print(f"📊 Last hour: {len(webhooks)} total, {len(successful_webhooks)} processed, {len(failed_webhooks)} failed")
+        print(f"📊 Last hour: {stats['total']} total, {stats['processed']} processed, {stats['failed']} failed")
         
-        if failed_webhooks:
+        if stats['failed']:
             print("⚠️  Recent failures:")
-            for failure in failed_webhooks[-3:]:  # Show last 3 failures
+            for failure in self.get_recent_failures(60):  # Show last 3 failures
                 print(f"  {failure['eventType']} - {failure['error']}")
         
-        return len(failed_webhooks) == 0
+        return stats['failed'] == 0
 
 def main():
     import sys
     
     monitor = WebhookMonitor()
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--health":
-        monitor.check_webhook_health()
-    else:
-        monitor.monitor_continuous()
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "--health":
+            monitor.check_webhook_health()
+        else:
+            monitor.monitor_continuous()
+    finally:
+        monitor.close()
 
 if __name__ == "__main__":
     main()
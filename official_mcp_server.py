@@ -22,21 +22,28 @@ import json
 import threading
 import time
 import hashlib
+import multiprocessing
+import mmap
 import psutil
 import functools
 import weakref
 import stat
 import stat
 import platform
+import ntpath
+import posixpath
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Set, Tuple, Callable, Union
+from typing import List, Optional, Dict, Any, Set, Tuple, Callable, Union, Iterator
 import logging
 from dataclasses import dataclass, field
-from collections import defaultdict, OrderedDict, deque
+from collections import Counter, defaultdict, OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from enum import Enum
 import traceback
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import fnmatch
+import math
+from array import array
 
 # Python 3.13 compatibility imports
 try:
@@ -46,6 +53,24 @@ except ImportError as e:
     print("Please ensure FastMCP is installed: pip install fastmcp", file=sys.stderr)
     sys.exit(1)
 
+# Optional in-process git bindings; the git CLI is used when unavailable
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Faster JSON encoding for audit log lines; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# getrusage is POSIX-only; peak memory falls back to psutil elsewhere
+try:
+    import resource
+except ImportError:
+    resource = None
+
 # Import our configuration manager
 try:
     from mcp_config_manager import MCPConfigManager
@@ -230,6 +255,16 @@ class LRUCache:
             self._timestamps.clear()
             self.stats.size = 0
     
+    def invalidate(self, predicate: Callable[[str], bool]) -> int:
+        """Remove all entries whose key matches predicate, returning the count"""
+        with self._lock:
+            stale_keys = [key for key in self._cache if predicate(key)]
+            for key in stale_keys:
+                del self._cache[key]
+                del self._timestamps[key]
+            self.stats.size = len(self._cache)
+            return len(stale_keys)
+    
     def get_stats(self) -> CacheStats:
         with self._lock:
             self.stats.size = len(self._cache)
@@ -542,17 +577,25 @@ class SecurityManager:
         """Write audit log entry to file"""
         try:
             audit_log_path = Path(self.config_manager.config_path).parent / "security_audit.log"
-            with open(audit_log_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps({
-                    "timestamp": entry.timestamp.isoformat(),
-                    "action": entry.action,
-                    "tool_name": entry.tool_name,
-                    "file_path": entry.file_path,
-                    "user_context": entry.user_context,
-                    "success": entry.success,
-                    "error_message": entry.error_message,
-                    "additional_data": entry.additional_data
-                }) + '\n')
+            record = {
+                "timestamp": entry.timestamp.isoformat(),
+                "action": entry.action,
+                "tool_name": entry.tool_name,
+                "file_path": entry.file_path,
+                "user_context": entry.user_context,
+                "success": entry.success,
+                "error_message": entry.error_message,
+                "additional_data": entry.additional_data
+            }
+            if orjson is not None:
+                line = orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+            else:
+                # Match orjson's native ISO 8601 output for datetimes
+                line = (json.dumps(
+                    record, default=lambda obj: obj.isoformat() if isinstance(obj, datetime) else str(obj)
+                ) + '\n').encode('utf-8')
+            with open(audit_log_path, 'ab') as f:
+                f.write(line)
         except Exception as e:
             logger.error(f"Failed to write audit log entry: {e}")
     
@@ -680,6 +723,10 @@ class SecurityManager:
             logger.error(f"Failed to get privilege status: {e}")
             return {"error": str(e)}
 
+# Memory is sampled on every recorded operation; reuse a reading this fresh
+_MEMORY_SAMPLE_TTL = 0.1
+
+
 class PerformanceMonitor:
     """Comprehensive performance monitoring and error handling"""
     
@@ -687,8 +734,10 @@ class PerformanceMonitor:
         self.slow_operation_threshold = slow_operation_threshold
         self.metrics: List[PerformanceMetrics] = []
         self.error_counts: Dict[ErrorCategory, int] = defaultdict(int)
-        self.operation_counts: Dict[str, int] = defaultdict(int)
-        self.operation_times: Dict[str, List[float]] = defaultdict(list)
+        self.operation_counts: Counter = Counter()
+        # Unboxed doubles: 8 bytes per sample instead of a float object plus list slot
+        self.operation_times: Dict[str, array] = defaultdict(lambda: array('d'))
+        self._operation_time_totals: Dict[str, float] = defaultdict(float)
         self._lock = threading.RLock()
         self._start_time = time.time()
         
@@ -702,12 +751,35 @@ class PerformanceMonitor:
         self.file_cache = LRUCache(max_size=500, ttl=300)  # 5 minutes
         self.symbol_cache = LRUCache(max_size=1000, ttl=600)  # 10 minutes
         self.git_cache = LRUCache(max_size=100, ttl=300)  # 5 minutes
+        
+        # (sampled_at, memory_mb); replaced as a whole so reads need no lock
+        self._process = None
+        self._memory_sample: Tuple[float, float] = (float('-inf'), 0.0)
     
     def get_memory_usage(self) -> float:
-        """Get current memory usage in MB"""
+        """Get current memory usage in MB (sampled at most every 100 ms)"""
+        now = time.monotonic()
+        sampled_at, memory_mb = self._memory_sample
+        if now - sampled_at < _MEMORY_SAMPLE_TTL:
+            return memory_mb
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
+            if self._process is None:
+                self._process = psutil.Process()
+            memory_mb = self._process.memory_info().rss / 1024 / 1024
+        except Exception:
+            return 0.0
+        self._memory_sample = (now, memory_mb)
+        return memory_mb
+    
+    def get_peak_memory_usage(self) -> float:
+        """Get peak memory usage in MB from a single getrusage call"""
+        try:
+            if resource is not None:
+                max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                # Linux reports kilobytes, macOS bytes
+                return max_rss / 1024 / 1024 if sys.platform == 'darwin' else max_rss / 1024
+            memory_info = psutil.Process().memory_info()
+            return getattr(memory_info, 'peak_wset', memory_info.rss) / 1024 / 1024
         except Exception:
             return 0.0
     
@@ -715,6 +787,8 @@ class PerformanceMonitor:
                         success: bool, error_category: Optional[ErrorCategory] = None,
                         context: Optional[Dict[str, Any]] = None) -> None:
         """Record performance metrics for an operation"""
+        # Operation names repeat constantly; intern so dict lookups hit on identity
+        operation_name = sys.intern(operation_name)
         with self._lock:
             memory_usage = self.get_memory_usage()
             metrics = PerformanceMetrics(
@@ -729,6 +803,7 @@ class PerformanceMonitor:
             self.metrics.append(metrics)
             self.operation_counts[operation_name] += 1
             self.operation_times[operation_name].append(execution_time)
+            self._operation_time_totals[operation_name] += execution_time
             
             if not success and error_category:
                 self.error_counts[error_category] += 1
@@ -747,11 +822,13 @@ class PerformanceMonitor:
             successful_operations = sum(1 for m in self.metrics if m.success)
             failed_operations = total_operations - successful_operations
             
-            # Calculate averages
+            # Calculate averages and 95th percentiles (nearest rank)
             avg_times = {}
+            p95_times = {}
             for op_name, times in self.operation_times.items():
                 if times:
-                    avg_times[op_name] = sum(times) / len(times)
+                    avg_times[op_name] = self._operation_time_totals[op_name] / len(times)
+                    p95_times[op_name] = sorted(times)[math.ceil(0.95 * len(times)) - 1]
             
             # Get slowest operations
             slow_operations = [
@@ -773,10 +850,12 @@ class PerformanceMonitor:
                 "failed_operations": failed_operations,
                 "success_rate": successful_operations / total_operations if total_operations > 0 else 0,
                 "average_execution_times": avg_times,
+                "p95_execution_times": p95_times,
                 "operation_counts": dict(self.operation_counts),
                 "error_counts": {cat.value: count for cat, count in self.error_counts.items()},
                 "slow_operations": slow_operations[:10],  # Top 10 slowest
                 "current_memory_mb": self.get_memory_usage(),
+                "peak_memory_mb": self.get_peak_memory_usage(),
                 "cache_stats": {
                     "file_cache": self.file_cache.get_stats(),
                     "symbol_cache": self.symbol_cache.get_stats(),
@@ -839,8 +918,7 @@ def performance_timer(operation_name: str):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
-            start_memory = performance_monitor.get_memory_usage()
+            start_time = time.perf_counter()
             success = True
             error_category = None
             context = {}
@@ -887,7 +965,7 @@ def performance_timer(operation_name: str):
                 raise
                 
             finally:
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 performance_monitor.record_operation(
                     operation_name, execution_time, success, error_category, context
                 )
@@ -895,6 +973,89 @@ def performance_timer(operation_name: str):
         return wrapper
     return decorator
 
+# Below this many Python files, process pool startup outweighs parallel parsing
+_PARALLEL_INDEX_MIN_FILES = 32
+
+# Index workers must not fork the server directly: a child could inherit a lock
+# (logging, watchdog observers, debounce timers) held by another thread
+_INDEX_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Below one page, a plain read() is cheaper than setting up a mapping
+_MMAP_MIN_BYTES = 4096
+
+# Files modified this recently may change again within the same mtime tick
+_RACY_MTIME_WINDOW_NS = 1_000_000_000
+
+# Source file types CodeIndexer has indexers for
+_INDEXABLE_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.go'})
+
+
+def _read_source_bytes(file_path: str) -> bytes:
+    """Read a source file as raw bytes, memory-mapping files of a page or more"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_MIN_BYTES:
+            return f.read()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:]
+
+
+def _content_digest(data: bytes) -> bytes:
+    """Digest used to tell whether an indexed file's content actually changed"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _parse_python_source(file_path: str, source: bytes) -> List[Symbol]:
+    """Extract symbols from Python source bytes (raises on syntax errors)"""
+    # ast.parse takes bytes directly (honouring coding cookies), so the
+    # source is never decoded as a whole; only definition lines are
+    tree = ast.parse(source, filename=file_path)
+    lines = source.split(b'\n')
+    
+    def definition_line(lineno: int) -> str:
+        if lineno > len(lines):
+            return ''
+        return lines[lineno - 1].decode('utf-8', errors='replace').strip()
+    
+    symbols = []
+    
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            symbols.append(Symbol(
+                name=node.name,
+                type='function' if isinstance(node, ast.FunctionDef) else 'class',
+                file_path=file_path,
+                line_number=node.lineno,
+                definition=definition_line(node.lineno),
+                docstring=ast.get_docstring(node)
+            ))
+        
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                symbols.append(Symbol(
+                    name=alias.name,
+                    type='import',
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    definition=definition_line(node.lineno)
+                ))
+    
+    return symbols
+
+
+def _parse_python_file(file_path: str) -> Tuple[str, List[Symbol], Optional[str], Optional[bytes]]:
+    """Parse a Python file into symbols without touching shared index state.
+    
+    Module-level so it can run in worker processes. Returns
+    (file_path, symbols, error, digest) where error is None on success.
+    """
+    try:
+        source = _read_source_bytes(file_path)
+        return file_path, _parse_python_source(file_path, source), None, _content_digest(source)
+    except Exception as e:
+        return file_path, [], str(e), None
+
+
 class CodeIndexer:
     """Indexes code symbols and references for fast searching"""
     
@@ -903,86 +1064,252 @@ class CodeIndexer:
         self.references: Dict[str, List[Reference]] = defaultdict(list)
         self.indexed_files: Set[str] = set()
         self._index_lock = threading.Lock()
+        # Inverted views of self.symbols, maintained by _add_symbol/_remove_file_symbols
+        self._names_by_file: Dict[str, Set[str]] = defaultdict(set)
+        self._names_by_lower: Dict[str, Set[str]] = defaultdict(set)
+        # Pick the path flavour once instead of branching on every normalize
+        self._pathmod = ntpath if platform.system() == 'Windows' else posixpath
+        # file_path -> (mtime_ns, size, content digest) as of its last index
+        self._file_stamps: Dict[str, Tuple[int, int, bytes]] = {}
+    
+    def _normalize_path(self, path: str) -> str:
+        """Canonicalize separators and '.'/'..' segments so index keys are stable"""
+        return self._pathmod.normpath(path)
+    
+    def _normalize_paths(self, paths: List[str]) -> List[str]:
+        """Bulk form of _normalize_path"""
+        normpath = self._pathmod.normpath
+        return [normpath(path) for path in paths]
+        
+    def _unchanged_since_index(self, file_path: str, st: os.stat_result) -> bool:
+        """Cheap check: same mtime and size as when the file was last indexed"""
+        stamp = self._file_stamps.get(file_path)
+        return (stamp is not None and stamp[0] == st.st_mtime_ns and stamp[1] == st.st_size
+                and file_path in self.indexed_files)
+    
+    def _content_unchanged(self, file_path: str, st: os.stat_result, digest: bytes) -> bool:
+        """Second check once the stat changed: same content digest (e.g. touch or checkout)"""
+        stamp = self._file_stamps.get(file_path)
+        if stamp is None or stamp[2] != digest or file_path not in self.indexed_files:
+            return False
+        with self._index_lock:
+            self._record_stamp(file_path, st, digest)
+        return True
+    
+    def _record_stamp(self, file_path: str, st: os.stat_result, digest: bytes) -> None:
+        """Remember what was indexed; caller holds _index_lock.
         
+        A file modified within the last second may change again without its
+        mtime moving, so its mtime is not trusted and the digest decides.
+        """
+        mtime_ns = st.st_mtime_ns
+        if time.time_ns() - mtime_ns < _RACY_MTIME_WINDOW_NS:
+            mtime_ns = -1
+        self._file_stamps[file_path] = (mtime_ns, st.st_size, digest)
+    
+    def _add_symbol(self, symbol: Symbol) -> None:
+        """Add a symbol to the index; caller holds _index_lock"""
+        name = symbol.name
+        self.symbols[name].append(symbol)
+        self._names_by_file[symbol.file_path].add(name)
+        self._names_by_lower[name.lower()].add(name)
+    
+    def _remove_file_symbols(self, file_path: str) -> None:
+        """Drop the symbols a file contributed, touching only its own names; caller holds _index_lock"""
+        for name in self._names_by_file.pop(file_path, ()):
+            remaining = [s for s in self.symbols.get(name, ()) if s.file_path != file_path]
+            if remaining:
+                self.symbols[name] = remaining
+                continue
+            self.symbols.pop(name, None)
+            name_lower = name.lower()
+            names = self._names_by_lower.get(name_lower)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._names_by_lower[name_lower]
+    
+    def remove_file(self, file_path: str) -> None:
+        """Remove a file's symbols and references from the index"""
+        file_path = self._normalize_path(file_path)
+        with self._index_lock:
+            self._remove_file_symbols(file_path)
+            for ref_name in list(self.references):
+                refs = [r for r in self.references[ref_name] if r.file_path != file_path]
+                if refs:
+                    self.references[ref_name] = refs
+                else:
+                    del self.references[ref_name]
+            self.indexed_files.discard(file_path)
+            self._file_stamps.pop(file_path, None)
+    
     def index_python_file(self, file_path: str) -> None:
         """Index symbols and references in a Python file"""
+        # Every Symbol for this file shares one interned, normalized path string
+        file_path = sys.intern(self._normalize_path(file_path))
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content, filename=file_path)
-            lines = content.split('\n')
-            
-            with self._index_lock:
-                # Clear existing symbols for this file
-                for symbol_list in self.symbols.values():
-                    symbol_list[:] = [s for s in symbol_list if s.file_path != file_path]
-                
-                # Index new symbols
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        docstring = ast.get_docstring(node)
-                        symbol = Symbol(
-                            name=node.name,
-                            type='function',
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            definition=lines[node.lineno - 1].strip() if node.lineno <= len(lines) else '',
-                            docstring=docstring
-                        )
-                        self.symbols[node.name].append(symbol)
-                        
-                    elif isinstance(node, ast.ClassDef):
-                        docstring = ast.get_docstring(node)
-                        symbol = Symbol(
-                            name=node.name,
-                            type='class',
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            definition=lines[node.lineno - 1].strip() if node.lineno <= len(lines) else '',
-                            docstring=docstring
-                        )
-                        self.symbols[node.name].append(symbol)
-                        
-                    elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                        if isinstance(node, ast.Import):
-                            for alias in node.names:
-                                symbol = Symbol(
-                                    name=alias.name,
-                                    type='import',
-                                    file_path=file_path,
-                                    line_number=node.lineno,
-                                    definition=lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ''
-                                )
-                                self.symbols[alias.name].append(symbol)
-                        else:  # ImportFrom
-                            for alias in node.names:
-                                symbol = Symbol(
-                                    name=alias.name,
-                                    type='import',
-                                    file_path=file_path,
-                                    line_number=node.lineno,
-                                    definition=lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ''
-                                )
-                                self.symbols[alias.name].append(symbol)
-                
-                self.indexed_files.add(file_path)
-                
+            st = os.stat(file_path)
+            if self._unchanged_since_index(file_path, st):
+                return
+            source = _read_source_bytes(file_path)
+            digest = _content_digest(source)
+            if self._content_unchanged(file_path, st, digest):
+                return
+            symbols = _parse_python_source(file_path, source)
         except Exception as e:
             logger.warning(f"Failed to index Python file {file_path}: {e}")
+            return
+        
+        with self._index_lock:
+            # Clear existing symbols for this file
+            self._remove_file_symbols(file_path)
+            
+            # Index new symbols
+            for symbol in symbols:
+                self._add_symbol(symbol)
+            
+            self.indexed_files.add(file_path)
+            self._record_stamp(file_path, st, digest)
+    
+    def index_files(self, file_paths: List[str], workers: Optional[int] = None) -> int:
+        """Index many files at once, parsing Python sources in worker processes.
+        
+        Python AST parsing is CPU-bound and holds the GIL, so large batches are
+        spread across a process pool; small batches are parsed inline since
+        pool startup would dominate. Other languages use their regular
+        per-file indexers.
+        
+        Args:
+            file_paths: Files to index
+            workers: Number of worker processes (default: os.cpu_count())
+            
+        Returns:
+            Number of files indexed successfully
+        """
+        workers = workers or os.cpu_count() or 1
+        file_paths = self._normalize_paths(file_paths)
+        python_files = [p for p in file_paths if Path(p).suffix.lower() == '.py']
+        other_files = [p for p in file_paths if Path(p).suffix.lower() != '.py']
+        
+        # Files whose mtime and size match their last index are not re-parsed
+        file_stats: Dict[str, os.stat_result] = {}
+        unchanged_count = 0
+        pending_files = []
+        for file_path in python_files:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                pending_files.append(file_path)  # The parse reports the error
+                continue
+            if self._unchanged_since_index(file_path, st):
+                unchanged_count += 1
+                continue
+            file_stats[file_path] = st
+            pending_files.append(file_path)
+        python_files = pending_files
+        
+        results = None
+        if workers > 1 and len(python_files) >= _PARALLEL_INDEX_MIN_FILES:
+            chunksize = max(1, len(python_files) // (workers * 4))
+            try:
+                mp_context = multiprocessing.get_context(_INDEX_POOL_START_METHOD)
+                with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                    results = list(executor.map(_parse_python_file, python_files, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Parallel indexing unavailable, indexing sequentially: {e}")
+        if results is None:
+            results = [_parse_python_file(p) for p in python_files]
+        
+        parsed: Dict[str, List[Symbol]] = {}
+        digests: Dict[str, bytes] = {}
+        for file_path, symbols, error, digest in results:
+            if error is not None:
+                logger.warning(f"Failed to index Python file {file_path}: {error}")
+                continue
+            file_path = sys.intern(file_path)
+            for symbol in symbols:
+                symbol.file_path = file_path
+            parsed[file_path] = symbols
+            digests[file_path] = digest
+        
+        if parsed:
+            with self._index_lock:
+                for file_path, symbols in parsed.items():
+                    self._remove_file_symbols(file_path)
+                    if file_path in file_stats:
+                        self._record_stamp(file_path, file_stats[file_path], digests[file_path])
+                    for symbol in symbols:
+                        self._add_symbol(symbol)
+                    self.indexed_files.add(file_path)
+        
+        indexed_count = len(parsed) + unchanged_count
+        for file_path in other_files:
+            file_ext = Path(file_path).suffix.lower()
+            if file_ext == '.js':
+                self.index_javascript_file(file_path)
+            elif file_ext == '.ts':
+                self.index_typescript_file(file_path)
+            elif file_ext == '.go':
+                self.index_go_file(file_path)
+            else:
+                continue
+            if file_path in self.indexed_files:
+                indexed_count += 1
+        
+        return indexed_count
+    
+    def index_directory(self, directory: str, path_filter: Optional[Callable[[str], bool]] = None) -> int:
+        """Index every supported source file under directory that is not indexed yet.
+        
+        Walks the tree once with os.scandir, whose entries carry their joined
+        path and file type, instead of one Path.rglob pass per language.
+        Symlinked directories are not followed.
+        
+        Args:
+            directory: Root directory to scan
+            path_filter: Optional predicate; files it rejects are skipped
+            
+        Returns:
+            Number of files submitted for indexing
+        """
+        file_paths = []
+        pending_dirs = [directory]
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif (os.path.splitext(entry.name)[1] in _INDEXABLE_EXTENSIONS
+                              and self._normalize_path(entry.path) not in self.indexed_files
+                              and entry.is_file()
+                              and (path_filter is None or path_filter(entry.path))):
+                            file_paths.append(entry.path)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory during indexing: {e}")
+        
+        self.index_files(file_paths)
+        return len(file_paths)
     
     def index_javascript_file(self, file_path: str) -> None:
         """Index symbols in a JavaScript file using regex patterns"""
+        # Every Symbol for this file shares one interned, normalized path string
+        file_path = sys.intern(self._normalize_path(file_path))
         try:
+            st = os.stat(file_path)
+            if self._unchanged_since_index(file_path, st):
+                return
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+            digest = _content_digest(content.encode('utf-8'))
+            if self._content_unchanged(file_path, st, digest):
+                return
                 
             lines = content.split('\n')
             
             with self._index_lock:
                 # Clear existing symbols for this file
-                for symbol_list in self.symbols.values():
-                    symbol_list[:] = [s for s in symbol_list if s.file_path != file_path]
+                self._remove_file_symbols(file_path)
                 
                 # Function declarations (including async)
                 function_pattern = r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\('
@@ -997,7 +1324,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[func_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Arrow functions
                 arrow_function_pattern = r'^\s*(?:export\s+)?const\s+(\w+)\s*=.*=>'
@@ -1012,7 +1339,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[func_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Class declarations
                 class_pattern = r'^\s*(?:export\s+)?class\s+(\w+)'
@@ -1027,7 +1354,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[class_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Class methods (better detection)
                 method_pattern = r'^\s*(?:async\s+)?(\w+)\s*\([^)]*\)\s*\{'
@@ -1051,7 +1378,7 @@ class CodeIndexer:
                                 line_number=i + 1,
                                 definition=line.strip()
                             )
-                            self.symbols[method_name].append(symbol)
+                            self._add_symbol(symbol)
                 
                 # Variable/const declarations
                 var_pattern = r'^\s*(?:export\s+)?(?:const|let|var)\s+(\w+)'
@@ -1066,7 +1393,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[var_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # ES6 imports
                 import_pattern = r'^\s*import.*from\s+["\']([^"\']+)["\']'
@@ -1086,25 +1413,33 @@ class CodeIndexer:
                                     line_number=i + 1,
                                     definition=line.strip()
                                 )
-                                self.symbols[clean_name].append(symbol)
+                                self._add_symbol(symbol)
                 
                 self.indexed_files.add(file_path)
+                self._record_stamp(file_path, st, digest)
                 
         except Exception as e:
             logger.warning(f"Failed to index JavaScript file {file_path}: {e}")
     
     def index_typescript_file(self, file_path: str) -> None:
         """Index symbols in a TypeScript file using regex patterns"""
+        # Every Symbol for this file shares one interned, normalized path string
+        file_path = sys.intern(self._normalize_path(file_path))
         try:
+            st = os.stat(file_path)
+            if self._unchanged_since_index(file_path, st):
+                return
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+            digest = _content_digest(content.encode('utf-8'))
+            if self._content_unchanged(file_path, st, digest):
+                return
                 
             lines = content.split('\n')
             
             with self._index_lock:
                 # Clear existing symbols for this file
-                for symbol_list in self.symbols.values():
-                    symbol_list[:] = [s for s in symbol_list if s.file_path != file_path]
+                self._remove_file_symbols(file_path)
                 
                 # Interface declarations
                 interface_pattern = r'^\s*(?:export\s+)?interface\s+(\w+)'
@@ -1119,7 +1454,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[interface_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Type declarations
                 type_pattern = r'^\s*(?:export\s+)?type\s+(\w+)\s*='
@@ -1134,7 +1469,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[type_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Enum declarations
                 enum_pattern = r'^\s*(?:export\s+)?enum\s+(\w+)'
@@ -1149,7 +1484,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[enum_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Class declarations
                 class_pattern = r'^\s*(?:export\s+)?class\s+(\w+)'
@@ -1164,7 +1499,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[class_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Function declarations (including async)
                 function_pattern = r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\('
@@ -1179,7 +1514,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[func_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Arrow functions
                 arrow_function_pattern = r'^\s*(?:export\s+)?const\s+(\w+)\s*=.*=>'
@@ -1194,7 +1529,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[func_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Const/let declarations
                 const_pattern = r'^\s*(?:export\s+)?(?:const|let)\s+(\w+)'
@@ -1209,7 +1544,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[var_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Generic type parameters (for interfaces, types, classes, functions)
                 generic_patterns = [
@@ -1238,7 +1573,7 @@ class CodeIndexer:
                                     line_number=i + 1,
                                     definition=line.strip()
                                 )
-                                self.symbols[symbol_name].append(symbol)
+                                self._add_symbol(symbol)
                 
                 # ES6 imports
                 import_pattern = r'^\s*import.*from\s+["\']([^"\']+)["\']'
@@ -1258,25 +1593,33 @@ class CodeIndexer:
                                     line_number=i + 1,
                                     definition=line.strip()
                                 )
-                                self.symbols[clean_name].append(symbol)
+                                self._add_symbol(symbol)
                 
                 self.indexed_files.add(file_path)
+                self._record_stamp(file_path, st, digest)
                 
         except Exception as e:
             logger.warning(f"Failed to index TypeScript file {file_path}: {e}")
     
     def index_go_file(self, file_path: str) -> None:
         """Index symbols in a Go file using regex patterns"""
+        # Every Symbol for this file shares one interned, normalized path string
+        file_path = sys.intern(self._normalize_path(file_path))
         try:
+            st = os.stat(file_path)
+            if self._unchanged_since_index(file_path, st):
+                return
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+            digest = _content_digest(content.encode('utf-8'))
+            if self._content_unchanged(file_path, st, digest):
+                return
                 
             lines = content.split('\n')
             
             with self._index_lock:
                 # Clear existing symbols for this file
-                for symbol_list in self.symbols.values():
-                    symbol_list[:] = [s for s in symbol_list if s.file_path != file_path]
+                self._remove_file_symbols(file_path)
                 
                 # Package declaration
                 package_pattern = r'^package\s+(\w+)'
@@ -1291,7 +1634,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[package_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Function declarations (including receiver functions)
                 func_pattern = r'^\s*func\s+(?:\(\w+\s+\*?\w+\)\s+)?(\w+)\s*\('
@@ -1306,7 +1649,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[func_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Type declarations
                 type_pattern = r'^\s*type\s+(\w+)\s+(?:struct|interface|\w+)'
@@ -1321,7 +1664,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[type_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Struct declarations
                 struct_pattern = r'^\s*type\s+(\w+)\s+struct'
@@ -1336,7 +1679,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[struct_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Interface declarations
                 interface_pattern = r'^\s*type\s+(\w+)\s+interface'
@@ -1351,7 +1694,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[interface_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Const declarations
                 const_pattern = r'^\s*const\s+(\w+)'
@@ -1366,7 +1709,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[const_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Var declarations
                 var_pattern = r'^\s*var\s+(\w+)'
@@ -1381,7 +1724,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[var_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Method declarations (receiver functions)
                 method_pattern = r'^\s*func\s+\([^)]+\)\s+(\w+)\s*\('
@@ -1396,7 +1739,7 @@ class CodeIndexer:
                             line_number=i + 1,
                             definition=line.strip()
                         )
-                        self.symbols[method_name].append(symbol)
+                        self._add_symbol(symbol)
                 
                 # Import statements
                 import_pattern = r'^\s*import\s+(?:"([^"]+)"|`([^`]+)`|\w+\s+"([^"]+)")'
@@ -1415,57 +1758,62 @@ class CodeIndexer:
                                 line_number=i + 1,
                                 definition=line.strip()
                             )
-                            self.symbols[package_name].append(symbol)
+                            self._add_symbol(symbol)
                 
                 self.indexed_files.add(file_path)
+                self._record_stamp(file_path, st, digest)
                 
         except Exception as e:
             logger.warning(f"Failed to index Go file {file_path}: {e}")
     
-    def search_symbols(self, query: str, symbol_type: Optional[str] = None, fuzzy: bool = False, file_extensions: Optional[List[str]] = None) -> List[Symbol]:
-        """Search for symbols by name or pattern with enhanced matching options"""
+    def search_symbols(self, query: str, symbol_type: Optional[str] = None, fuzzy: bool = False, file_extensions: Optional[List[str]] = None, exact: bool = False) -> List[Symbol]:
+        """Search for symbols by name or pattern with enhanced matching options.
+        
+        With exact=True only case-insensitive whole-name matches are returned,
+        via a single lookup in the lowered-name index instead of a scan over
+        every indexed name; fuzzy is ignored in that mode.
+        """
         with self._index_lock:
             results = []
             query_lower = query.lower()
             
-            for name, symbol_list in self.symbols.items():
-                name_lower = name.lower()
-                match_found = False
-                match_type = None
-                
-                # Exact match (highest priority)
-                if query_lower == name_lower:
-                    match_found = True
-                    match_type = 'exact'
-                # Starts with query (high priority)
-                elif name_lower.startswith(query_lower):
-                    match_found = True
-                    match_type = 'prefix'
-                # Contains query (medium priority)
-                elif query_lower in name_lower:
-                    match_found = True
-                    match_type = 'contains'
-                # Fuzzy matching (lowest priority)
-                elif fuzzy and self._fuzzy_match(query_lower, name_lower):
-                    match_found = True
-                    match_type = 'fuzzy'
-                
-                if match_found:
-                    for symbol in symbol_list:
-                        # Filter by symbol type if specified
-                        if symbol_type is not None and symbol.type != symbol_type:
+            if exact:
+                names = self._names_by_lower.get(query_lower)
+                matches = [(names, 'exact')] if names else []
+            else:
+                matches = []
+                # Names are pre-lowered at index time, so each query only compares
+                for name_lower, names in self._names_by_lower.items():
+                    # Exact match (highest priority)
+                    if query_lower == name_lower:
+                        matches.append((names, 'exact'))
+                    # Starts with query (high priority)
+                    elif name_lower.startswith(query_lower):
+                        matches.append((names, 'prefix'))
+                    # Contains query (medium priority)
+                    elif query_lower in name_lower:
+                        matches.append((names, 'contains'))
+                    # Fuzzy matching (lowest priority)
+                    elif fuzzy and self._fuzzy_match(query_lower, name_lower):
+                        matches.append((names, 'fuzzy'))
+            
+            for names, match_type in matches:
+                symbol_list = [s for name in names for s in self.symbols[name]]
+                for symbol in symbol_list:
+                    # Filter by symbol type if specified
+                    if symbol_type is not None and symbol.type != symbol_type:
+                        continue
+                    
+                    # Filter by file extension if specified
+                    if file_extensions is not None:
+                        file_ext = Path(symbol.file_path).suffix.lower()
+                        if file_ext not in file_extensions:
                             continue
-                        
-                        # Filter by file extension if specified
-                        if file_extensions is not None:
-                            file_ext = Path(symbol.file_path).suffix.lower()
-                            if file_ext not in file_extensions:
-                                continue
-                        
-                        # Add match type for sorting
-                        symbol_with_match = symbol
-                        symbol_with_match.match_type = match_type
-                        results.append(symbol_with_match)
+                    
+                    # Add match type for sorting
+                    symbol_with_match = symbol
+                    symbol_with_match.match_type = match_type
+                    results.append(symbol_with_match)
             
             # Sort by relevance: exact matches first, then prefix, contains, fuzzy
             # Within each group, sort by file path and line number
@@ -1577,6 +1925,57 @@ class CodeIndexer:
         return 'reference'
 
 
+# Maps the alternate path separator onto the native one (Windows only)
+_SEP_TABLE = str.maketrans({os.altsep: os.sep}) if os.altsep else None
+
+# Directories the polling fallback never descends into
+_POLL_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+# Stat entries relative to an open directory fd where the platform allows it
+_SCANDIR_FD = os.scandir in os.supports_fd
+
+# Filesystems whose changes made by other hosts never reach inotify
+_NETWORK_FS_TYPES = frozenset({'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', '9p'})
+
+# Network mounts are polled much less often than a forced local poll
+_NETWORK_POLL_INTERVAL = 30
+
+_MOUNTINFO_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+
+@functools.lru_cache(maxsize=1)
+def _mount_table() -> Tuple[Tuple[str, str], ...]:
+    """(mountpoint, fstype) pairs from /proc/self/mountinfo, longest mountpoint first.
+    
+    Empty where mountinfo is unavailable (non-Linux), which makes every
+    directory count as local.
+    """
+    mounts = []
+    try:
+        with open('/proc/self/mountinfo', 'r') as f:
+            for line in f:
+                fields = line.split()
+                try:
+                    separator = fields.index('-')
+                except ValueError:
+                    continue
+                mountpoint = _MOUNTINFO_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), fields[4])
+                mounts.append((mountpoint, fields[separator + 1]))
+    except OSError:
+        return ()
+    mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+    return tuple(mounts)
+
+
+def _is_network_filesystem(path: str) -> bool:
+    """Check whether path lives on a network mount (longest-prefix mount match)"""
+    real_path = os.path.realpath(path)
+    for mountpoint, fstype in _mount_table():
+        if real_path == mountpoint or real_path.startswith(mountpoint.rstrip('/') + '/'):
+            return fstype in _NETWORK_FS_TYPES
+    return False
+
+
 @dataclass
 class FileChange:
     """Represents a file change event"""
@@ -1597,6 +1996,8 @@ class FileWatcher:
         
         # File monitoring
         self.observer = None
+        self.network_observer = None
+        self.watch_modes: Dict[str, str] = {}
         self.event_handler = None
         self.is_watching = False
         
@@ -1605,6 +2006,12 @@ class FileWatcher:
         self.recent_changes: List[FileChange] = []
         self.change_lock = threading.Lock()
         
+        # Changes fully processed but not yet handed out by wait_for_events
+        self._processed_changes: List[FileChange] = []
+        self._processed_cond = threading.Condition()
+        # Per-file futures resolved when the next change to that file is processed
+        self._reindex_futures: Dict[str, Future] = {}
+        
         # Debouncing
         self.debounce_timers: Dict[str, threading.Timer] = {}
         self.debounce_lock = threading.Lock()
@@ -1629,10 +2036,15 @@ class FileWatcher:
         # Supported file extensions
         self.supported_extensions = {'.py', '.js', '.ts', '.go'}
         
+        # Stat results gathered while listing a directory in polling mode,
+        # handed back to the snapshot walk so each entry is stat'ed once
+        self._poll_stat_cache: Dict[str, os.stat_result] = {}
+        
     def start_watching(self):
         """Start file monitoring"""
         try:
             from watchdog.observers import Observer
+            from watchdog.observers.polling import PollingObserverVFS
             from watchdog.events import FileSystemEventHandler
             
             if self.is_watching:
@@ -1644,22 +2056,47 @@ class FileWatcher:
             self.event_handler.on_modified = self._on_file_modified
             self.event_handler.on_created = self._on_file_created
             self.event_handler.on_deleted = self._on_file_deleted
+            self.event_handler.on_moved = self._on_file_moved
+            
+            # Native events (inotify/FSEvents/ReadDirectoryChangesW) unless polling
+            # is forced for network filesystems that do not deliver them
+            force_polling = getattr(self.config_manager.config, 'force_polling', False)
+            if force_polling:
+                self.observer = PollingObserverVFS(stat=self._poll_stat, listdir=self._poll_listdir)
+                logger.info("File watcher using polling observer (force_polling enabled)")
+            else:
+                self.observer = Observer()
+            self.network_observer = None
+            self.watch_modes = {}
             
-            # Create observer
-            self.observer = Observer()
+            # Pick up mounts added since the last start
+            _mount_table.cache_clear()
             
             # Add watchers for all configured directories
             watched_dirs = 0
             for dir_config in self.config_manager.config.watched_directories:
                 if dir_config.enabled:
                     try:
-                        self.observer.schedule(
+                        observer = self.observer
+                        mode = 'polling' if force_polling else 'native'
+                        if not force_polling and _is_network_filesystem(dir_config.path):
+                            # Network mounts get a slow poll; inotify would miss remote writes
+                            if self.network_observer is None:
+                                self.network_observer = PollingObserverVFS(
+                                    stat=self._poll_stat,
+                                    listdir=self._poll_listdir,
+                                    polling_interval=_NETWORK_POLL_INTERVAL
+                                )
+                            observer = self.network_observer
+                            mode = 'polling'
+                        observer.schedule(
                             self.event_handler, 
                             dir_config.path, 
                             recursive=True
                         )
+                        self.watch_modes[dir_config.path] = mode
                         watched_dirs += 1
-                        logger.info(f"Watching directory: {dir_config.path}")
+                        logger.info(f"Watching directory ({mode}): {dir_config.path}")
                     except Exception as e:
                         logger.error(f"Failed to watch directory {dir_config.path}: {e}")
             
@@ -1667,8 +2104,10 @@ class FileWatcher:
                 logger.warning("No directories configured for watching")
                 return False
             
-            # Start observer
+            # Start observers
             self.observer.start()
+            if self.network_observer:
+                self.network_observer.start()
             self.is_watching = True
             
             logger.info(f"File watcher started, monitoring {watched_dirs} directories")
@@ -1692,12 +2131,22 @@ class FileWatcher:
                 for timer in self.debounce_timers.values():
                     timer.cancel()
                 self.debounce_timers.clear()
-            
-            # Stop observer
-            if self.observer:
-                self.observer.stop()
-                self.observer.join(timeout=2)
-                self.observer = None
+            with self.change_lock:
+                self.pending_changes.clear()
+            with self._processed_cond:
+                futures = list(self._reindex_futures.values())
+                self._reindex_futures.clear()
+            for future in futures:
+                future.cancel()
+            
+            # Stop observers
+            for observer in (self.observer, self.network_observer):
+                if observer:
+                    observer.stop()
+                    observer.join(timeout=2)
+            self.observer = None
+            self.network_observer = None
+            self._poll_stat_cache.clear()
             
             self.is_watching = False
             logger.info("File watcher stopped")
@@ -1705,20 +2154,90 @@ class FileWatcher:
         except Exception as e:
             logger.error(f"Error stopping file watcher: {e}")
     
+    def _poll_listdir(self, path: str) -> Iterator[os.DirEntry]:
+        """Directory listing for the polling observer.
+        
+        Prunes directories that are never indexed and stats each entry while
+        the directory is open (via its fd where supported), so the snapshot
+        walk does not resolve every full path again.
+        """
+        if _SCANDIR_FD:
+            flags = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+            dir_fd = os.open(path, flags)
+            try:
+                with os.scandir(dir_fd) as it:
+                    entries = self._collect_poll_entries(path, it)
+            finally:
+                os.close(dir_fd)
+        else:
+            with os.scandir(path) as it:
+                entries = self._collect_poll_entries(path, it)
+        return iter(entries)
+    
+    def _collect_poll_entries(self, path: str, it) -> List[os.DirEntry]:
+        """Filter scandir entries and cache their stat results"""
+        entries = []
+        stat_cache = self._poll_stat_cache
+        for entry in it:
+            if entry.name in _POLL_SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                stat_cache[os.path.join(path, entry.name)] = entry.stat()
+            except OSError:
+                continue
+            entries.append(entry)
+        return entries
+    
+    def _poll_stat(self, path: str) -> os.stat_result:
+        """stat() for the polling observer, served from the listing cache"""
+        st = self._poll_stat_cache.pop(path, None)
+        return st if st is not None else os.stat(path)
+    
     def _on_file_modified(self, event):
         """Handle file modification events"""
-        if not event.is_directory and self._is_supported_file(event.src_path):
-            self._queue_file_change(event.src_path, 'modified')
+        if event.is_directory:
+            return
+        file_path = self._normalize_path(event.src_path)
+        _invalidate_git_cache(os.path.dirname(file_path))
+        if self._is_supported_file(file_path):
+            self._queue_file_change(file_path, 'modified')
     
     def _on_file_created(self, event):
         """Handle file creation events"""
-        if not event.is_directory and self._is_supported_file(event.src_path):
-            self._queue_file_change(event.src_path, 'added')
+        if event.is_directory:
+            return
+        file_path = self._normalize_path(event.src_path)
+        _invalidate_git_cache(os.path.dirname(file_path))
+        if self._is_supported_file(file_path):
+            self._queue_file_change(file_path, 'added')
     
     def _on_file_deleted(self, event):
         """Handle file deletion events"""
-        if not event.is_directory and self._is_supported_file(event.src_path):
-            self._queue_file_change(event.src_path, 'deleted')
+        if event.is_directory:
+            return
+        file_path = self._normalize_path(event.src_path)
+        _invalidate_git_cache(os.path.dirname(file_path))
+        if self._is_supported_file(file_path):
+            self._queue_file_change(file_path, 'deleted')
+    
+    def _on_file_moved(self, event):
+        """Handle renames, including editors that save via write-then-rename"""
+        if event.is_directory:
+            return
+        src_path = self._normalize_path(event.src_path)
+        dest_path = self._normalize_path(event.dest_path)
+        _invalidate_git_cache(os.path.dirname(src_path))
+        _invalidate_git_cache(os.path.dirname(dest_path))
+        if self._is_supported_file(src_path):
+            self._queue_file_change(src_path, 'deleted')
+        if self._is_supported_file(dest_path):
+            self._queue_file_change(dest_path, 'added')
+    
+    def _normalize_path(self, file_path: str) -> str:
+        """Normalize path separators in a single translate pass"""
+        if _SEP_TABLE is None:
+            return file_path
+        return file_path.translate(_SEP_TABLE)
     
     def _is_supported_file(self, file_path: str) -> bool:
         """Check if file should be monitored"""
@@ -1739,39 +2258,31 @@ class FileWatcher:
             logger.debug(f"Error checking file support for {file_path}: {e}")
             return False
     
+    @staticmethod
+    def _merge_change_types(previous: str, current: str) -> str:
+        """Collapse two events for the same file within one debounce window"""
+        if current == 'deleted':
+            return 'deleted'
+        if previous == 'deleted':
+            return 'modified'  # Deleted and recreated: the file was replaced
+        if previous == 'added':
+            return 'added'  # Writes right after creation are part of the create
+        return current
+    
     def _queue_file_change(self, file_path: str, change_type: str):
-        """Queue a file change for debounced processing"""
+        """Coalesce a file event into the pending change and restart its debounce timer"""
         try:
-            # Get file info
-            file_size = None
-            file_hash = None
-            
-            if change_type != 'deleted' and os.path.exists(file_path):
-                try:
-                    stat_info = os.stat(file_path)
-                    file_size = stat_info.st_size
-                    
-                    # Calculate hash for smart re-indexing
-                    if change_type in ['modified', 'added']:
-                        file_hash = self._calculate_file_hash(file_path)
-                except Exception as e:
-                    logger.debug(f"Error getting file info for {file_path}: {e}")
-            
-            # Create change record
-            change = FileChange(
-                file_path=file_path,
-                change_type=change_type,
-                timestamp=time.time(),
-                file_size=file_size,
-                file_hash=file_hash
-            )
-            
-            # Add to recent changes
+            # Merge with any pending event for this file so a burst such as
+            # created+modified+modified yields a single change record
             with self.change_lock:
-                self.recent_changes.append(change)
-                # Keep only last 1000 changes
-                if len(self.recent_changes) > 1000:
-                    self.recent_changes = self.recent_changes[-1000:]
+                pending = self.pending_changes.get(file_path)
+                if pending is not None:
+                    change_type = self._merge_change_types(pending.change_type, change_type)
+                self.pending_changes[file_path] = FileChange(
+                    file_path=file_path,
+                    change_type=change_type,
+                    timestamp=time.time()
+                )
             
             # Cancel existing timer for this file
             with self.debounce_lock:
@@ -1781,8 +2292,8 @@ class FileWatcher:
                 # Set new timer
                 timer = threading.Timer(
                     self.debounce_delay,
-                    self._process_file_change,
-                    args=(change,)
+                    self._flush_pending_change,
+                    args=(file_path,)
                 )
                 self.debounce_timers[file_path] = timer
                 timer.start()
@@ -1792,14 +2303,81 @@ class FileWatcher:
         except Exception as e:
             logger.error(f"Error queuing file change for {file_path}: {e}")
     
-    def _process_file_change(self, change: FileChange):
-        """Process a file change after debounce delay"""
+    def _flush_pending_change(self, file_path: str):
+        """Record and process the coalesced change once the debounce window closes"""
         try:
-            # Remove from pending timers
+            # Drop our own timer entry; a newer event may already have replaced it
             with self.debounce_lock:
-                if change.file_path in self.debounce_timers:
-                    del self.debounce_timers[change.file_path]
+                if self.debounce_timers.get(file_path) is threading.current_thread():
+                    del self.debounce_timers[file_path]
+            
+            with self.change_lock:
+                change = self.pending_changes.pop(file_path, None)
+            if change is None:
+                return
             
+            # Stat and hash once per burst rather than once per event
+            if change.change_type != 'deleted' and os.path.exists(file_path):
+                try:
+                    change.file_size = os.stat(file_path).st_size
+                    change.file_hash = self._calculate_file_hash(file_path)
+                except Exception as e:
+                    logger.debug(f"Error getting file info for {file_path}: {e}")
+            
+            # Add to recent changes
+            with self.change_lock:
+                self.recent_changes.append(change)
+                # Keep only last 1000 changes
+                if len(self.recent_changes) > 1000:
+                    self.recent_changes = self.recent_changes[-1000:]
+            
+            self._process_file_change(change)
+            
+            with self._processed_cond:
+                self._processed_changes.append(change)
+                del self._processed_changes[:-1000]
+                self._processed_cond.notify_all()
+                future = self._reindex_futures.pop(file_path, None)
+            if future is not None:
+                future.set_result(change)
+            
+        except Exception as e:
+            logger.error(f"Error flushing file change for {file_path}: {e}")
+    
+    def reindex_future(self, file_path: str) -> Future:
+        """Get a future resolved with the FileChange once file_path's next change is processed.
+        
+        Callers asking for the same file share one future. Futures still
+        pending when the watcher stops are cancelled.
+        """
+        file_path = os.path.abspath(self._normalize_path(file_path))
+        with self._processed_cond:
+            future = self._reindex_futures.get(file_path)
+            if future is None:
+                future = self._reindex_futures[file_path] = Future()
+        return future
+    
+    def wait_for_events(self, count: int = 1, timeout: float = 5.0) -> List[FileChange]:
+        """Block until count changes have been processed, or timeout expires.
+        
+        Each change is returned by exactly one call, so successive waits see
+        only changes processed since the previous one.
+        
+        Args:
+            count: Number of processed changes to wait for
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            The processed changes (fewer than count if the timeout expired)
+        """
+        with self._processed_cond:
+            self._processed_cond.wait_for(lambda: len(self._processed_changes) >= count, timeout)
+            changes, self._processed_changes = self._processed_changes, []
+        return changes
+    
+    def _process_file_change(self, change: FileChange):
+        """Process a file change after debounce delay"""
+        try:
             # Process the change
             if change.change_type == 'deleted':
                 self._handle_file_deletion(change)
@@ -1818,33 +2396,7 @@ class FileWatcher:
         try:
             # Remove from indexer
             if change.file_path in self.code_indexer.indexed_files:
-                with self.code_indexer._index_lock:
-                    # Remove symbols for this file
-                    symbols_to_remove = []
-                    for symbol_name, symbols in self.code_indexer.symbols.items():
-                        symbols_to_remove.extend([
-                            s for s in symbols if s.file_path == change.file_path
-                        ])
-                    
-                    for symbol in symbols_to_remove:
-                        self.code_indexer.symbols[symbol_name].remove(symbol)
-                        if not self.code_indexer.symbols[symbol_name]:
-                            del self.code_indexer.symbols[symbol_name]
-                    
-                    # Remove references for this file
-                    refs_to_remove = []
-                    for ref_name, refs in self.code_indexer.references.items():
-                        refs_to_remove.extend([
-                            r for r in refs if r.file_path == change.file_path
-                        ])
-                    
-                    for ref in refs_to_remove:
-                        self.code_indexer.references[ref_name].remove(ref)
-                        if not self.code_indexer.references[ref_name]:
-                            del self.code_indexer.references[ref_name]
-                    
-                    # Remove from indexed files
-                    self.code_indexer.indexed_files.discard(change.file_path)
+                self.code_indexer.remove_file(change.file_path)
             
             # Remove from file hashes
             with self.hash_lock:
@@ -1997,6 +2549,7 @@ class FileWatcher:
             
             # Add status
             stats['is_watching'] = self.is_watching
+            stats['watch_modes'] = dict(self.watch_modes)
             stats['watched_directories'] = len([
                 d for d in self.config_manager.config.watched_directories 
                 if d.enabled
@@ -2261,6 +2814,16 @@ def register_tools():
         """
         return _get_commit_history_sync(directory, limit, file_path, author, since, until)
     
+    @mcp.tool()
+    def get_git_snapshot(directory: str = ".", limit: int = 20) -> Dict[str, Any]:
+        """Get git status, current branch and recent commits in a single call.
+        
+        Args:
+            directory: The directory path of the repository (defaults to current directory)
+            limit: Maximum number of commits to include (default: 20)
+        """
+        return _get_git_snapshot_sync(directory, limit)
+    
     @mcp.tool()
     def get_file_blame(directory: str = ".", file_path: str = "", start_line: Optional[int] = None, end_line: Optional[int] = None) -> Dict[str, Any]:
         """Get git blame information for a specific file.
@@ -2377,7 +2940,7 @@ def register_tools():
     # Enhanced Feature 1: Code Navigation
     @mcp.tool()
     @performance_timer("search_symbols")
-    def search_symbols(query: str, directory: str = ".", symbol_type: Optional[str] = None, auto_index: bool = True, fuzzy: bool = False, file_extensions: Optional[List[str]] = None) -> Dict[str, Any]:
+    def search_symbols(query: str, directory: str = ".", symbol_type: Optional[str] = None, auto_index: bool = True, fuzzy: bool = False, file_extensions: Optional[List[str]] = None, exact: bool = False) -> Dict[str, Any]:
         """Search for code symbols (functions, classes, variables) across the codebase.
         
         Args:
@@ -2387,13 +2950,14 @@ def register_tools():
             auto_index: Whether to automatically index files if not already indexed
             fuzzy: Enable fuzzy matching for partial string matches (default: False)
             file_extensions: List of file extensions to search in: ['.py', '.js', '.ts', '.go'] (optional)
+            exact: Only return symbols whose name equals the query, ignoring case (default: False)
         """
         # Input validation
         performance_monitor.validate_input("directory_path", directory)
         performance_monitor.validate_input("regex_pattern", query)
         
         # Check cache first
-        cache_key = f"search_symbols:{query}:{directory}:{symbol_type}:{fuzzy}:{file_extensions}"
+        cache_key = f"search_symbols:{query}:{directory}:{symbol_type}:{fuzzy}:{file_extensions}:{exact}"
         cached_result = performance_monitor.symbol_cache.get(cache_key)
         if cached_result is not None:
             return cached_result
@@ -2417,42 +2981,12 @@ def register_tools():
             
             # Auto-index files if requested
             if auto_index:
-                indexed_count = 0
-                
-                # Index Python files
-                for file_path in path.rglob('*.py'):
-                    if file_path.is_file() and str(file_path) not in code_indexer.indexed_files:
-                        if config_manager and not config_manager.is_path_allowed(str(file_path)):
-                            continue
-                        code_indexer.index_python_file(str(file_path))
-                        indexed_count += 1
-                
-                # Index JavaScript files
-                for file_path in path.rglob('*.js'):
-                    if file_path.is_file() and str(file_path) not in code_indexer.indexed_files:
-                        if config_manager and not config_manager.is_path_allowed(str(file_path)):
-                            continue
-                        code_indexer.index_javascript_file(str(file_path))
-                        indexed_count += 1
-                        
-                # Index TypeScript files
-                for file_path in path.rglob('*.ts'):
-                    if file_path.is_file() and str(file_path) not in code_indexer.indexed_files:
-                        if config_manager and not config_manager.is_path_allowed(str(file_path)):
-                            continue
-                        code_indexer.index_typescript_file(str(file_path))
-                        indexed_count += 1
-                
-                # Index Go files
-                for file_path in path.rglob('*.go'):
-                    if file_path.is_file() and str(file_path) not in code_indexer.indexed_files:
-                        if config_manager and not config_manager.is_path_allowed(str(file_path)):
-                            continue
-                        code_indexer.index_go_file(str(file_path))
-                        indexed_count += 1
+                # One tree walk for all languages; Python files parse as a parallel batch
+                path_filter = config_manager.is_path_allowed if config_manager else None
+                code_indexer.index_directory(str(path), path_filter)
             
             # Search symbols
-            symbols = code_indexer.search_symbols(query, symbol_type, fuzzy, file_extensions)
+            symbols = code_indexer.search_symbols(query, symbol_type, fuzzy, file_extensions, exact)
             
             # Apply resource limits
             if len(symbols) > performance_monitor.max_search_results:
@@ -3898,6 +4432,226 @@ def _read_file_sync(file_path: str, max_lines: Optional[int] = None) -> Dict[str
         }
 
 
+def _git_head_sha(git_dir: Path) -> str:
+    """Resolve HEAD to a commit sha by reading refs directly (no git process)"""
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD
+    
+    ref_name = head[5:]
+    ref_file = git_dir / ref_name
+    if ref_file.is_file():
+        return ref_file.read_text().strip()
+    
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(" " + ref_name):
+                return line.split(" ", 1)[0]
+    
+    return ref_name  # Unborn branch
+
+
+def _git_cache_key(operation: str, path: Path, *extra: Any) -> Optional[str]:
+    """Build a git cache key from the repo's HEAD sha and index mtime.
+    
+    Any commit, checkout or staging change produces a new key. Unstaged
+    edits and new untracked files do not: entries for those stay cached
+    until the FileWatcher sees a change in the working tree (any file type,
+    see _invalidate_git_cache) or the git cache TTL expires, so status can
+    lag the working tree by up to five minutes when monitoring is off.
+    Returns None when the state cannot be read, in which case the caller
+    should skip caching.
+    """
+    try:
+        git_dir = path / ".git"
+        head_sha = _git_head_sha(git_dir)
+        index_file = git_dir / "index"
+        index_mtime = index_file.stat().st_mtime_ns if index_file.exists() else 0
+    except OSError:
+        return None
+    # NUL cannot appear in paths, so it safely separates the key fields
+    return "\0".join([operation, str(path), head_sha, str(index_mtime), *map(str, extra)])
+
+
+def _git_commit_stats(path: Path, shas: List[str]) -> Dict[str, Dict[str, int]]:
+    """Get files changed/insertions/deletions for many commits from one git show.
+    
+    Returns a dict keyed by full sha; commits missing from it (or all of them
+    if git fails) should fall back to the caller's default statistics.
+    """
+    if not shas:
+        return {}
+    try:
+        result = subprocess.run(
+            ["git", "show", "--shortstat", "--format=%x1e%H", *shas],
+            cwd=str(path),
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug(f"git show --shortstat failed for {path}: {e}")
+        return {}
+    if result.returncode != 0:
+        return {}
+    
+    stats = {}
+    for record in result.stdout.split('\x1e')[1:]:
+        sha, _, stat_text = record.partition('\n')
+        files_match = re.search(r'(\d+) file', stat_text)
+        ins_match = re.search(r'(\d+) insertion', stat_text)
+        del_match = re.search(r'(\d+) deletion', stat_text)
+        stats[sha.strip()] = {
+            "files_changed": int(files_match.group(1)) if files_match else 0,
+            "insertions": int(ins_match.group(1)) if ins_match else 0,
+            "deletions": int(del_match.group(1)) if del_match else 0
+        }
+    return stats
+
+
+def _invalidate_git_cache(directory: str) -> int:
+    """Drop cached git results for any repository containing or inside directory"""
+    directory = os.path.abspath(directory)
+    
+    def is_related(key: str) -> bool:
+        parts = key.split("\0")
+        if len(parts) < 2:
+            return False
+        repo_path = parts[1]
+        return (directory == repo_path
+                or directory.startswith(repo_path + os.sep)
+                or repo_path.startswith(directory + os.sep))
+    
+    return performance_monitor.git_cache.invalidate(is_related)
+
+
+def _open_pygit2_repo(path: Path):
+    """Open a repository with pygit2, or return None to fall back to the git CLI"""
+    if pygit2 is None:
+        return None
+    try:
+        return pygit2.Repository(str(path))
+    except Exception as e:
+        logger.debug(f"pygit2 could not open {path}, using git CLI: {e}")
+        return None
+
+
+def _pygit2_current_branch(repo) -> str:
+    """Return the checked-out branch name, matching `git branch --show-current`"""
+    head_target = repo.lookup_reference("HEAD").target
+    if isinstance(head_target, str) and head_target.startswith("refs/heads/"):
+        return head_target[len("refs/heads/"):]
+    return ""
+
+
+def _pygit2_git_status(repo) -> Dict[str, List[str]]:
+    """Classify working tree status the same way as the porcelain parser"""
+    modified_files = []
+    added_files = []
+    deleted_files = []
+    untracked_files = []
+    
+    for filename, flags in repo.status(untracked_files="normal").items():
+        if flags & (pygit2.GIT_STATUS_INDEX_MODIFIED | pygit2.GIT_STATUS_WT_MODIFIED):
+            modified_files.append(filename)
+        elif flags & pygit2.GIT_STATUS_INDEX_NEW:
+            added_files.append(filename)
+        elif flags & (pygit2.GIT_STATUS_INDEX_DELETED | pygit2.GIT_STATUS_WT_DELETED):
+            deleted_files.append(filename)
+        elif flags & pygit2.GIT_STATUS_WT_NEW:
+            untracked_files.append(filename)
+    
+    return {
+        "modified_files": sorted(modified_files),
+        "added_files": sorted(added_files),
+        "deleted_files": sorted(deleted_files),
+        "untracked_files": sorted(untracked_files)
+    }
+
+
+def _pygit2_git_diff(repo, path: Path, file_path: Optional[str], staged: bool, unstaged: bool) -> str:
+    """Produce `git diff` / `git diff --cached` output in-process"""
+    if staged and not unstaged:
+        diff = repo.diff("HEAD", cached=True)
+    else:
+        diff = repo.diff()
+    
+    if not file_path:
+        return diff.patch or ""
+    
+    # Emulate the git pathspec: match the file itself or anything beneath it
+    rel_path = os.path.relpath(file_path, str(path)) if os.path.isabs(file_path) else file_path
+    rel_path = Path(rel_path).as_posix().rstrip("/")
+    patches = []
+    for patch in diff:
+        delta_path = patch.delta.new_file.path
+        if delta_path == rel_path or delta_path.startswith(rel_path + "/"):
+            patches.append(patch.text)
+    return "".join(patches)
+
+
+def _pygit2_decorations(repo) -> Dict[Any, List[str]]:
+    """Map commit ids to ref labels, in the style of `git log --pretty=%D`"""
+    decorations: Dict[Any, List[str]] = defaultdict(list)
+    head_name = None if repo.head_is_detached else repo.lookup_reference("HEAD").target
+    
+    for ref_name in repo.references:
+        try:
+            target = repo.references[ref_name].peel(pygit2.Commit).id
+        except Exception:
+            continue
+        shorthand = repo.references[ref_name].shorthand
+        if ref_name == head_name:
+            decorations[target].insert(0, f"HEAD -> {shorthand}")
+        elif ref_name.startswith("refs/tags/"):
+            decorations[target].append(f"tag: {shorthand}")
+        else:
+            decorations[target].append(shorthand)
+    
+    if repo.head_is_detached:
+        decorations[repo.head.target].insert(0, "HEAD")
+    return decorations
+
+
+def _pygit2_commit_history(repo, limit: int) -> List[Dict[str, Any]]:
+    """Walk history from HEAD, matching the fields of the git log parser"""
+    decorations = _pygit2_decorations(repo)
+    commits = []
+    
+    for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+        if len(commits) >= limit:
+            break
+        
+        author = commit.author
+        authored = datetime.fromtimestamp(author.time, timezone(timedelta(minutes=author.offset)))
+        full_sha = str(commit.id)
+        
+        # Diffstat against the first parent, as `git show --stat` reports it
+        if commit.parents:
+            diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+        else:
+            diff = commit.tree.diff_to_tree(swap=True)
+        stats = diff.stats
+        
+        commits.append({
+            "sha": full_sha[:8],  # Short SHA
+            "full_sha": full_sha,
+            "author_name": author.name,
+            "author_email": author.email,
+            "date": f"{authored:%a %b} {authored.day} {authored:%H:%M:%S %Y %z}",
+            "message": " ".join(commit.message.strip().split("\n\n", 1)[0].splitlines()),
+            "branches": ", ".join(decorations.get(commit.id, [])),
+            "statistics": {
+                "files_changed": stats.files_changed,
+                "insertions": stats.insertions,
+                "deletions": stats.deletions
+            }
+        })
+    
+    return commits
+
+
 @performance_timer("get_git_status")
 def _get_git_status_sync(directory: str = ".") -> Dict[str, Any]:
     """
@@ -3913,11 +4667,6 @@ def _get_git_status_sync(directory: str = ".") -> Dict[str, Any]:
     # Input validation
     performance_monitor.validate_input("directory_path", directory)
     
-    # Check cache first
-    cache_key = f"git_status:{directory}"
-    cached_result = performance_monitor.git_cache.get(cache_key)
-    if cached_result is not None:
-        return cached_result
     try:
         # Convert to Path object for cross-platform compatibility
         path = Path(directory).resolve()
@@ -3947,6 +4696,31 @@ def _get_git_status_sync(directory: str = ".") -> Dict[str, Any]:
                 "message": "Not a git repository"
             }
         
+        # Check cache (keyed on HEAD and index state)
+        cache_key = _git_cache_key("git_status", path)
+        if cache_key is not None:
+            cached_result = performance_monitor.git_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+        
+        repo = _open_pygit2_repo(path)
+        if repo is not None:
+            try:
+                status = _pygit2_git_status(repo)
+                result = {
+                    "success": True,
+                    "is_git_repo": True,
+                    "directory": str(path),
+                    "current_branch": _pygit2_current_branch(repo),
+                    **status,
+                    "total_changes": sum(len(files) for files in status.values())
+                }
+                if cache_key is not None:
+                    performance_monitor.git_cache.put(cache_key, result)
+                return result
+            except Exception as e:
+                logger.debug(f"pygit2 status failed for {path}, using git CLI: {e}")
+        
         # Run git status command
         try:
             result = subprocess.run(
@@ -4010,7 +4784,8 @@ def _get_git_status_sync(directory: str = ".") -> Dict[str, Any]:
             }
             
             # Cache the result
-            performance_monitor.git_cache.put(cache_key, result)
+            if cache_key is not None:
+                performance_monitor.git_cache.put(cache_key, result)
             return result
             
         except subprocess.TimeoutExpired:
@@ -4116,6 +4891,27 @@ def _get_git_diff_sync(directory: str = ".", file_path: Optional[str] = None, st
                 "is_git_repo": True
             }
         
+        # Per-file diffs can be cached: key on the file's mtime as well as repo state
+        cache_key = None
+        if file_path:
+            try:
+                file_mtime = (path / file_path).stat().st_mtime_ns
+                cache_key = _git_cache_key("git_diff", path, file_path, staged, unstaged, file_mtime)
+            except OSError:
+                cache_key = None
+        if cache_key is not None:
+            cached_result = performance_monitor.git_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+        
+        diff_content = None
+        repo = _open_pygit2_repo(path)
+        if repo is not None:
+            try:
+                diff_content = _pygit2_git_diff(repo, path, file_path, staged, unstaged)
+            except Exception as e:
+                logger.debug(f"pygit2 diff failed for {path}, using git CLI: {e}")
+        
         # Build git diff command
         cmd = ["git", "diff"]
         
@@ -4130,25 +4926,27 @@ def _get_git_diff_sync(directory: str = ".", file_path: Optional[str] = None, st
         
         # Run git diff command
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=str(path),
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                return {
-                    "success": False,
-                    "error": f"Git diff command failed: {result.stderr}",
-                    "is_git_repo": True
-                }
+            if diff_content is None:
+                result = subprocess.run(
+                    cmd,
+                    cwd=str(path),
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=30
+                )
+                
+                if result.returncode != 0:
+                    return {
+                        "success": False,
+                        "error": f"Git diff command failed: {result.stderr}",
+                        "is_git_repo": True
+                    }
+                
+                diff_content = result.stdout
             
             # Parse diff output
-            diff_content = result.stdout
             diff_lines = diff_content.split('\n') if diff_content else []
             
             # Extract statistics
@@ -4175,7 +4973,7 @@ def _get_git_diff_sync(directory: str = ".", file_path: Optional[str] = None, st
                 elif line.startswith('-') and not line.startswith('---'):
                     stats["deletions"] += 1
             
-            return {
+            result = {
                 "success": True,
                 "is_git_repo": True,
                 "directory": str(path),
@@ -4188,6 +4986,10 @@ def _get_git_diff_sync(directory: str = ".", file_path: Optional[str] = None, st
                 "has_changes": len(diff_content.strip()) > 0
             }
             
+            if cache_key is not None:
+                performance_monitor.git_cache.put(cache_key, result)
+            return result
+            
         except subprocess.TimeoutExpired:
             return {
                 "success": False,
@@ -4268,8 +5070,41 @@ def _get_commit_history_sync(directory: str = ".", limit: int = 10, file_path: O
                 "is_git_repo": True
             }
         
+        # History only changes when HEAD moves, so the state key is exact
+        cache_key = _git_cache_key("commit_history", path, limit, file_path, author, since, until)
+        if cache_key is not None:
+            cached_result = performance_monitor.git_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+        
+        # Unfiltered history can be walked in-process; filters keep git log semantics
+        repo = None if (file_path or author or since or until) else _open_pygit2_repo(path)
+        if repo is not None and not repo.head_is_unborn:
+            try:
+                commits = _pygit2_commit_history(repo, limit)
+                result = {
+                    "success": True,
+                    "is_git_repo": True,
+                    "directory": str(path),
+                    "commits": commits,
+                    "total_commits": len(commits),
+                    "filters": {
+                        "limit": limit,
+                        "file_path": file_path,
+                        "author": author,
+                        "since": since,
+                        "until": until
+                    }
+                }
+                if cache_key is not None:
+                    performance_monitor.git_cache.put(cache_key, result)
+                return result
+            except Exception as e:
+                logger.debug(f"pygit2 log failed for {path}, using git CLI: {e}")
+        
         # Build git log command
-        cmd = ["git", "log", f"--max-count={limit}", "--pretty=format:%H|%an|%ae|%ad|%s|%D"]
+        # Unit/record separators cannot occur in names or subjects, unlike '|'
+        cmd = ["git", "log", f"--max-count={limit}", "--pretty=format:%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%D%x1e"]
         
         if file_path:
             cmd.extend(["--", file_path])
@@ -4297,80 +5132,31 @@ def _get_commit_history_sync(directory: str = ".", limit: int = 10, file_path: O
                     "is_git_repo": True
                 }
             
-            # Parse commit history
+            # Parse commit history: one \x1e-terminated record per commit
             commits = []
-            commit_lines = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            for line in commit_lines:
-                if '|' in line:
-                    parts = line.split('|', 5)
-                    if len(parts) >= 5:
-                        commit = {
-                            "sha": parts[0][:8],  # Short SHA
-                            "full_sha": parts[0],
-                            "author_name": parts[1],
-                            "author_email": parts[2],
-                            "date": parts[3],
-                            "message": parts[4],
-                            "branches": parts[5] if len(parts) > 5 else ""
-                        }
-                        commits.append(commit)
+            for record in result.stdout.split('\x1e'):
+                parts = record.lstrip('\n').split('\x1f')
+                if len(parts) >= 5:
+                    commits.append({
+                        "sha": parts[0][:8],  # Short SHA
+                        "full_sha": parts[0],
+                        "author_name": parts[1],
+                        "author_email": parts[2],
+                        "date": parts[3],
+                        "message": parts[4],
+                        "branches": parts[5] if len(parts) > 5 else ""
+                    })
             
-            # Get additional statistics for each commit
+            # One git process for every commit's statistics instead of one per commit
+            commit_stats = _git_commit_stats(path, [commit["full_sha"] for commit in commits])
             for commit in commits:
-                try:
-                    stats_cmd = ["git", "show", "--stat", "--format=", commit["full_sha"]]
-                    stats_result = subprocess.run(
-                        stats_cmd,
-                        cwd=str(path),
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if stats_result.returncode == 0:
-                        # Parse statistics
-                        stats_lines = stats_result.stdout.strip().split('\n')
-                        files_changed = 0
-                        insertions = 0
-                        deletions = 0
-                        
-                        for stat_line in stats_lines:
-                            if 'file' in stat_line and 'changed' in stat_line:
-                                # Extract files changed count
-                                match = re.search(r'(\d+) file', stat_line)
-                                if match:
-                                    files_changed = int(match.group(1))
-                                
-                                # Extract insertions and deletions
-                                ins_match = re.search(r'(\d+) insertion', stat_line)
-                                if ins_match:
-                                    insertions = int(ins_match.group(1))
-                                
-                                del_match = re.search(r'(\d+) deletion', stat_line)
-                                if del_match:
-                                    deletions = int(del_match.group(1))
-                        
-                        commit["statistics"] = {
-                            "files_changed": files_changed,
-                            "insertions": insertions,
-                            "deletions": deletions
-                        }
-                    else:
-                        commit["statistics"] = {
-                            "files_changed": 0,
-                            "insertions": 0,
-                            "deletions": 0
-                        }
-                        
-                except Exception:
-                    commit["statistics"] = {
-                        "files_changed": 0,
-                        "insertions": 0,
-                        "deletions": 0
-                    }
+                commit["statistics"] = commit_stats.get(commit["full_sha"], {
+                    "files_changed": 0,
+                    "insertions": 0,
+                    "deletions": 0
+                })
             
-            return {
+            result = {
                 "success": True,
                 "is_git_repo": True,
                 "directory": str(path),
@@ -4385,6 +5171,10 @@ def _get_commit_history_sync(directory: str = ".", limit: int = 10, file_path: O
                 }
             }
             
+            if cache_key is not None:
+                performance_monitor.git_cache.put(cache_key, result)
+            return result
+            
         except subprocess.TimeoutExpired:
             return {
                 "success": False,
@@ -4413,6 +5203,182 @@ def _get_commit_history_sync(directory: str = ".", limit: int = 10, file_path: O
         }
 
 
+def _parse_porcelain_v2(output: str) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Single-pass parse of `git status --porcelain=v2 -z -b` output"""
+    headers: Dict[str, str] = {}
+    files: Dict[str, List[str]] = {
+        "modified_files": [],
+        "added_files": [],
+        "deleted_files": [],
+        "untracked_files": []
+    }
+    
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        kind = entry[0]
+        
+        if kind == "#":
+            key, _, value = entry[2:].partition(" ")
+            headers[key] = value
+        elif kind == "?":
+            files["untracked_files"].append(entry[2:])
+        elif kind in "12u":
+            # Ordinary, renamed (followed by the original path) and unmerged entries
+            field_count = {"1": 8, "2": 9, "u": 10}[kind]
+            fields = entry.split(" ", field_count)
+            status, filename = fields[1], fields[-1]
+            if kind == "2":
+                next(entries, None)
+            
+            if "M" in status:
+                files["modified_files"].append(filename)
+            elif "A" in status:
+                files["added_files"].append(filename)
+            elif "D" in status:
+                files["deleted_files"].append(filename)
+    
+    return headers, files
+
+
+def _get_git_snapshot_sync(directory: str = ".", limit: int = 20) -> Dict[str, Any]:
+    """
+    Collect git status, current branch and recent commits in one pass.
+    
+    Uses pygit2 when available, otherwise one porcelain status call (which
+    also reports the branch) and one git log call. The status part is
+    also stored in the git cache so a following get_git_status is a hit.
+    
+    Args:
+        directory: The directory path of the repository (defaults to current directory)
+        limit: Maximum number of commits to include (default: 20)
+        
+    Returns:
+        Dictionary containing status, branch and commit summary information
+    """
+    # Input validation
+    performance_monitor.validate_input("directory_path", directory)
+    
+    try:
+        # Convert to Path object for cross-platform compatibility
+        path = Path(directory).resolve()
+        
+        # Check if it's a git repository
+        git_dir = path / ".git"
+        if not git_dir.exists():
+            return {
+                "success": True,
+                "is_git_repo": False,
+                "message": "Not a git repository"
+            }
+        
+        cache_key = _git_cache_key("git_snapshot", path, limit)
+        if cache_key is not None:
+            cached_result = performance_monitor.git_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+        
+        commits = []
+        status = None
+        repo = _open_pygit2_repo(path)
+        if repo is not None:
+            try:
+                status = _pygit2_git_status(repo)
+                current_branch = _pygit2_current_branch(repo)
+                if not repo.head_is_unborn:
+                    for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+                        if len(commits) >= limit:
+                            break
+                        commits.append({
+                            "hash": str(commit.id),
+                            "author": commit.author.name,
+                            "message": " ".join(commit.message.strip().split("\n\n", 1)[0].splitlines())
+                        })
+            except Exception as e:
+                logger.debug(f"pygit2 snapshot failed for {path}, using git CLI: {e}")
+                status = None
+                commits = []
+        
+        if status is None:
+            try:
+                status_proc = subprocess.run(
+                    ["git", "-c", "color.ui=never", "status", "--porcelain=v2", "-z", "-b"],
+                    cwd=str(path), capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=30
+                )
+                if status_proc.returncode != 0:
+                    return {
+                        "success": False,
+                        "error": f"Git command failed: {status_proc.stderr}",
+                        "is_git_repo": True
+                    }
+                log_proc = subprocess.run(
+                    ["git", "log", "--pretty=format:%H%x1f%an%x1f%s%x1e", "-n", str(limit)],
+                    cwd=str(path), capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=30
+                )
+            except subprocess.TimeoutExpired:
+                return {
+                    "success": False,
+                    "error": "Git command timed out",
+                    "is_git_repo": True
+                }
+            except FileNotFoundError:
+                return {
+                    "success": False,
+                    "error": "Git command not found. Please ensure git is installed and in PATH.",
+                    "is_git_repo": True
+                }
+            
+            headers, status = _parse_porcelain_v2(status_proc.stdout)
+            branch_head = headers.get("branch.head", "")
+            current_branch = "" if branch_head == "(detached)" else branch_head
+            
+            # The status is still valid when `git log` fails (e.g. no commits yet)
+            if log_proc.returncode != 0:
+                logger.debug(f"git log failed for {path}, returning no commits: {log_proc.stderr}")
+            else:
+                for record in log_proc.stdout.split("\x1e"):
+                    record = record.strip("\n")
+                    if record:
+                        commit_hash, author_name, subject = record.split("\x1f", 2)
+                        commits.append({
+                            "hash": commit_hash,
+                            "author": author_name,
+                            "message": subject
+                        })
+        
+        status_result = {
+            "success": True,
+            "is_git_repo": True,
+            "directory": str(path),
+            "current_branch": current_branch,
+            **status,
+            "total_changes": sum(len(files) for files in status.values())
+        }
+        
+        snapshot = {
+            **status_result,
+            "commits": commits,
+            "total_commits": len(commits)
+        }
+        
+        if cache_key is not None:
+            performance_monitor.git_cache.put(cache_key, snapshot)
+            status_key = _git_cache_key("git_status", path)
+            if status_key is not None:
+                performance_monitor.git_cache.put(status_key, status_result)
+        
+        return snapshot
+        
+    except Exception as e:
+        logger.error(f"Error getting git snapshot for {directory}: {str(e)}")
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}",
+            "is_git_repo": False
+        }
+
+
 def _get_file_blame_sync(directory: str = ".", file_path: str = "", start_line: Optional[int] = None, end_line: Optional[int] = None) -> Dict[str, Any]:
     """
     Synchronous version of get_file_blame for executor usage.
@@ -4839,59 +5805,14 @@ def _find_commits_touching_file_sync(directory: str = ".", file_path: str = "",
                 current_commit["files_changed"] = current_files
                 commits.append(current_commit)
             
-            # Get additional statistics for each commit
+            # One git process for every commit's statistics instead of one per commit
+            commit_stats = _git_commit_stats(path, [commit["full_sha"] for commit in commits])
             for commit in commits:
-                try:
-                    stats_cmd = ["git", "show", "--stat", "--format=", commit["full_sha"]]
-                    stats_result = subprocess.run(
-                        stats_cmd,
-                        cwd=str(path),
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if stats_result.returncode == 0:
-                        # Parse statistics
-                        stats_lines = stats_result.stdout.strip().split('\n')
-                        files_changed = 0
-                        insertions = 0
-                        deletions = 0
-                        
-                        for stat_line in stats_lines:
-                            if 'file' in stat_line and 'changed' in stat_line:
-                                # Extract files changed count
-                                match = re.search(r'(\d+) file', stat_line)
-                                if match:
-                                    files_changed = int(match.group(1))
-                                
-                                # Extract insertions and deletions
-                                ins_match = re.search(r'(\d+) insertion', stat_line)
-                                if ins_match:
-                                    insertions = int(ins_match.group(1))
-                                
-                                del_match = re.search(r'(\d+) deletion', stat_line)
-                                if del_match:
-                                    deletions = int(del_match.group(1))
-                        
-                        commit["statistics"] = {
-                            "files_changed": files_changed,
-                            "insertions": insertions,
-                            "deletions": deletions
-                        }
-                    else:
-                        commit["statistics"] = {
-                            "files_changed": len(commit["files_changed"]),
-                            "insertions": 0,
-                            "deletions": 0
-                        }
-                        
-                except Exception:
-                    commit["statistics"] = {
-                        "files_changed": len(commit["files_changed"]),
-                        "insertions": 0,
-                        "deletions": 0
-                    }
+                commit["statistics"] = commit_stats.get(commit["full_sha"], {
+                    "files_changed": len(commit["files_changed"]),
+                    "insertions": 0,
+                    "deletions": 0
+                })
             
             return {
                 "success": True,
@@ -3,9 +3,20 @@ import crypto from 'crypto';
 import { PrismaClient } from '@prisma/client';
 import { userManagementService } from '@/services/user/userManagementService';
 import { productionEmailService } from '@/services/email/productionEmailService';
+import { verifyWebhookSignature } from '@/services/dodo/webhookSignature';
 
 const prisma = new PrismaClient();
 
+// Webhook event type -> handler (a Map, so types like "constructor" never hit Object.prototype)
+const EVENT_HANDLERS = new Map<string, (data: any) => Promise<any>>([
+  ['subscription.created', handleSubscriptionCreated],
+  ['subscription.activated', handleSubscriptionActivated],
+  ['subscription.cancelled', handleSubscriptionCancelled],
+  ['subscription.expired', handleSubscriptionCancelled],
+  ['payment.failed', handlePaymentFailed],
+  ['payment.succeeded', handlePaymentSucceeded],
+]);
+
 export async function POST(req: NextRequest) {
   console.log('Received Dodo webhook:', new Date().toISOString());
 
@@ -43,32 +54,13 @@ export async function POST(req: NextRequest) {
     });
 
     // Handle different webhook events
+    const handler = EVENT_HANDLERS.get(event.type);
     let processingResult = null;
-    switch (event.type) {
-      case 'subscription.created':
-        processingResult = await handleSubscriptionCreated(event.data);
-        break;
-
-      case 'subscription.activated':
-        processingResult = await handleSubscriptionActivated(event.data);
-        break;
-
-      case 'subscription.cancelled':
-      case 'subscription.expired':
-        processingResult = await handleSubscriptionCancelled(event.data);
-        break;
-
-      case 'payment.failed':
-        processingResult = await handlePaymentFailed(event.data);
-        break;
-
-      case 'payment.succeeded':
-        processingResult = await handlePaymentSucceeded(event.data);
-        break;
-
-      default:
-        console.log(`Unhandled event type: ${event.type}`);
-        processingResult = { handled: false, message: `Unhandled event type: ${event.type}` };
+    if (handler) {
+      processingResult = await handler(event.data);
+    } else {
+      console.log(`Unhandled event type: ${event.type}`);
+      processingResult = { handled: false, message: `Unhandled event type: ${event.type}` };
     }
 
     // Update webhook event as processed (commented out for testing)
@@ -103,62 +95,6 @@ export async function POST(req: NextRequest) {
   }
 }
 
-// Verify webhook signature using HMAC SHA256
-function verifyWebhookSignature(body: string, signature: string | null, timestamp: string | null, webhookId: string | null): boolean {
-  try {
-    const webhookSecret = process.env.DODO_WEBHOOK_SECRET;
-    if (!webhookSecret) {
-      console.error('DODO_WEBHOOK_SECRET not configured');
-      return false;
-    }
-
-    if (!signature || !timestamp || !webhookId) {
-      console.error('Missing required webhook headers');
-      return false;
-    }
-
-    // Extract the actual signature from the header (format: "t=timestamp,v1=signature")
-    const signatureParts = signature.split(',');
-    if (signatureParts.length < 2) {
-      console.error('Invalid signature format');
-      return false;
-    }
-
-    // Find the v1 signature
-    let actualSignature = '';
-    for (const part of signatureParts) {
-      if (part.startsWith('v1=')) {
-        actualSignature = part.substring(3);
-        break;
-      }
-    }
-
-    if (!actualSignature) {
-      console.error('No v1 signature found');
-      return false;
-    }
-
-    // Create the expected signature: timestamp.body (as per Dodo's spec)
-    const payload = `${timestamp}.${body}`;
-    const expectedSignature = crypto
-      .createHmac('sha256', webhookSecret)
-      .update(payload)
-      .digest('hex');
-
-    const isValid = crypto.timingSafeEqual(
-      Buffer.from(actualSignature, 'hex'),
-      Buffer.from(expectedSignature, 'hex')
-    );
-
-    console.log('Signature verification:', isValid ? 'VALID' : 'INVALID');
-    return isValid;
-
-  } catch (error) {
-    console.error('Signature verification error:', error);
-    return false;
-  }
-}
-
 // Event handlers
 async function handleSubscriptionCreated(data: any) {
   console.log('New subscription created:', data.subscription_id);
@@ -284,14 +220,15 @@ async function handleSubscriptionCancelled(data: any) {
       throw new Error(`Subscription not found: ${data.subscription_id}`);
     }
 
-    // Update subscription status
-    await userManagementService.updateSubscriptionStatus(data.subscription_id, 'cancelled', {
-      canceledAt: new Date(),
-      cancellationReason: data.cancellation_reason
-    });
-
-    // Revoke license
-    await userManagementService.revokeLicense(data.subscription_id);
+    // Update subscription status and revoke its license; the writes touch
+    // different rows, so issue them concurrently
+    await Promise.all([
+      userManagementService.updateSubscriptionStatus(data.subscription_id, 'cancelled', {
+        canceledAt: new Date(),
+        cancellationReason: data.cancellation_reason
+      }),
+      userManagementService.revokeLicense(data.subscription_id)
+    ]);
 
     // Send cancellation email to user
     if (subscription.user) {
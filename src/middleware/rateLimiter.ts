@@ -69,13 +69,17 @@ export const createRateLimitMiddleware = (config: Partial<RateLimitConfig> = {})
       const window = Math.floor(Date.now() / rateLimitConfig.windowMs);
       const rateLimitKey = `${key}:${window}`;
       
-      // Get current request count
-      const current = await redis.incr(rateLimitKey);
-      
-      // Set expiration for the key if it's the first request in this window
-      if (current === 1) {
-        await redis.expire(rateLimitKey, Math.ceil(rateLimitConfig.windowMs / 1000));
+      // Count the request and arm the window's expiry in a single MULTI/EXEC round trip.
+      // The key is per-window, so re-arming the TTL on every request never extends a window.
+      const results = await redis
+        .multi()
+        .incr(rateLimitKey)
+        .expire(rateLimitKey, Math.ceil(rateLimitConfig.windowMs / 1000))
+        .exec();
+      if (!results || results[0][0]) {
+        throw results?.[0][0] ?? new Error('Rate limit transaction aborted');
       }
+      const current = results[0][1] as number;
       
       // Check if limit is exceeded
       if (current > rateLimitConfig.max) {
@@ -168,8 +172,9 @@ export const getRateLimitStats = async (key: string) => {
   try {
     const window = Math.floor(Date.now() / defaultConfig.windowMs);
     const rateLimitKey = `${key}:${window}`;
-    const current = await redis.get(rateLimitKey);
-    const ttl = await redis.ttl(rateLimitKey);
+    const results = await redis.pipeline().get(rateLimitKey).ttl(rateLimitKey).exec();
+    const current = results?.[0][1] as string | null;
+    const ttl = results?.[1][1] as number;
     
     return {
       current: parseInt(current || '0'),
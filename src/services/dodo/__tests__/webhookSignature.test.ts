@@ -0,0 +1,62 @@
+/**
+ * Tests for Dodo webhook signature verification
+ */
+
+import crypto from 'crypto';
+import { verifyWebhookSignature, WEBHOOK_TIMESTAMP_TOLERANCE_SECONDS } from '../webhookSignature';
+
+const SECRET = 'whsec_test_secret';
+const NOW_SECONDS = 1_700_000_000;
+const BODY = JSON.stringify({ type: 'payment.succeeded', data: { payment_id: 'pay_123' } });
+
+function sign(timestamp: string, body: string = BODY): string {
+  const digest = crypto.createHmac('sha256', SECRET).update(`${timestamp}.${body}`).digest('hex');
+  return `t=${timestamp},v1=${digest}`;
+}
+
+describe('verifyWebhookSignature', () => {
+  const originalSecret = process.env.DODO_WEBHOOK_SECRET;
+  let hmacSpy: jest.SpyInstance;
+
+  beforeEach(() => {
+    process.env.DODO_WEBHOOK_SECRET = SECRET;
+    jest.spyOn(Date, 'now').mockReturnValue(NOW_SECONDS * 1000);
+    jest.spyOn(console, 'error').mockImplementation(() => undefined);
+    jest.spyOn(console, 'log').mockImplementation(() => undefined);
+    hmacSpy = jest.spyOn(crypto, 'createHmac');
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+    process.env.DODO_WEBHOOK_SECRET = originalSecret;
+  });
+
+  it('accepts a correctly signed delivery inside the tolerance window', () => {
+    const timestamp = String(NOW_SECONDS - WEBHOOK_TIMESTAMP_TOLERANCE_SECONDS + 1);
+    const signature = sign(timestamp);
+    hmacSpy.mockClear();
+
+    expect(verifyWebhookSignature(BODY, signature, timestamp, 'evt_1')).toBe(true);
+    expect(hmacSpy).toHaveBeenCalledTimes(1);
+  });
+
+  it.each([
+    ['stale', String(NOW_SECONDS - WEBHOOK_TIMESTAMP_TOLERANCE_SECONDS - 1)],
+    ['future', String(NOW_SECONDS + WEBHOOK_TIMESTAMP_TOLERANCE_SECONDS + 1)],
+    ['non-numeric', 'yesterday'],
+  ])('rejects a %s timestamp before computing the HMAC', (_label, timestamp) => {
+    const signature = sign(String(NOW_SECONDS));
+    hmacSpy.mockClear();
+
+    expect(verifyWebhookSignature(BODY, signature, timestamp, 'evt_1')).toBe(false);
+    expect(hmacSpy).not.toHaveBeenCalled();
+  });
+
+  it('rejects a delivery without a timestamp header before computing the HMAC', () => {
+    const signature = sign(String(NOW_SECONDS));
+    hmacSpy.mockClear();
+
+    expect(verifyWebhookSignature(BODY, signature, null, 'evt_1')).toBe(false);
+    expect(hmacSpy).not.toHaveBeenCalled();
+  });
+});
@@ -1,7 +1,7 @@
 // src/services/dodo/webhookHandler.ts - Complete file
 import { Request, Response } from 'express';
 import { getDodoPaymentsService } from './dodopayments';
-import { PrismaClient } from '@prisma/client';
+import { PrismaClient, Prisma } from '@prisma/client';
 import { generateLicenseKey } from '../licenseService';
 import { sendEmail } from '../email/emailService';
 import { logger } from '../../utils/logger';
@@ -40,32 +40,39 @@ export class DodoWebhookHandler {
 
       const event: DodoWebhookEvent = req.body;
 
-      // Check if we've already processed this event (idempotency)
-      const existingEvent = await prisma.webhookEvent.findUnique({
-        where: { dodoEventId: event.id },
-      });
+      // Store the webhook event. A first delivery costs a single insert; a
+      // redelivery only updates its row while it is still unprocessed, so a
+      // finished event is never rewritten (idempotency)
+      let alreadyProcessed = false;
+      try {
+        await prisma.webhookEvent.create({
+          data: {
+            dodoEventId: event.id,
+            eventType: event.type,
+            data: event.data,
+            attempts: 1,
+          },
+        });
+      } catch (error) {
+        if (!(error instanceof Prisma.PrismaClientKnownRequestError && error.code === 'P2002')) {
+          throw error;
+        }
+        const { count } = await prisma.webhookEvent.updateMany({
+          where: { dodoEventId: event.id, processed: false },
+          data: { 
+            attempts: { increment: 1 },
+            data: event.data,
+          },
+        });
+        alreadyProcessed = count === 0;
+      }
 
-      if (existingEvent && existingEvent.processed) {
+      if (alreadyProcessed) {
         logger.info(`Webhook event ${event.id} already processed`);
         res.status(200).json({ received: true });
         return;
       }
 
-      // Store the webhook event
-      await prisma.webhookEvent.upsert({
-        where: { dodoEventId: event.id },
-        update: { 
-          attempts: { increment: 1 },
-          data: event.data,
-        },
-        create: {
-          dodoEventId: event.id,
-          eventType: event.type,
-          data: event.data,
-          attempts: 1,
-        },
-      });
-
       // Process the event based on type
       await this.processEvent(event);
 
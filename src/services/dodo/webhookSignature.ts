@@ -0,0 +1,69 @@
+// src/services/dodo/webhookSignature.ts - Dodo webhook signature verification
+import crypto from 'crypto';
+
+// Maximum allowed clock difference between the webhook-timestamp header and now
+export const WEBHOOK_TIMESTAMP_TOLERANCE_SECONDS = 5 * 60;
+
+// Verify webhook signature using HMAC SHA256
+export function verifyWebhookSignature(body: string, signature: string | null, timestamp: string | null, webhookId: string | null): boolean {
+  try {
+    const webhookSecret = process.env.DODO_WEBHOOK_SECRET;
+    if (!webhookSecret) {
+      console.error('DODO_WEBHOOK_SECRET not configured');
+      return false;
+    }
+
+    if (!signature || !timestamp || !webhookId) {
+      console.error('Missing required webhook headers');
+      return false;
+    }
+
+    // Reject stale or future-dated deliveries (replays) before computing the HMAC
+    const timestampSeconds = Number(timestamp);
+    if (!Number.isInteger(timestampSeconds) ||
+        Math.abs(Math.floor(Date.now() / 1000) - timestampSeconds) > WEBHOOK_TIMESTAMP_TOLERANCE_SECONDS) {
+      console.error('Webhook timestamp outside tolerance');
+      return false;
+    }
+
+    // Extract the actual signature from the header (format: "t=timestamp,v1=signature")
+    const signatureParts = signature.split(',');
+    if (signatureParts.length < 2) {
+      console.error('Invalid signature format');
+      return false;
+    }
+
+    // Find the v1 signature
+    let actualSignature = '';
+    for (const part of signatureParts) {
+      if (part.startsWith('v1=')) {
+        actualSignature = part.substring(3);
+        break;
+      }
+    }
+
+    if (!actualSignature) {
+      console.error('No v1 signature found');
+      return false;
+    }
+
+    // Create the expected signature: timestamp.body (as per Dodo's spec)
+    const payload = `${timestamp}.${body}`;
+    const expectedSignature = crypto
+      .createHmac('sha256', webhookSecret)
+      .update(payload)
+      .digest('hex');
+
+    const isValid = crypto.timingSafeEqual(
+      Buffer.from(actualSignature, 'hex'),
+      Buffer.from(expectedSignature, 'hex')
+    );
+
+    console.log('Signature verification:', isValid ? 'VALID' : 'INVALID');
+    return isValid;
+
+  } catch (error) {
+    console.error('Signature verification error:', error);
+    return false;
+  }
+}
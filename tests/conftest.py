@@ -4,15 +4,17 @@ Pytest configuration and fixtures for MCP server tests.
 This module provides common fixtures and configuration for all test modules.
 """
 
+import copy
 import os
 import sys
-import tempfile
 import shutil
 import json
 import signal
+import subprocess
 import threading
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Any, Generator
 from unittest.mock import patch, MagicMock
 
@@ -22,18 +24,38 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Opt-in: precompile the project modules the tests import so a cold CI checkout
+# pays for compilation once here instead of once per pytest-xdist worker.
+# (Test modules themselves go through pytest's assertion rewriting instead.)
+if os.environ.get("WARM_PYC"):
+    import compileall
+    compileall.compile_dir(str(project_root), maxlevels=0, quiet=1, workers=0)
+
 try:
     from mcp_config_manager import MCPConfigManager, DirectoryConfig, MCPConfig
 except ImportError:
     pytest.skip("MCPConfigManager not available", allow_module_level=True)
 
+# Import the server once per process (and per xdist worker) with FastMCP mocked,
+# the way the first test module to import it always has, so test modules can
+# import from it directly instead of re-entering patch() on every load.
+with patch('mcp.server.fastmcp.FastMCP'):
+    try:
+        import official_mcp_server  # noqa: F401
+    except ImportError:
+        pass  # Test modules skip themselves when the server is unavailable
+
 
 @pytest.fixture
-def temp_dir() -> Generator[str, None, None]:
-    """Create a temporary directory for testing."""
-    temp_path = tempfile.mkdtemp()
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[str, None, None]:
+    """Create a temporary directory for testing.
+
+    Built on tmp_path_factory so each pytest-xdist worker gets its own base
+    directory and parallel tests never share paths.
+    """
+    temp_path = str(tmp_path_factory.mktemp("temp"))
     yield temp_path
-    shutil.rmtree(temp_path)
+    shutil.rmtree(temp_path, ignore_errors=True)
 
 
 @pytest.fixture
@@ -42,10 +64,29 @@ def test_config_path(temp_dir: str) -> str:
     return os.path.join(temp_dir, "test_config.json")
 
 
+@pytest.fixture(scope="session")
+def _config_manager_prototype(tmp_path_factory: pytest.TempPathFactory) -> MCPConfigManager:
+    """Build one default configuration manager (and config file) for the whole session."""
+    return MCPConfigManager(str(tmp_path_factory.mktemp("config") / "test_config.json"))
+
+
+def _clone_config_manager(prototype: MCPConfigManager, config_path: str) -> MCPConfigManager:
+    """Copy-on-write clone of prototype that reads and writes config_path."""
+    shutil.copyfile(prototype.config_path, config_path)
+    manager = copy.copy(prototype)
+    manager.config_path = config_path
+    manager.config = copy.deepcopy(prototype.config)
+    manager._lock = threading.Lock()
+    manager._system_directories = set(prototype._system_directories)
+    return manager
+
+
 @pytest.fixture
-def config_manager(test_config_path: str) -> Generator[MCPConfigManager, None, None]:
+def config_manager(
+    test_config_path: str, _config_manager_prototype: MCPConfigManager
+) -> Generator[MCPConfigManager, None, None]:
     """Create a test configuration manager with proper cleanup."""
-    manager = MCPConfigManager(test_config_path)
+    manager = _clone_config_manager(_config_manager_prototype, test_config_path)
 
     yield manager
 
@@ -57,29 +98,101 @@ def config_manager(test_config_path: str) -> Generator[MCPConfigManager, None, N
         pass  # Ignore cleanup errors
 
 
-@pytest.fixture
-def test_project_dir(temp_dir: str) -> str:
-    """Create a test project directory with sample files."""
-    project_dir = os.path.join(temp_dir, "test_project")
-    os.makedirs(project_dir, exist_ok=True)
-    
-    # Create test files
-    test_files = {
-        "test.py": "print('Hello, World!')",
-        "test.txt": "This is a test file",
-        ".env": "SECRET_KEY=test123",
-        "config.json": '{"test": true}',
-        "large_file.txt": "x" * (10 * 1024),  # 10KB file (reduced for faster tests)
-        "subdir/test_sub.py": "print('Subdirectory test')",
-    }
-    
-    for file_path, content in test_files.items():
-        full_path = os.path.join(project_dir, file_path)
+# Files every test project starts with (restored after each test)
+PROJECT_FILES = {
+    "test.py": "print('Hello, World!')",
+    "test.txt": "This is a test file",
+    ".env": "SECRET_KEY=test123",
+    "config.json": '{"test": true}',
+    "large_file.txt": "x" * (10 * 1024),  # 10KB file (reduced for faster tests)
+    "subdir/test_sub.py": "print('Subdirectory test')",
+}
+
+# Attribute name -> file in PROJECT_FILES, exposed by the project_paths fixture
+PROJECT_PATH_NAMES = {
+    "test_py": "test.py",
+    "test_txt": "test.txt",
+    "env": ".env",
+    "config_json": "config.json",
+    "large": "large_file.txt",
+}
+
+
+def _write_files(root: str, files: Dict[str, str]) -> None:
+    """Write files (relative path -> content) under root."""
+    for file_path, content in files.items():
+        full_path = os.path.join(root, file_path)
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
         with open(full_path, 'w', encoding='utf-8') as f:
             f.write(content)
+
+
+def _restore_files(root: str, files: Dict[str, str]) -> None:
+    """Remove anything a test added under root and rewrite changed files."""
+    expected_files = {os.path.normpath(p) for p in files}
+    expected_dirs = {os.path.dirname(p) for p in expected_files}
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        rel_dir = os.path.relpath(dirpath, root)
+        rel_dir = "" if rel_dir == "." else rel_dir
+        for name in filenames:
+            if os.path.join(rel_dir, name) not in expected_files:
+                os.remove(os.path.join(dirpath, name))
+        for name in dirnames:
+            if os.path.join(rel_dir, name) not in expected_dirs:
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
     
-    return project_dir
+    changed = {}
+    for file_path, content in files.items():
+        try:
+            with open(os.path.join(root, file_path), 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    continue
+        except OSError:
+            pass
+        changed[file_path] = content
+    _write_files(root, changed)
+
+
+def _clear_server_caches() -> None:
+    """Drop server-side caches, which are keyed by the (shared) fixture paths."""
+    server = sys.modules.get("official_mcp_server")
+    if server is not None:
+        server.performance_monitor.file_cache.clear()
+        server.performance_monitor.symbol_cache.clear()
+        server.performance_monitor.git_cache.clear()
+
+
+@pytest.fixture(scope="module")
+def _module_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[str, None, None]:
+    """Create the sample project once per test module (and per xdist worker)."""
+    base_dir = str(tmp_path_factory.mktemp("project"))
+    project_dir = os.path.join(base_dir, "test_project")
+    _write_files(project_dir, PROJECT_FILES)
+    yield project_dir
+    shutil.rmtree(base_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def test_project_dir(_module_project_dir: str) -> Generator[str, None, None]:
+    """Create a test project directory with sample files."""
+    yield _module_project_dir
+    _restore_files(_module_project_dir, PROJECT_FILES)
+    _clear_server_caches()
+
+
+@pytest.fixture(scope="module")
+def _module_project_paths(_module_project_dir: str) -> SimpleNamespace:
+    """Join the sample project's file paths once per test module."""
+    return SimpleNamespace(
+        root=_module_project_dir,
+        **{attr: os.path.join(_module_project_dir, name) for attr, name in PROJECT_PATH_NAMES.items()}
+    )
+
+
+@pytest.fixture
+def project_paths(test_project_dir: str, _module_project_paths: SimpleNamespace) -> SimpleNamespace:
+    """Absolute paths of the files in test_project_dir (see PROJECT_PATH_NAMES)."""
+    return _module_project_paths
 
 
 @pytest.fixture
@@ -171,28 +284,57 @@ def setup_test_environment():
                     thread._stop()
 
 
-@pytest.fixture
-def git_repo(temp_dir: str) -> str:
-    """Create a test git repository."""
-    repo_dir = os.path.join(temp_dir, "git_repo")
-    os.makedirs(repo_dir, exist_ok=True)
-    
-    # Create .git directory to simulate git repo
-    git_dir = os.path.join(repo_dir, ".git")
-    os.makedirs(git_dir, exist_ok=True)
+def _git(repo_dir: str, *args: str) -> None:
+    """Run a git command in repo_dir, raising on failure."""
+    subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True, timeout=30)
+
+
+# Module repo path -> sha of its initial commit, restored after each test
+_GIT_REPO_INITIAL_COMMITS: Dict[str, str] = {}
+
+
+@pytest.fixture(scope="module")
+def _module_git_repo(tmp_path_factory: pytest.TempPathFactory) -> Generator[str, None, None]:
+    """Create one real git repository per test module (and per xdist worker).
     
-    # Create .gitignore
-    with open(os.path.join(repo_dir, ".gitignore"), 'w') as f:
-        f.write("*.pyc\n__pycache__\n.env\n")
+    Falls back to a bare .git directory when git is not installed.
+    """
+    base_dir = str(tmp_path_factory.mktemp("git"))
+    repo_dir = os.path.join(base_dir, "git_repo")
+    _write_files(repo_dir, {
+        ".gitignore": "*.pyc\n__pycache__\n.env\n",
+        "main.py": "print('Hello from git repo')",
+        "ignored.pyc": "compiled python",
+    })
     
-    # Create some files
-    with open(os.path.join(repo_dir, "main.py"), 'w') as f:
-        f.write("print('Hello from git repo')")
+    if shutil.which("git"):
+        _git(repo_dir, "init", "-q")
+        _git(repo_dir, "symbolic-ref", "HEAD", "refs/heads/main")
+        _git(repo_dir, "config", "user.name", "Test User")
+        _git(repo_dir, "config", "user.email", "test@example.com")
+        _git(repo_dir, "config", "commit.gpgsign", "false")
+        _git(repo_dir, "add", ".gitignore", "main.py")
+        _git(repo_dir, "commit", "-q", "-m", "Initial commit")
+        _GIT_REPO_INITIAL_COMMITS[repo_dir] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo_dir, check=True, capture_output=True, text=True
+        ).stdout.strip()
+    else:
+        os.makedirs(os.path.join(repo_dir, ".git"))
     
-    with open(os.path.join(repo_dir, "ignored.pyc"), 'w') as f:
-        f.write("compiled python")
+    yield repo_dir
+    _GIT_REPO_INITIAL_COMMITS.pop(repo_dir, None)
+    shutil.rmtree(base_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def git_repo(_module_git_repo: str) -> Generator[str, None, None]:
+    """Create a test git repository (reset to its initial commit after each test)."""
+    yield _module_git_repo
     
-    return repo_dir
+    if shutil.which("git"):
+        _git(_module_git_repo, "reset", "-q", "--hard", _GIT_REPO_INITIAL_COMMITS[_module_git_repo])
+        _git(_module_git_repo, "clean", "-q", "-fd")
+    _clear_server_caches()
 
 
 # Pytest configuration
@@ -210,6 +352,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): pin tests to a single pytest-xdist worker"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
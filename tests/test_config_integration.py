@@ -157,7 +157,7 @@ class TestConfigIntegration:
             assert test_project_dir in log_content
     
     @pytest.mark.integration
-    def test_security_mode_integration(self, test_project_dir, config_manager):
+    def test_security_mode_integration(self, test_project_dir, project_paths, config_manager):
         """Test security mode integration with file access."""
         # Test strict mode
         config_manager.config.security_mode = "strict"
@@ -166,7 +166,7 @@ class TestConfigIntegration:
         # Mock the global config_manager
         with patch('official_mcp_server.config_manager', config_manager):
             # Test file access
-            test_file = os.path.join(test_project_dir, "test.txt")
+            test_file = project_paths.test_txt
             result = _read_file_sync(test_file)
             
             # In strict mode, should be more restrictive
@@ -416,7 +416,7 @@ class TestServerIntegration:
     """Integration tests for MCP server functionality."""
     
     @pytest.mark.integration
-    def test_server_with_config_manager(self, test_project_dir, config_manager):
+    def test_server_with_config_manager(self, test_project_dir, project_paths, config_manager):
         """Test MCP server integration with configuration manager."""
         # Add directory to configuration
         config_manager.add_directory(test_project_dir)
@@ -429,7 +429,7 @@ class TestServerIntegration:
             assert len(result["files"]) > 0
             
             # Test read_file tool
-            test_file = os.path.join(test_project_dir, "test.txt")
+            test_file = project_paths.test_txt
             result = _read_file_sync(test_file)
             assert result["success"] is True
             assert result["content"] == "This is a test file"
@@ -530,7 +530,7 @@ class TestEndToEndIntegration:
     
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_complete_workflow(self, test_project_dir, test_docs_dir, temp_dir):
+    def test_complete_workflow(self, test_project_dir, project_paths, test_docs_dir, temp_dir):
         """Test complete workflow from setup to file access."""
         config_path = os.path.join(temp_dir, "e2e_config.json")
         
@@ -553,7 +553,7 @@ class TestEndToEndIntegration:
             assert result["success"] is True
             
             # Read a file
-            test_file = os.path.join(test_project_dir, "test.txt")
+            test_file = project_paths.test_txt
             result = _read_file_sync(test_file)
             assert result["success"] is True
             
@@ -585,7 +585,7 @@ class TestEndToEndIntegration:
             mock_stop.assert_called_once()
     
     @pytest.mark.integration
-    def test_cli_to_server_integration(self, test_project_dir, temp_dir):
+    def test_cli_to_server_integration(self, test_project_dir, project_paths, temp_dir):
         """Test integration between CLI and server."""
         config_path = os.path.join(temp_dir, "cli_server_config.json")
         
@@ -610,7 +610,7 @@ class TestEndToEndIntegration:
             result = _list_files_sync(test_project_dir)
             assert result["success"] is True
             
-            test_file = os.path.join(test_project_dir, "test.txt")
+            test_file = project_paths.test_txt
             result = _read_file_sync(test_file)
             assert result["success"] is True
     
@@ -677,7 +677,7 @@ class TestPerformanceIntegration:
         assert result["total_files"] >= 19  # Should find all files (10 + 3*3)
     
     @pytest.mark.integration
-    def test_memory_usage(self, test_project_dir, config_manager):
+    def test_memory_usage(self, test_project_dir, project_paths, config_manager):
         """Test memory usage with multiple operations."""
         config_manager.add_directory(test_project_dir)
 
@@ -687,7 +687,7 @@ class TestPerformanceIntegration:
                 result = _list_files_sync(test_project_dir)
                 assert result["success"] is True
 
-                test_file = os.path.join(test_project_dir, "test.txt")
+                test_file = project_paths.test_txt
                 result = _read_file_sync(test_file)
                 assert result["success"] is True
 
@@ -0,0 +1,52 @@
+"""
+Slow authentication tests split out of test_jwt_auth_workflows.
+
+Kept in their own module and xdist group so the fast JWT unit tests can
+be distributed across workers without waiting on the load test.
+"""
+
+import pytest
+from types import SimpleNamespace
+
+
+@pytest.mark.xdist_group("slow_auth")
+class TestJWTAuthPerformance:
+    """Load tests for the authentication system."""
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_authentication_performance_under_load(self):
+        """Test authentication system performance under load."""
+        performance_result = {
+            'concurrent_users': 100,
+            'total_auth_requests': 10000,
+            'successful_authentications': 9950,
+            'failed_authentications': 50,
+            'average_response_time_ms': 45,
+            'p95_response_time_ms': 100,
+            'p99_response_time_ms': 200,
+            'throughput_per_second': 500,
+            'success_rate': 99.5,
+            'memory_usage_mb': 512,
+            'cpu_usage_percent': 60
+        }
+        mock_performance = SimpleNamespace(
+            run_authentication_load_test=lambda **kwargs: performance_result
+        )
+
+        result = mock_performance.run_authentication_load_test(
+            concurrent_users=100,
+            requests_per_user=100,
+            duration_seconds=120
+        )
+
+        assert result['success_rate'] > 99.0
+        assert result['average_response_time_ms'] < 100
+        assert result['throughput_per_second'] > 400
+
+
+# Mock classes for authentication performance testing
+class AuthPerformanceTester:
+    @staticmethod
+    def run_authentication_load_test(concurrent_users, requests_per_user, duration_seconds):
+        pass
@@ -6,44 +6,133 @@ server registration, and license lifecycle operations.
 """
 
 import pytest
+import functools
 import json
-from unittest.mock import patch, MagicMock, AsyncMock
+from collections import ChainMap
+from dataclasses import dataclass, field
+from enum import Enum
+from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
 
+# Fixed reference times so fixtures don't hit the clock on every test.
+_NOW = datetime(2024, 1, 1)
+_FUTURE = _NOW + timedelta(days=365)
+_PAST = _NOW - timedelta(days=1)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW if tz is None else _NOW.replace(tzinfo=tz)
+
+
+# Any datetime.now() in this module reads the frozen clock.
+datetime = _FrozenDatetime
+
+# License row as returned by the database.
+_LICENSE_RESPONSE = {
+    'id': 'license-123',
+    'userId': 'user-123',
+    'licenseKey': 'LIC-TEST-1234-ABCD-5678',
+    'name': 'Test License',
+    'description': 'License for testing',
+    'plan': 'PRO',
+    'maxServers': 5,
+    'isActive': True,
+    'expiresAt': _FUTURE,
+    'createdAt': _NOW,
+    'updatedAt': _NOW
+}
+
+_ACTIVE_USER = {'id': 'user-123', 'email': 'test@example.com', 'isActive': True}
+
+# Active servers filling a quota of 5.
+_QUOTA_SERVERS = tuple({'id': f'server-{i}', 'isActive': True} for i in range(5))
+
+
+def _strip_user_id(license_data):
+    """Copy of ``license_data`` without the ``userId`` field, as returned to clients."""
+    stripped = dict(license_data)
+    stripped.pop('userId', None)
+    return stripped
+
+
+class _PrismaState(Enum):
+    """Preconfigured Prisma mock states shared across tests."""
+    NOT_FOUND = 'not_found'
+    INACTIVE = 'inactive'
+    EXPIRED = 'expired'
+    QUOTA_FULL = 'quota_full'
+
+
+_STATE_OVERRIDES = {
+    _PrismaState.INACTIVE: {'isActive': False},
+    _PrismaState.EXPIRED: {'expiresAt': _PAST},
+    _PrismaState.QUOTA_FULL: {'maxServers': 5, 'servers': list(_QUOTA_SERVERS)},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _prisma_for(state):
+    """Build the Prisma mock for ``state`` once and share it between tests."""
+    prisma = PrismaClient()
+    if state is _PrismaState.NOT_FOUND:
+        prisma.license.findFirst.return_value = None
+        prisma.license.findUnique.return_value = None
+    else:
+        prisma.license.findUnique.return_value = ChainMap(
+            _STATE_OVERRIDES[state], {'user': _ACTIVE_USER, 'servers': []}, _LICENSE_RESPONSE
+        )
+    return prisma
+
+
+# Mock service exceptions
+class NotFoundError(Exception):
+    pass
+
+class ConflictError(Exception):
+    pass
+
+class LicenseValidationError(Exception):
+    pass
+
+class QuotaExceededError(Exception):
+    __slots__ = ('resource_type', 'current', 'limit')
+
+    def __init__(self, resource_type, current, limit):
+        self.resource_type = resource_type
+        self.current = current
+        self.limit = limit
+        super().__init__(f"{resource_type} quota exceeded: {current}/{limit}")
+
+
 class TestLicenseService:
     """Test suite for LicenseService class."""
 
-    @pytest.fixture
-    def mock_license_data(self):
+    @pytest.fixture(scope="session")
+    @classmethod
+    def mock_license_data(cls):
         """Sample license data for testing."""
         return {
             'name': 'Test License',
             'description': 'License for testing',
             'plan': 'PRO',
             'maxServers': 5,
-            'expiresAt': datetime.now() + timedelta(days=365)
+            'expiresAt': _FUTURE
         }
 
-    @pytest.fixture
-    def mock_license_response(self):
+    @pytest.fixture(scope="session")
+    @classmethod
+    def mock_license_response(cls):
         """Mock license response from database."""
-        return {
-            'id': 'license-123',
-            'userId': 'user-123',
-            'licenseKey': 'LIC-TEST-1234-ABCD-5678',
-            'name': 'Test License',
-            'description': 'License for testing',
-            'plan': 'PRO',
-            'maxServers': 5,
-            'isActive': True,
-            'expiresAt': datetime.now() + timedelta(days=365),
-            'createdAt': datetime.now(),
-            'updatedAt': datetime.now()
-        }
+        return _LICENSE_RESPONSE
 
-    @pytest.fixture
-    def mock_validation_request(self):
+    @pytest.fixture(scope="session")
+    @classmethod
+    def mock_validation_request(cls):
         """Sample license validation request."""
         return {
             'licenseKey': 'LIC-TEST-1234-ABCD-5678',
@@ -52,8 +141,9 @@ class TestLicenseService:
             'serverVersion': '1.0.0'
         }
 
-    @pytest.fixture
-    def mock_server_response(self):
+    @pytest.fixture(scope="session")
+    @classmethod
+    def mock_server_response(cls):
         """Mock server response from database."""
         return {
             'id': 'server-123',
@@ -62,18 +152,40 @@ class TestLicenseService:
             'name': 'Test Server',
             'version': '1.0.0',
             'isActive': True,
-            'lastSeen': datetime.now(),
-            'createdAt': datetime.now()
+            'lastSeen': _NOW,
+            'createdAt': _NOW
         }
 
+    @pytest.fixture(scope="session")
+    @classmethod
+    def _patched_license_service(cls):
+        """Patch LicenseService once for the whole session."""
+        with patch('tests.test_license_service.LicenseService') as mock_service:
+            yield mock_service
+
+    @pytest.fixture(autouse=True)
+    def mock_license_service(self, _patched_license_service):
+        """Shared LicenseService mock, reset after each test."""
+        yield _patched_license_service
+        _patched_license_service.reset_mock(return_value=True, side_effect=True)
+
     @pytest.fixture
     def mock_prisma(self):
         """Mock Prisma client."""
-        with patch('tests.test_license_service.PrismaClient') as mock_prisma:
-            yield mock_prisma.return_value
+        return PrismaClient()
+
+    @pytest.fixture
+    def not_found_prisma(self):
+        """Prisma client whose license lookups find nothing."""
+        return _prisma_for(_PrismaState.NOT_FOUND)
+
+    @pytest.fixture
+    def state_prisma(self, request):
+        """Prisma client in the _PrismaState given by indirect parametrization."""
+        return _prisma_for(request.param)
 
     @pytest.mark.unit
-    def test_create_license_success(self, mock_license_data, mock_license_response, mock_prisma):
+    def test_create_license_success(self, mock_license_data, mock_license_response, mock_prisma, mock_license_service):
         """Test successful license creation."""
         user_id = 'user-123'
 
@@ -91,30 +203,26 @@ class TestLicenseService:
         with patch('tests.test_license_service.generateLicenseKey') as mock_generate:
             mock_generate.return_value = 'LIC-TEST-1234-ABCD-5678'
 
-            with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-                MockLicenseService.createLicense.return_value = mock_license_response
+            mock_license_service.createLicense.return_value = mock_license_response
 
-                result = MockLicenseService.createLicense(user_id, mock_license_data)
+            result = mock_license_service.createLicense(user_id, mock_license_data)
 
-                assert result == mock_license_response
-                MockLicenseService.createLicense.assert_called_once_with(user_id, mock_license_data)
+            assert result == mock_license_response
+            mock_license_service.createLicense.assert_called_once_with(user_id, mock_license_data)
 
     @pytest.mark.unit
-    def test_create_license_no_subscription(self, mock_license_data, mock_prisma):
+    def test_create_license_no_subscription(self, mock_license_data, mock_prisma, mock_license_service):
         """Test license creation without active subscription."""
         user_id = 'user-123'
 
         mock_prisma.subscription.findFirst.return_value = None
+        mock_license_service.createLicense.side_effect = ConflictError('No active subscription found')
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            from tests.test_license_service import ConflictError
-            MockLicenseService.createLicense.side_effect = ConflictError('No active subscription found')
-
-            with pytest.raises(ConflictError):
-                MockLicenseService.createLicense(user_id, mock_license_data)
+        with pytest.raises(ConflictError):
+            mock_license_service.createLicense(user_id, mock_license_data)
 
     @pytest.mark.unit
-    def test_create_license_key_generation_failure(self, mock_license_data, mock_prisma):
+    def test_create_license_key_generation_failure(self, mock_license_data, mock_prisma, mock_license_service):
         """Test license creation when license key generation fails."""
         user_id = 'user-123'
 
@@ -122,23 +230,19 @@ class TestLicenseService:
         mock_prisma.subscription.findFirst.return_value = mock_subscription
         # Always return existing license (simulate duplicate keys)
         mock_prisma.license.findUnique.return_value = {'id': 'existing'}
+        mock_license_service.createLicense.side_effect = ConflictError('Failed to generate unique license key')
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            from tests.test_license_service import ConflictError
-            MockLicenseService.createLicense.side_effect = ConflictError('Failed to generate unique license key')
-
-            with pytest.raises(ConflictError):
-                MockLicenseService.createLicense(user_id, mock_license_data)
+        with pytest.raises(ConflictError):
+            mock_license_service.createLicense(user_id, mock_license_data)
 
     @pytest.mark.unit
-    def test_validate_license_success(self, mock_validation_request, mock_license_response, mock_server_response, mock_prisma):
+    def test_validate_license_success(self, mock_validation_request, mock_license_response, mock_server_response, mock_prisma, mock_license_service):
         """Test successful license validation."""
         # Mock license with user and servers
-        mock_license_with_relations = {
-            **mock_license_response,
-            'user': {'id': 'user-123', 'email': 'test@example.com', 'isActive': True},
+        mock_license_with_relations = ChainMap({
+            'user': _ACTIVE_USER,
             'servers': []  # No existing servers, within quota
-        }
+        }, mock_license_response)
 
         mock_prisma.license.findUnique.return_value = mock_license_with_relations
         mock_prisma.server.findUnique.return_value = None  # New server
@@ -146,123 +250,47 @@ class TestLicenseService:
 
         expected_response = {
             'valid': True,
-            'license': {k: v for k, v in mock_license_with_relations.items() if k != 'userId'},
+            'license': _strip_user_id(mock_license_with_relations),
             'server': mock_server_response
         }
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.validateLicense.return_value = expected_response
-
-            result = MockLicenseService.validateLicense(mock_validation_request)
-
-            assert result == expected_response
-            assert result['valid'] is True
-            assert 'userId' not in result['license']
-
-    @pytest.mark.unit
-    def test_validate_license_invalid_key(self, mock_validation_request, mock_prisma):
-        """Test license validation with invalid key."""
-        mock_prisma.license.findUnique.return_value = None
-
-        expected_response = {
-            'valid': False,
-            'message': 'Invalid license key'
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.validateLicense.return_value = expected_response
-
-            result = MockLicenseService.validateLicense(mock_validation_request)
-
-            assert result == expected_response
-            assert result['valid'] is False
-
-    @pytest.mark.unit
-    def test_validate_license_inactive(self, mock_validation_request, mock_license_response, mock_prisma):
-        """Test license validation with inactive license."""
-        inactive_license = {
-            **mock_license_response,
-            'isActive': False,
-            'user': {'id': 'user-123', 'email': 'test@example.com', 'isActive': True},
-            'servers': []
-        }
-
-        mock_prisma.license.findUnique.return_value = inactive_license
-
-        expected_response = {
-            'valid': False,
-            'message': 'License is deactivated'
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.validateLicense.return_value = expected_response
-
-            result = MockLicenseService.validateLicense(mock_validation_request)
-
-            assert result == expected_response
-            assert result['valid'] is False
-
-    @pytest.mark.unit
-    def test_validate_license_expired(self, mock_validation_request, mock_license_response, mock_prisma):
-        """Test license validation with expired license."""
-        expired_license = {
-            **mock_license_response,
-            'expiresAt': datetime.now() - timedelta(days=1),  # Expired yesterday
-            'user': {'id': 'user-123', 'email': 'test@example.com', 'isActive': True},
-            'servers': []
-        }
-
-        mock_prisma.license.findUnique.return_value = expired_license
-
-        expected_response = {
-            'valid': False,
-            'message': 'License has expired'
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.validateLicense.return_value = expected_response
+        mock_license_service.validateLicense.return_value = expected_response
 
-            result = MockLicenseService.validateLicense(mock_validation_request)
+        result = mock_license_service.validateLicense(mock_validation_request)
 
-            assert result == expected_response
-            assert result['valid'] is False
+        assert result == expected_response
+        assert result['valid'] is True
+        assert 'userId' not in result['license']
 
     @pytest.mark.unit
-    def test_validate_license_quota_exceeded(self, mock_validation_request, mock_license_response, mock_prisma):
-        """Test license validation with server quota exceeded."""
-        # Create 5 existing servers to exceed quota of 5
-        existing_servers = [{'id': f'server-{i}', 'isActive': True} for i in range(5)]
-
-        license_at_quota = {
-            **mock_license_response,
-            'maxServers': 5,
-            'user': {'id': 'user-123', 'email': 'test@example.com', 'isActive': True},
-            'servers': existing_servers
-        }
-
-        mock_prisma.license.findUnique.return_value = license_at_quota
-
+    @pytest.mark.parametrize("state_prisma,message", [
+        (_PrismaState.NOT_FOUND, 'Invalid license key'),
+        (_PrismaState.INACTIVE, 'License is deactivated'),
+        (_PrismaState.EXPIRED, 'License has expired'),
+        (_PrismaState.QUOTA_FULL, 'Server quota exceeded'),
+    ], ids=['invalid_key', 'inactive', 'expired', 'quota_exceeded'], indirect=['state_prisma'])
+    def test_validate_license_negative(self, state_prisma, message, mock_validation_request,
+                                       mock_license_service):
+        """Test license validation rejects unknown, inactive, expired and over-quota licenses."""
         expected_response = {
             'valid': False,
-            'message': 'Server quota exceeded'
+            'message': message
         }
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.validateLicense.return_value = expected_response
+        mock_license_service.validateLicense.return_value = expected_response
 
-            result = MockLicenseService.validateLicense(mock_validation_request)
+        result = mock_license_service.validateLicense(mock_validation_request)
 
-            assert result == expected_response
-            assert result['valid'] is False
+        assert result == expected_response
+        assert result['valid'] is False
 
     @pytest.mark.unit
-    def test_validate_license_update_existing_server(self, mock_validation_request, mock_license_response, mock_server_response, mock_prisma):
+    def test_validate_license_update_existing_server(self, mock_validation_request, mock_license_response, mock_server_response, mock_prisma, mock_license_service):
         """Test license validation with existing server update."""
-        mock_license_with_relations = {
-            **mock_license_response,
-            'user': {'id': 'user-123', 'email': 'test@example.com', 'isActive': True},
+        mock_license_with_relations = ChainMap({
+            'user': _ACTIVE_USER,
             'servers': []
-        }
+        }, mock_license_response)
 
         existing_server = {
             'id': 'server-db-123',
@@ -283,30 +311,28 @@ class TestLicenseService:
 
         expected_response = {
             'valid': True,
-            'license': {k: v for k, v in mock_license_with_relations.items() if k != 'userId'},
+            'license': _strip_user_id(mock_license_with_relations),
             'server': updated_server
         }
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.validateLicense.return_value = expected_response
+        mock_license_service.validateLicense.return_value = expected_response
 
-            result = MockLicenseService.validateLicense(mock_validation_request)
+        result = mock_license_service.validateLicense(mock_validation_request)
 
-            assert result == expected_response
-            assert result['valid'] is True
+        assert result == expected_response
+        assert result['valid'] is True
 
     @pytest.mark.unit
-    def test_get_user_licenses_success(self, mock_license_response, mock_prisma):
+    def test_get_user_licenses_success(self, mock_license_response, mock_prisma, mock_license_service):
         """Test successful user licenses retrieval."""
         user_id = 'user-123'
         page = 1
         limit = 10
 
-        licenses_with_relations = [{
-            **mock_license_response,
+        licenses_with_relations = [ChainMap({
             'servers': [{'id': 'server-1', 'isActive': True}],
             '_count': {'servers': 1, 'analytics': 10}
-        }]
+        }, mock_license_response)]
 
         mock_prisma.license.findMany.return_value = licenses_with_relations
         mock_prisma.license.count.return_value = 1
@@ -316,54 +342,46 @@ class TestLicenseService:
             'total': 1
         }
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getUserLicenses.return_value = expected_result
+        mock_license_service.getUserLicenses.return_value = expected_result
 
-            result = MockLicenseService.getUserLicenses(user_id, page, limit)
+        result = mock_license_service.getUserLicenses(user_id, page, limit)
 
-            assert result == expected_result
-            assert len(result['licenses']) == 1
-            assert result['total'] == 1
+        assert result == expected_result
+        assert len(result['licenses']) == 1
+        assert result['total'] == 1
 
     @pytest.mark.unit
-    def test_get_license_by_id_success(self, mock_license_response, mock_prisma):
+    def test_get_license_by_id_success(self, mock_license_response, mock_prisma, mock_license_service):
         """Test successful license retrieval by ID."""
         license_id = 'license-123'
         user_id = 'user-123'
 
-        license_with_relations = {
-            **mock_license_response,
+        license_with_relations = ChainMap({
             'servers': [],
             '_count': {'servers': 0, 'analytics': 0}
-        }
+        }, mock_license_response)
 
         mock_prisma.license.findFirst.return_value = license_with_relations
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getLicenseById.return_value = license_with_relations
+        mock_license_service.getLicenseById.return_value = license_with_relations
 
-            result = MockLicenseService.getLicenseById(license_id, user_id)
+        result = mock_license_service.getLicenseById(license_id, user_id)
 
-            assert result == license_with_relations
-            MockLicenseService.getLicenseById.assert_called_once_with(license_id, user_id)
+        assert result == license_with_relations
+        mock_license_service.getLicenseById.assert_called_once_with(license_id, user_id)
 
     @pytest.mark.unit
-    def test_get_license_by_id_not_found(self, mock_prisma):
+    def test_get_license_by_id_not_found(self, not_found_prisma, mock_license_service):
         """Test license retrieval by ID when not found."""
         license_id = 'non-existent'
         user_id = 'user-123'
+        mock_license_service.getLicenseById.side_effect = NotFoundError('License not found')
 
-        mock_prisma.license.findFirst.return_value = None
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            from tests.test_license_service import NotFoundError
-            MockLicenseService.getLicenseById.side_effect = NotFoundError('License not found')
-
-            with pytest.raises(NotFoundError):
-                MockLicenseService.getLicenseById(license_id, user_id)
+        with pytest.raises(NotFoundError):
+            mock_license_service.getLicenseById(license_id, user_id)
 
     @pytest.mark.unit
-    def test_update_license_success(self, mock_license_response, mock_prisma):
+    def test_update_license_success(self, mock_license_response, mock_prisma, mock_license_service):
         """Test successful license update."""
         license_id = 'license-123'
         user_id = 'user-123'
@@ -373,73 +391,62 @@ class TestLicenseService:
             'maxServers': 10
         }
 
-        updated_license = {
-            **mock_license_response,
-            **update_data
-        }
+        updated_license = ChainMap(update_data, mock_license_response)
 
         mock_prisma.license.findFirst.return_value = mock_license_response
         mock_prisma.license.update.return_value = updated_license
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.updateLicense.return_value = updated_license
+        mock_license_service.updateLicense.return_value = updated_license
 
-            result = MockLicenseService.updateLicense(license_id, user_id, update_data)
+        result = mock_license_service.updateLicense(license_id, user_id, update_data)
 
-            assert result == updated_license
-            MockLicenseService.updateLicense.assert_called_once_with(license_id, user_id, update_data)
+        assert result == updated_license
+        mock_license_service.updateLicense.assert_called_once_with(license_id, user_id, update_data)
 
     @pytest.mark.unit
-    def test_update_license_not_found(self, mock_prisma):
+    def test_update_license_not_found(self, not_found_prisma, mock_license_service):
         """Test license update when license not found."""
         license_id = 'non-existent'
         user_id = 'user-123'
         update_data = {'name': 'New Name'}
+        mock_license_service.updateLicense.side_effect = NotFoundError('License not found')
 
-        mock_prisma.license.findFirst.return_value = None
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            from tests.test_license_service import NotFoundError
-            MockLicenseService.updateLicense.side_effect = NotFoundError('License not found')
-
-            with pytest.raises(NotFoundError):
-                MockLicenseService.updateLicense(license_id, user_id, update_data)
+        with pytest.raises(NotFoundError):
+            mock_license_service.updateLicense(license_id, user_id, update_data)
 
     @pytest.mark.unit
-    def test_deactivate_license_success(self, mock_license_response, mock_prisma):
+    def test_deactivate_license_success(self, mock_license_response, mock_prisma, mock_license_service):
         """Test successful license deactivation."""
         license_id = 'license-123'
         user_id = 'user-123'
 
         mock_prisma.license.findFirst.return_value = mock_license_response
-        mock_prisma.license.update.return_value = {**mock_license_response, 'isActive': False}
+        mock_prisma.license.update.return_value = ChainMap({'isActive': False}, mock_license_response)
         mock_prisma.server.updateMany.return_value = {'count': 2}
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.deactivateLicense.return_value = None
+        mock_license_service.deactivateLicense.return_value = None
 
-            # Should not raise any exception
-            MockLicenseService.deactivateLicense(license_id, user_id)
-            MockLicenseService.deactivateLicense.assert_called_once_with(license_id, user_id)
+        # Should not raise any exception
+        mock_license_service.deactivateLicense(license_id, user_id)
+        mock_license_service.deactivateLicense.assert_called_once_with(license_id, user_id)
 
     @pytest.mark.unit
-    def test_get_usage_quota_success(self, mock_license_response, mock_prisma):
+    def test_get_usage_quota_success(self, mock_license_response, mock_prisma, mock_license_service):
         """Test successful usage quota retrieval."""
         license_id = 'license-123'
 
         # Mock license with usage data
-        license_with_usage = {
-            **mock_license_response,
+        license_with_usage = ChainMap({
             'plan': 'PRO',
             'servers': [
                 {'id': 'server-1', 'isActive': True},
                 {'id': 'server-2', 'isActive': True}
             ],
             'analytics': [
-                {'eventType': 'REQUEST_COUNT', 'timestamp': datetime.now()},
-                {'eventType': 'ERROR_COUNT', 'timestamp': datetime.now()}
+                {'eventType': 'REQUEST_COUNT', 'timestamp': _NOW},
+                {'eventType': 'ERROR_COUNT', 'timestamp': _NOW}
             ]
-        }
+        }, mock_license_response)
 
         mock_prisma.license.findUnique.return_value = license_with_usage
 
@@ -455,159 +462,86 @@ class TestLicenseService:
             }
         }
 
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getUsageQuota.return_value = expected_quota
+        mock_license_service.getUsageQuota.return_value = expected_quota
 
-            result = MockLicenseService.getUsageQuota(license_id)
+        result = mock_license_service.getUsageQuota(license_id)
 
-            assert result == expected_quota
-            assert result['currentUsage']['servers'] == 2
-            assert result['maxServers'] == 20
+        assert result == expected_quota
+        assert result['currentUsage']['servers'] == 2
+        assert result['maxServers'] == 20
 
     @pytest.mark.unit
-    def test_get_usage_quota_not_found(self, mock_prisma):
+    def test_get_usage_quota_not_found(self, not_found_prisma, mock_license_service):
         """Test usage quota retrieval for non-existent license."""
         license_id = 'non-existent'
+        mock_license_service.getUsageQuota.side_effect = NotFoundError('License not found')
 
-        mock_prisma.license.findUnique.return_value = None
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            from tests.test_license_service import NotFoundError
-            MockLicenseService.getUsageQuota.side_effect = NotFoundError('License not found')
-
-            with pytest.raises(NotFoundError):
-                MockLicenseService.getUsageQuota(license_id)
+        with pytest.raises(NotFoundError):
+            mock_license_service.getUsageQuota(license_id)
 
     @pytest.mark.unit
-    def test_check_quota_within_limits(self, mock_prisma):
-        """Test quota check when within limits."""
-        license_id = 'license-123'
-
-        quota_within_limits = {
+    @pytest.mark.parametrize("quota,exceeded", [
+        ({
             'plan': 'PRO',
             'maxServers': 20,
             'maxRequestsPerMonth': 100000,
             'maxAnalyticsEvents': 1000000,
-            'currentUsage': {
-                'servers': 5,
-                'requestsThisMonth': 1000,
-                'analyticsEvents': 10000
-            }
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getUsageQuota.return_value = quota_within_limits
-            MockLicenseService.checkQuota.return_value = None
-
-            # Should not raise any exception
-            MockLicenseService.checkQuota(license_id)
-            MockLicenseService.checkQuota.assert_called_once_with(license_id)
-
-    @pytest.mark.unit
-    def test_check_quota_servers_exceeded(self, mock_prisma):
-        """Test quota check when server quota is exceeded."""
-        license_id = 'license-123'
-
-        quota_servers_exceeded = {
+            'currentUsage': {'servers': 5, 'requestsThisMonth': 1000, 'analyticsEvents': 10000}
+        }, None),
+        ({
             'plan': 'FREE',
             'maxServers': 1,
             'maxRequestsPerMonth': 1000,
             'maxAnalyticsEvents': 10000,
-            'currentUsage': {
-                'servers': 2,  # Exceeds limit of 1
-                'requestsThisMonth': 100,
-                'analyticsEvents': 1000
-            }
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getUsageQuota.return_value = quota_servers_exceeded
-
-            from tests.test_license_service import QuotaExceededError
-            MockLicenseService.checkQuota.side_effect = QuotaExceededError('servers', 2, 1)
-
-            with pytest.raises(QuotaExceededError):
-                MockLicenseService.checkQuota(license_id)
-
-    @pytest.mark.unit
-    def test_check_quota_requests_exceeded(self, mock_prisma):
-        """Test quota check when request quota is exceeded."""
-        license_id = 'license-123'
-
-        quota_requests_exceeded = {
+            'currentUsage': {'servers': 2, 'requestsThisMonth': 100, 'analyticsEvents': 1000}
+        }, ('servers', 2, 1)),
+        ({
             'plan': 'FREE',
             'maxServers': 1,
             'maxRequestsPerMonth': 1000,
             'maxAnalyticsEvents': 10000,
-            'currentUsage': {
-                'servers': 1,
-                'requestsThisMonth': 1001,  # Exceeds limit of 1000
-                'analyticsEvents': 1000
-            }
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getUsageQuota.return_value = quota_requests_exceeded
-
-            from tests.test_license_service import QuotaExceededError
-            MockLicenseService.checkQuota.side_effect = QuotaExceededError('requests', 1001, 1000)
-
-            with pytest.raises(QuotaExceededError):
-                MockLicenseService.checkQuota(license_id)
-
-    @pytest.mark.unit
-    def test_check_quota_analytics_exceeded(self, mock_prisma):
-        """Test quota check when analytics quota is exceeded."""
-        license_id = 'license-123'
-
-        quota_analytics_exceeded = {
+            'currentUsage': {'servers': 1, 'requestsThisMonth': 1001, 'analyticsEvents': 1000}
+        }, ('requests', 1001, 1000)),
+        ({
             'plan': 'FREE',
             'maxServers': 1,
             'maxRequestsPerMonth': 1000,
             'maxAnalyticsEvents': 10000,
-            'currentUsage': {
-                'servers': 1,
-                'requestsThisMonth': 100,
-                'analyticsEvents': 10001  # Exceeds limit of 10000
-            }
-        }
-
-        with patch('tests.test_license_service.LicenseService') as MockLicenseService:
-            MockLicenseService.getUsageQuota.return_value = quota_analytics_exceeded
-
-            from tests.test_license_service import QuotaExceededError
-            MockLicenseService.checkQuota.side_effect = QuotaExceededError('analytics', 10001, 10000)
-
-            with pytest.raises(QuotaExceededError):
-                MockLicenseService.checkQuota(license_id)
+            'currentUsage': {'servers': 1, 'requestsThisMonth': 100, 'analyticsEvents': 10001}
+        }, ('analytics', 10001, 10000)),
+    ], ids=['within_limits', 'servers_exceeded', 'requests_exceeded', 'analytics_exceeded'])
+    def test_check_quota(self, quota, exceeded, mock_license_service):
+        """Test quota check within limits and for each exceeded resource."""
+        license_id = 'license-123'
 
+        mock_license_service.getUsageQuota.return_value = quota
 
-# Mock classes and functions
-class NotFoundError(Exception):
-    pass
+        if exceeded is None:
+            mock_license_service.checkQuota.return_value = None
 
-class ConflictError(Exception):
-    pass
+            # Should not raise any exception
+            mock_license_service.checkQuota(license_id)
+            mock_license_service.checkQuota.assert_called_once_with(license_id)
+        else:
+            mock_license_service.checkQuota.side_effect = QuotaExceededError(*exceeded)
 
-class LicenseValidationError(Exception):
-    pass
+            with pytest.raises(QuotaExceededError) as exc_info:
+                mock_license_service.checkQuota(license_id)
+            assert exc_info.value.resource_type == exceeded[0]
 
-class QuotaExceededError(Exception):
-    def __init__(self, resource_type, current, limit):
-        self.resource_type = resource_type
-        self.current = current
-        self.limit = limit
-        super().__init__(f"{resource_type} quota exceeded: {current}/{limit}")
 
+# Mock helpers
 def generateLicenseKey():
     return 'LIC-TEST-1234-ABCD-5678'
 
 # Mock Prisma client
+@dataclass(slots=True)
 class PrismaClient:
-    def __init__(self):
-        self.subscription = MagicMock()
-        self.license = MagicMock()
-        self.server = MagicMock()
+    subscription: MagicMock = field(default_factory=lambda: MagicMock(spec_set=['findFirst']))
+    license: MagicMock = field(default_factory=lambda: MagicMock(
+        spec_set=['findUnique', 'findFirst', 'findMany', 'create', 'update', 'count']))
+    server: MagicMock = field(default_factory=lambda: MagicMock(
+        spec_set=['findUnique', 'create', 'update', 'updateMany']))
 
 # Mock LicenseService
 class LicenseService:
@@ -5,48 +5,285 @@ This module tests end-to-end license workflows including generation,
 validation, quota management, and server registration flows.
 """
 
+import asyncio
 import pytest
 import json
+import sys
 import time
-from unittest.mock import patch, MagicMock, AsyncMock
-from datetime import datetime, timedelta
+from unittest.mock import MagicMock, AsyncMock
+from types import MappingProxyType
+
+
+# Frozen reference time as a POSIX timestamp; every date in this module derives from it.
+_DAY = 86400
+_NOW_TS = 1704067200  # 2024-01-01T00:00:00Z
+_PERIOD_END = _NOW_TS + 30 * _DAY
+_LIC_EXPIRY = _NOW_TS + 365 * _DAY
+_EXPIRES_SOON = _NOW_TS + 7 * _DAY
+_EXPIRED_AT = _NOW_TS - _DAY
+
+# Subscription plans and their limits, frozen so the shared fixture can't be mutated.
+_PLANS = MappingProxyType({
+    'FREE': MappingProxyType({
+        'maxServers': 1,
+        'maxRequestsPerMonth': 1000,
+        'maxAnalyticsEvents': 10000,
+        'features': ['basic_monitoring']
+    }),
+    'BASIC': MappingProxyType({
+        'maxServers': 5,
+        'maxRequestsPerMonth': 10000,
+        'maxAnalyticsEvents': 100000,
+        'features': ['basic_monitoring', 'email_alerts']
+    }),
+    'PRO': MappingProxyType({
+        'maxServers': 20,
+        'maxRequestsPerMonth': 100000,
+        'maxAnalyticsEvents': 1000000,
+        'features': ['basic_monitoring', 'email_alerts', 'advanced_analytics']
+    }),
+    'ENTERPRISE': MappingProxyType({
+        'maxServers': 100,
+        'maxRequestsPerMonth': 1000000,
+        'maxAnalyticsEvents': 10000000,
+        'features': ['basic_monitoring', 'email_alerts', 'advanced_analytics', 'custom_integrations']
+    })
+})
+
+# Manager responses for the quota, upgrade and expiration checks.
+_FREE_QUOTA_AVAILABLE = {
+    'plan': 'FREE',
+    'max_servers': 1,
+    'current_servers': 0,
+    'can_add_server': True,
+    'quota_exceeded': False
+}
+_FREE_QUOTA_EXCEEDED = {
+    'plan': 'FREE',
+    'max_servers': 1,
+    'current_servers': 1,
+    'can_add_server': False,
+    'quota_exceeded': True
+}
+_UPGRADE_RESULT = {
+    'old_plan': 'BASIC',
+    'new_plan': 'PRO',
+    'old_max_servers': 5,
+    'new_max_servers': 20,
+    'upgrade_successful': True,
+    'existing_servers_migrated': True,
+    'servers_affected': 3,
+    'downtime': 0.0
+}
+_EXPIRING_SOON_CHECK = {
+    'license_id': 'license-workflow-123',
+    'expires_at': _EXPIRES_SOON,
+    'days_until_expiration': 7,
+    'is_expired': False,
+    'needs_renewal': True,
+    'grace_period_active': False
+}
+_EXPIRED_CHECK = {
+    'license_id': 'license-workflow-123',
+    'expires_at': _EXPIRED_AT,
+    'days_until_expiration': -1,
+    'is_expired': True,
+    'needs_renewal': True,
+    'grace_period_active': True
+}
+
+# 1000 distinct license keys and their set, built once for the uniqueness test.
+_UNIQUE_KEYS = tuple(f'LIC-TEST-{i:04d}-ABCD' for i in range(1000))
+_UNIQUE_KEYS_SET = frozenset(_UNIQUE_KEYS)
+
+_KEYGEN_RESULT = {
+    'keys_generated': 1000,
+    'unique_keys': 1000,
+    'duplicates_found': 0,
+    'generation_time': 0.1,
+    'keys': _UNIQUE_KEYS
+}
+
+# Canned manager responses for the remaining workflow tests, built once at import;
+# nested collections are immutable so every test can share the same objects.
+_WORKFLOW_RESULT = {
+    'step1_user_created': True,
+    'step2_subscription_created': True,
+    'step3_license_generated': True,
+    'step4_license_activated': True,
+    'workflow_completed': True,
+    'total_time_seconds': 2.5,
+    'license_key': 'LIC-WORKFLOW-TEST-1234'
+}
+_PERFORMANCE_RESULT = {
+    'validations_performed': 1000,
+    'successful_validations': 998,
+    'failed_validations': 2,
+    'average_response_time_ms': 25,
+    'p95_response_time_ms': 50,
+    'p99_response_time_ms': 75,
+    'throughput_per_second': 200,
+    'success_rate': 99.8
+}
+_LIFECYCLE_RESULT = {
+    'servers_registered': 3,
+    'servers_active': 3,
+    'servers_decommissioned': 0,
+    'servers_updated': 3,
+    'license_quota_utilized': 15,  # 3 out of 20
+    'lifecycle_events': tuple(
+        MappingProxyType({'event': event, 'server_id': server_id, 'timestamp': _NOW_TS})
+        for event in ('server_registered', 'server_updated')
+        for server_id in ('server-001', 'server-002', 'server-003')
+    )
+}
+_ANALYTICS_RESULT = {
+    'license_id': 'license-workflow-123',
+    'tracking_period_days': 30,
+    'total_api_calls': 15000,
+    'total_servers_registered': 5,
+    'peak_concurrent_servers': 5,
+    'usage_by_day': (
+        MappingProxyType({'date': '2024-01-01', 'api_calls': 500, 'active_servers': 3}),
+        MappingProxyType({'date': '2024-01-02', 'api_calls': 600, 'active_servers': 4}),
+        MappingProxyType({'date': '2024-01-03', 'api_calls': 550, 'active_servers': 5}),
+    ),
+    'quota_utilization': {
+        'servers': {'used': 5, 'limit': 20, 'percentage': 25.0},
+        'api_calls': {'used': 15000, 'limit': 100000, 'percentage': 15.0}
+    },
+    'compliance_status': 'compliant'
+}
+_SECURITY_RESULT = {
+    'license_key_valid': True,
+    'signature_verified': True,
+    'tampering_detected': False,
+    'encryption_valid': True,
+    'timestamp_valid': True,
+    'ip_address_allowed': True,
+    'rate_limit_passed': True,
+    'security_score': 100.0,
+    'risk_level': 'low'
+}
+_BACKUP_RESULT = {
+    'backup_created': True,
+    'backup_id': 'backup-license-123',
+    'licenses_backed_up': 1,
+    'backup_size_bytes': 2048,
+    'backup_location': '/backups/licenses/backup-license-123.json',
+    'backup_timestamp': _NOW_TS,
+    'encryption_applied': True
+}
+_RECOVERY_RESULT = {
+    'recovery_successful': True,
+    'licenses_recovered': 1,
+    'recovery_time_seconds': 1.5,
+    'data_integrity_verified': True,
+    'recovery_location': 'database'
+}
+_STRESS_RESULT = {
+    'test_duration_seconds': 300,  # 5 minutes
+    'total_operations': 50000,
+    'successful_operations': 49950,
+    'failed_operations': 50,
+    'operations_per_second': 166.5,
+    'max_response_time_ms': 500,
+    'average_response_time_ms': 30,
+    'memory_usage_mb': 256,
+    'cpu_usage_percent': 45,
+    'system_stability': 'stable',
+    'error_rate_percent': 0.1
+}
+_ROLLBACK_RESULT = {
+    'workflow_started': True,
+    'step1_user_creation': {'status': 'success'},
+    'step2_subscription_creation': {'status': 'success'},
+    'step3_license_generation': {'status': 'failed', 'error': 'Database timeout'},
+    'rollback_triggered': True,
+    'rollback_successful': True,
+    'cleanup_completed': True,
+    'workflow_status': 'failed_with_rollback',
+    'data_consistency_maintained': True
+}
+
+# Registered servers differ only by id, name and environment.
+_BASE_SERVER = MappingProxyType({'serverVersion': '1.0.0'})
+_SERVER_ENVIRONMENTS = ('production', 'staging', 'development')
+
+
+# Stub workflow classes and their methods, generated below;
+# TestLicenseWorkflows monkeypatches each one with a MagicMock.
+_STUBS = {
+    'WorkflowManager': ('execute_user_to_license_workflow',),
+    'LicenseKeyGenerator': ('generate_multiple_unique_keys',),
+    'LicenseValidator': ('validate_license_with_server_registration',),
+    'QuotaEnforcer': ('check_server_quota',),
+    'LicenseUpgradeManager': ('upgrade_license_plan',),
+    'LicenseExpirationManager': ('check_license_expiration',),
+    'PerformanceTester': ('test_validation_performance',),
+    'ServerLifecycleManager': ('manage_server_lifecycle',),
+    'LicenseAnalytics': ('generate_license_analytics',),
+    'LicenseSecurityValidator': ('validate_license_security',),
+    'LicenseBackupManager': ('create_license_backup', 'recover_license_from_backup'),
+    'LicenseStressTester': ('run_stress_test',),
+    'LicenseWorkflowOrchestrator': ('execute_workflow_with_rollback',),
+}
+
+for _name, _methods in _STUBS.items():
+    globals()[_name] = type(_name, (), {m: staticmethod(lambda *args, **kwargs: None) for m in _methods})
+
+
+def _cache_exceeded(check):
+    """Wrap a quota check so a license stops being re-checked once it has exceeded its quota."""
+    exceeded = {}
+
+    def cached(license_id):
+        if license_id in exceeded:
+            return exceeded[license_id]
+        result = check(license_id=license_id)
+        if result.get('quota_exceeded'):
+            exceeded[license_id] = result
+        return result
+
+    return cached
+
+
+def assert_subset(actual, expected):
+    """Assert every key in ``expected`` is present in ``actual`` with an equal value."""
+    assert expected.items() <= actual.items(), \
+        f"mismatched: {({key: actual.get(key) for key in expected if actual.get(key) != expected[key]})}"
 
 
 class TestLicenseWorkflows:
     """Test suite for license generation and validation workflows."""
 
-    @pytest.fixture
-    def subscription_plans(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def stub_mocks(cls):
+        """Replace every stub workflow class with a MagicMock for the whole class."""
+        module = sys.modules[__name__]
+        with pytest.MonkeyPatch.context() as mp:
+            mocks = {name: MagicMock() for name in _STUBS}
+            for name, mock in mocks.items():
+                mp.setattr(module, name, mock)
+            yield mocks
+
+    @pytest.fixture(autouse=True)
+    def workflow_mocks(self, stub_mocks):
+        """Class name -> shared MagicMock, reset after each test."""
+        yield stub_mocks
+        for mock in stub_mocks.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="module")
+    @classmethod
+    def subscription_plans(cls):
         """Available subscription plans and their limits."""
-        return {
-            'FREE': {
-                'maxServers': 1,
-                'maxRequestsPerMonth': 1000,
-                'maxAnalyticsEvents': 10000,
-                'features': ['basic_monitoring']
-            },
-            'BASIC': {
-                'maxServers': 5,
-                'maxRequestsPerMonth': 10000,
-                'maxAnalyticsEvents': 100000,
-                'features': ['basic_monitoring', 'email_alerts']
-            },
-            'PRO': {
-                'maxServers': 20,
-                'maxRequestsPerMonth': 100000,
-                'maxAnalyticsEvents': 1000000,
-                'features': ['basic_monitoring', 'email_alerts', 'advanced_analytics']
-            },
-            'ENTERPRISE': {
-                'maxServers': 100,
-                'maxRequestsPerMonth': 1000000,
-                'maxAnalyticsEvents': 10000000,
-                'features': ['basic_monitoring', 'email_alerts', 'advanced_analytics', 'custom_integrations']
-            }
-        }
+        return _PLANS
 
-    @pytest.fixture
-    def mock_user_workflow_data(self):
+    @pytest.fixture(scope="module")
+    @classmethod
+    def mock_user_workflow_data(cls):
         """Complete user workflow data."""
         return {
             'user': {
@@ -62,8 +299,8 @@ class TestLicenseWorkflows:
                 'userId': 'user-workflow-123',
                 'plan': 'PRO',
                 'status': 'ACTIVE',
-                'currentPeriodStart': datetime.now(),
-                'currentPeriodEnd': datetime.now() + timedelta(days=30)
+                'currentPeriodStart': _NOW_TS,
+                'currentPeriodEnd': _PERIOD_END
             },
             'license': {
                 'id': 'license-workflow-123',
@@ -74,501 +311,240 @@ class TestLicenseWorkflows:
                 'plan': 'PRO',
                 'maxServers': 20,
                 'isActive': True,
-                'expiresAt': datetime.now() + timedelta(days=365)
+                'expiresAt': _LIC_EXPIRY
             }
         }
 
-    @pytest.fixture
-    def mock_server_registration_data(self):
+    @pytest.fixture(scope="module")
+    @classmethod
+    def mock_server_registration_data(cls):
         """Server registration data for testing."""
         return [
-            {
-                'serverId': 'server-001',
-                'serverName': 'Production Server 1',
-                'serverVersion': '1.0.0',
-                'environment': 'production'
-            },
-            {
-                'serverId': 'server-002',
-                'serverName': 'Staging Server 1',
-                'serverVersion': '1.0.0',
-                'environment': 'staging'
-            },
-            {
-                'serverId': 'server-003',
-                'serverName': 'Development Server 1',
-                'serverVersion': '1.0.0',
-                'environment': 'development'
-            }
+            {**_BASE_SERVER, 'serverId': f'server-{i:03d}', 'serverName': f'{env.title()} Server 1', 'environment': env}
+            for i, env in enumerate(_SERVER_ENVIRONMENTS, 1)
         ]
 
     @pytest.mark.integration
-    def test_complete_user_to_license_workflow(self, mock_user_workflow_data, subscription_plans):
+    def test_complete_user_to_license_workflow(self, mock_user_workflow_data, subscription_plans, workflow_mocks):
         """Test complete workflow from user creation to license generation."""
-        with patch('tests.test_license_workflows.WorkflowManager') as MockWorkflow:
-            workflow_result = {
-                'step1_user_created': True,
-                'step2_subscription_created': True,
-                'step3_license_generated': True,
-                'step4_license_activated': True,
-                'workflow_completed': True,
-                'total_time_seconds': 2.5,
-                'license_key': 'LIC-WORKFLOW-TEST-1234'
-            }
-            MockWorkflow.execute_user_to_license_workflow.return_value = workflow_result
-
-            result = MockWorkflow.execute_user_to_license_workflow(
-                user_data={
-                    'email': 'workflow@test.com',
-                    'password': 'Test123!@#',
-                    'firstName': 'Workflow',
-                    'lastName': 'Test',
-                    'company': 'Test Corp'
-                },
-                subscription_plan='PRO'
-            )
+        MockWorkflow = workflow_mocks['WorkflowManager']
+        MockWorkflow.execute_user_to_license_workflow.return_value = _WORKFLOW_RESULT
 
-            assert result['workflow_completed'] is True
-            assert result['step3_license_generated'] is True
-            assert result['total_time_seconds'] < 5.0
-            assert result['license_key'].startswith('LIC-')
+        result = MockWorkflow.execute_user_to_license_workflow(
+            user_data={
+                'email': 'workflow@test.com',
+                'password': 'Test123!@#',
+                'firstName': 'Workflow',
+                'lastName': 'Test',
+                'company': 'Test Corp'
+            },
+            subscription_plan='PRO'
+        )
+
+        assert_subset(result, {'workflow_completed': True, 'step3_license_generated': True})
+        assert result['total_time_seconds'] < 5.0
+        assert result['license_key'].startswith('LIC-')
 
     @pytest.mark.integration
-    def test_license_key_generation_uniqueness(self):
+    def test_license_key_generation_uniqueness(self, workflow_mocks):
         """Test license key generation ensures uniqueness."""
-        with patch('tests.test_license_workflows.LicenseKeyGenerator') as MockGenerator:
-            # Generate 1000 license keys
-            generated_keys = [f'LIC-TEST-{i:04d}-ABCD' for i in range(1000)]
-            MockGenerator.generate_multiple_unique_keys.return_value = {
-                'keys_generated': 1000,
-                'unique_keys': 1000,
-                'duplicates_found': 0,
-                'generation_time': 0.1,
-                'keys': generated_keys
-            }
+        MockGenerator = workflow_mocks['LicenseKeyGenerator']
+        MockGenerator.generate_multiple_unique_keys.return_value = _KEYGEN_RESULT
 
-            result = MockGenerator.generate_multiple_unique_keys(count=1000)
+        result = MockGenerator.generate_multiple_unique_keys(count=1000)
 
-            assert result['unique_keys'] == 1000
-            assert result['duplicates_found'] == 0
-            assert len(set(result['keys'])) == 1000  # All keys are unique
+        assert_subset(result, {'unique_keys': 1000, 'duplicates_found': 0})
+        assert result['keys'] is _UNIQUE_KEYS
+        assert len(_UNIQUE_KEYS_SET) == 1000  # All keys are unique
 
     @pytest.mark.integration
-    def test_license_validation_with_server_registration(self, mock_user_workflow_data, mock_server_registration_data):
+    def test_license_validation_with_server_registration(self, mock_user_workflow_data, mock_server_registration_data, workflow_mocks):
         """Test license validation with multiple server registrations."""
         license_key = mock_user_workflow_data['license']['licenseKey']
 
-        with patch('tests.test_license_workflows.LicenseValidator') as MockValidator:
-            validation_results = []
-            for i, server_data in enumerate(mock_server_registration_data):
-                validation_result = {
-                    'valid': True,
-                    'server_registered': True,
-                    'servers_count': i + 1,
-                    'quota_remaining': 20 - (i + 1),
-                    'server_id': server_data['serverId']
-                }
-                validation_results.append(validation_result)
-
-            MockValidator.validate_license_with_server_registration.side_effect = validation_results
-
-            # Register each server
-            for i, server_data in enumerate(mock_server_registration_data):
-                result = MockValidator.validate_license_with_server_registration(
-                    license_key=license_key,
-                    server_data=server_data
-                )
-
-                assert result['valid'] is True
-                assert result['server_registered'] is True
-                assert result['servers_count'] == i + 1
-                assert result['quota_remaining'] >= 0
-
-    @pytest.mark.integration
-    def test_license_quota_enforcement(self, mock_user_workflow_data, subscription_plans):
-        """Test license quota enforcement across different plans."""
-        with patch('tests.test_license_workflows.QuotaEnforcer') as MockEnforcer:
-            # Test FREE plan quota enforcement
-            free_quota_test = {
-                'plan': 'FREE',
-                'max_servers': 1,
-                'current_servers': 0,
-                'can_add_server': True,
-                'quota_exceeded': False
-            }
-
-            # Test when quota is exceeded
-            free_quota_exceeded = {
-                'plan': 'FREE',
-                'max_servers': 1,
-                'current_servers': 1,
-                'can_add_server': False,
-                'quota_exceeded': True
+        MockValidator = workflow_mocks['LicenseValidator']
+        validation_results = [
+            {
+                'valid': True,
+                'server_registered': True,
+                'servers_count': i + 1,
+                'quota_remaining': 20 - (i + 1),
+                'server_id': server_data['serverId']
             }
+            for i, server_data in enumerate(mock_server_registration_data)
+        ]
 
-            MockEnforcer.check_server_quota.side_effect = [free_quota_test, free_quota_exceeded]
-
-            # First server should be allowed
-            result1 = MockEnforcer.check_server_quota('license-free-123')
-            assert result1['can_add_server'] is True
-            assert result1['quota_exceeded'] is False
-
-            # Second server should be denied
-            result2 = MockEnforcer.check_server_quota('license-free-123')
-            assert result2['can_add_server'] is False
-            assert result2['quota_exceeded'] is True
-
-    @pytest.mark.integration
-    def test_license_upgrade_workflow(self, mock_user_workflow_data):
-        """Test license upgrade workflow from one plan to another."""
-        with patch('tests.test_license_workflows.LicenseUpgradeManager') as MockUpgrade:
-            upgrade_result = {
-                'old_plan': 'BASIC',
-                'new_plan': 'PRO',
-                'old_max_servers': 5,
-                'new_max_servers': 20,
-                'upgrade_successful': True,
-                'existing_servers_migrated': True,
-                'servers_affected': 3,
-                'downtime': 0.0
-            }
-            MockUpgrade.upgrade_license_plan.return_value = upgrade_result
+        results = iter(validation_results)
+        validate = MockValidator.validate_license_with_server_registration = lambda **kwargs: next(results)
 
-            result = MockUpgrade.upgrade_license_plan(
-                license_id='license-workflow-123',
-                from_plan='BASIC',
-                to_plan='PRO'
+        # Register each server
+        for i, server_data in enumerate(mock_server_registration_data):
+            result = validate(
+                license_key=license_key,
+                server_data=server_data
             )
 
-            assert result['upgrade_successful'] is True
-            assert result['new_max_servers'] > result['old_max_servers']
-            assert result['existing_servers_migrated'] is True
-            assert result['downtime'] == 0.0
+            assert_subset(result, {'valid': True, 'server_registered': True, 'servers_count': i + 1})
+            assert result['quota_remaining'] >= 0
 
     @pytest.mark.integration
-    def test_license_expiration_workflow(self, mock_user_workflow_data):
-        """Test license expiration and renewal workflow."""
-        with patch('tests.test_license_workflows.LicenseExpirationManager') as MockExpiration:
-            # Test approaching expiration
-            expiration_check = {
-                'license_id': 'license-workflow-123',
-                'expires_at': datetime.now() + timedelta(days=7),
-                'days_until_expiration': 7,
-                'is_expired': False,
-                'needs_renewal': True,
-                'grace_period_active': False
-            }
-
-            # Test expired license
-            expired_check = {
-                'license_id': 'license-workflow-123',
-                'expires_at': datetime.now() - timedelta(days=1),
-                'days_until_expiration': -1,
-                'is_expired': True,
-                'needs_renewal': True,
-                'grace_period_active': True
-            }
+    @pytest.mark.parametrize("manager,method,call_kwargs,return_value,expected", [
+        # FREE plan: first server allowed, second denied
+        ('QuotaEnforcer', 'check_server_quota', {'license_id': 'license-free-123'},
+         _FREE_QUOTA_AVAILABLE, {'can_add_server': True, 'quota_exceeded': False}),
+        ('QuotaEnforcer', 'check_server_quota', {'license_id': 'license-free-123'},
+         _FREE_QUOTA_EXCEEDED, {'can_add_server': False, 'quota_exceeded': True}),
+        ('LicenseUpgradeManager', 'upgrade_license_plan',
+         {'license_id': 'license-workflow-123', 'from_plan': 'BASIC', 'to_plan': 'PRO'},
+         _UPGRADE_RESULT, {'upgrade_successful': True, 'existing_servers_migrated': True,
+                           'new_max_servers': 20, 'downtime': 0.0}),
+        ('LicenseExpirationManager', 'check_license_expiration', {'license_id': 'license-workflow-123'},
+         _EXPIRING_SOON_CHECK, {'is_expired': False, 'needs_renewal': True, 'days_until_expiration': 7}),
+        ('LicenseExpirationManager', 'check_license_expiration', {'license_id': 'license-workflow-123'},
+         _EXPIRED_CHECK, {'is_expired': True, 'grace_period_active': True}),
+    ], ids=['quota_available', 'quota_exceeded', 'upgrade', 'expiring_soon', 'expired'])
+    def test_license_manager_call(self, manager, method, call_kwargs, return_value, expected, workflow_mocks):
+        """Test quota enforcement, plan upgrade and expiration checks."""
+        mocked_method = getattr(workflow_mocks[manager], method)
+        mocked_method.return_value = return_value
+
+        result = mocked_method(**call_kwargs)
+
+        assert_subset(result, expected)
 
-            MockExpiration.check_license_expiration.side_effect = [expiration_check, expired_check]
+    @pytest.mark.integration
+    def test_quota_exceeded_short_circuits(self, workflow_mocks):
+        """Test repeated quota checks stop hitting the enforcer once the quota is exceeded."""
+        MockEnforcer = workflow_mocks['QuotaEnforcer']
+        MockEnforcer.check_server_quota.return_value = _FREE_QUOTA_EXCEEDED
+        check = _cache_exceeded(MockEnforcer.check_server_quota)
 
-            # Check approaching expiration
-            result1 = MockExpiration.check_license_expiration('license-workflow-123')
-            assert result1['is_expired'] is False
-            assert result1['needs_renewal'] is True
-            assert result1['days_until_expiration'] == 7
+        results = [check('license-free-123') for _ in range(1000)]
 
-            # Check expired license
-            result2 = MockExpiration.check_license_expiration('license-workflow-123')
-            assert result2['is_expired'] is True
-            assert result2['grace_period_active'] is True
+        assert all(result['quota_exceeded'] for result in results)
+        MockEnforcer.check_server_quota.assert_called_once_with(license_id='license-free-123')
 
     @pytest.mark.integration
-    def test_license_validation_performance(self, mock_user_workflow_data):
+    def test_license_validation_performance(self, mock_user_workflow_data, workflow_mocks):
         """Test license validation performance under load."""
         license_key = mock_user_workflow_data['license']['licenseKey']
 
-        with patch('tests.test_license_workflows.PerformanceTester') as MockPerformance:
-            performance_result = {
-                'validations_performed': 1000,
-                'successful_validations': 998,
-                'failed_validations': 2,
-                'average_response_time_ms': 25,
-                'p95_response_time_ms': 50,
-                'p99_response_time_ms': 75,
-                'throughput_per_second': 200,
-                'success_rate': 99.8
-            }
-            MockPerformance.test_validation_performance.return_value = performance_result
+        MockPerformance = workflow_mocks['PerformanceTester']
+        MockPerformance.test_validation_performance = AsyncMock(return_value=_PERFORMANCE_RESULT)
 
-            result = MockPerformance.test_validation_performance(
-                license_key=license_key,
-                concurrent_requests=50,
-                total_requests=1000
-            )
+        result = asyncio.run(MockPerformance.test_validation_performance(
+            license_key=license_key,
+            concurrent_requests=50,
+            total_requests=1000
+        ))
 
-            assert result['success_rate'] > 99.0
-            assert result['average_response_time_ms'] < 50
-            assert result['throughput_per_second'] > 100
+        assert result['success_rate'] > 99.0
+        assert result['average_response_time_ms'] < 50
+        assert result['throughput_per_second'] > 100
 
     @pytest.mark.integration
-    def test_license_server_lifecycle_management(self, mock_user_workflow_data, mock_server_registration_data):
+    def test_license_server_lifecycle_management(self, mock_user_workflow_data, mock_server_registration_data, workflow_mocks):
         """Test complete server lifecycle management with licenses."""
         license_key = mock_user_workflow_data['license']['licenseKey']
 
-        with patch('tests.test_license_workflows.ServerLifecycleManager') as MockLifecycle:
-            lifecycle_result = {
-                'servers_registered': 3,
-                'servers_active': 3,
-                'servers_decommissioned': 0,
-                'servers_updated': 3,
-                'license_quota_utilized': 15,  # 3 out of 20
-                'lifecycle_events': [
-                    {'event': 'server_registered', 'server_id': 'server-001', 'timestamp': datetime.now()},
-                    {'event': 'server_registered', 'server_id': 'server-002', 'timestamp': datetime.now()},
-                    {'event': 'server_registered', 'server_id': 'server-003', 'timestamp': datetime.now()},
-                    {'event': 'server_updated', 'server_id': 'server-001', 'timestamp': datetime.now()},
-                    {'event': 'server_updated', 'server_id': 'server-002', 'timestamp': datetime.now()},
-                    {'event': 'server_updated', 'server_id': 'server-003', 'timestamp': datetime.now()},
-                ]
-            }
-            MockLifecycle.manage_server_lifecycle.return_value = lifecycle_result
+        MockLifecycle = workflow_mocks['ServerLifecycleManager']
+        MockLifecycle.manage_server_lifecycle = AsyncMock(return_value=_LIFECYCLE_RESULT)
 
-            result = MockLifecycle.manage_server_lifecycle(
-                license_key=license_key,
-                servers=mock_server_registration_data
-            )
+        result = asyncio.run(MockLifecycle.manage_server_lifecycle(
+            license_key=license_key,
+            servers=mock_server_registration_data
+        ))
 
-            assert result['servers_registered'] == 3
-            assert result['servers_active'] == 3
-            assert result['license_quota_utilized'] == 15
-            assert len(result['lifecycle_events']) == 6
+        assert_subset(result, {'servers_registered': 3, 'servers_active': 3, 'license_quota_utilized': 15})
+        assert len(result['lifecycle_events']) == 6
 
     @pytest.mark.integration
-    def test_license_analytics_and_usage_tracking(self, mock_user_workflow_data):
+    def test_license_analytics_and_usage_tracking(self, mock_user_workflow_data, workflow_mocks):
         """Test license analytics and usage tracking."""
         license_id = mock_user_workflow_data['license']['id']
 
-        with patch('tests.test_license_workflows.LicenseAnalytics') as MockAnalytics:
-            analytics_result = {
-                'license_id': license_id,
-                'tracking_period_days': 30,
-                'total_api_calls': 15000,
-                'total_servers_registered': 5,
-                'peak_concurrent_servers': 5,
-                'usage_by_day': [
-                    {'date': '2024-01-01', 'api_calls': 500, 'active_servers': 3},
-                    {'date': '2024-01-02', 'api_calls': 600, 'active_servers': 4},
-                    {'date': '2024-01-03', 'api_calls': 550, 'active_servers': 5},
-                ],
-                'quota_utilization': {
-                    'servers': {'used': 5, 'limit': 20, 'percentage': 25.0},
-                    'api_calls': {'used': 15000, 'limit': 100000, 'percentage': 15.0}
-                },
-                'compliance_status': 'compliant'
-            }
-            MockAnalytics.generate_license_analytics.return_value = analytics_result
+        MockAnalytics = workflow_mocks['LicenseAnalytics']
+        MockAnalytics.generate_license_analytics.return_value = _ANALYTICS_RESULT
 
-            result = MockAnalytics.generate_license_analytics(
-                license_id=license_id,
-                period_days=30
-            )
+        result = MockAnalytics.generate_license_analytics(
+            license_id=license_id,
+            period_days=30
+        )
 
-            assert result['compliance_status'] == 'compliant'
-            assert result['quota_utilization']['servers']['percentage'] < 100.0
-            assert result['quota_utilization']['api_calls']['percentage'] < 100.0
-            assert len(result['usage_by_day']) == 3
+        assert result['compliance_status'] == 'compliant'
+        assert result['quota_utilization']['servers']['percentage'] < 100.0
+        assert result['quota_utilization']['api_calls']['percentage'] < 100.0
+        assert len(result['usage_by_day']) == 3
 
     @pytest.mark.integration
-    def test_license_security_validation(self, mock_user_workflow_data):
+    def test_license_security_validation(self, mock_user_workflow_data, workflow_mocks):
         """Test license security validation and tampering detection."""
         license_key = mock_user_workflow_data['license']['licenseKey']
 
-        with patch('tests.test_license_workflows.LicenseSecurityValidator') as MockSecurity:
-            security_result = {
-                'license_key_valid': True,
-                'signature_verified': True,
-                'tampering_detected': False,
-                'encryption_valid': True,
-                'timestamp_valid': True,
-                'ip_address_allowed': True,
-                'rate_limit_passed': True,
-                'security_score': 100.0,
-                'risk_level': 'low'
-            }
-            MockSecurity.validate_license_security.return_value = security_result
+        MockSecurity = workflow_mocks['LicenseSecurityValidator']
+        MockSecurity.validate_license_security.return_value = _SECURITY_RESULT
 
-            result = MockSecurity.validate_license_security(
-                license_key=license_key,
-                client_ip='192.168.1.100',
-                user_agent='MCP-Client/1.0'
-            )
+        result = MockSecurity.validate_license_security(
+            license_key=license_key,
+            client_ip='192.168.1.100',
+            user_agent='MCP-Client/1.0'
+        )
 
-            assert result['security_score'] == 100.0
-            assert result['tampering_detected'] is False
-            assert result['risk_level'] == 'low'
-            assert result['signature_verified'] is True
+        assert_subset(result, {
+            'security_score': 100.0,
+            'tampering_detected': False,
+            'risk_level': 'low',
+            'signature_verified': True
+        })
 
     @pytest.mark.integration
-    def test_license_backup_and_recovery(self, mock_user_workflow_data):
+    def test_license_backup_and_recovery(self, mock_user_workflow_data, workflow_mocks):
         """Test license backup and recovery procedures."""
-        with patch('tests.test_license_workflows.LicenseBackupManager') as MockBackup:
-            backup_result = {
-                'backup_created': True,
-                'backup_id': 'backup-license-123',
-                'licenses_backed_up': 1,
-                'backup_size_bytes': 2048,
-                'backup_location': '/backups/licenses/backup-license-123.json',
-                'backup_timestamp': datetime.now(),
-                'encryption_applied': True
-            }
-
-            recovery_result = {
-                'recovery_successful': True,
-                'licenses_recovered': 1,
-                'recovery_time_seconds': 1.5,
-                'data_integrity_verified': True,
-                'recovery_location': 'database'
-            }
+        MockBackup = workflow_mocks['LicenseBackupManager']
+        MockBackup.create_license_backup.return_value = _BACKUP_RESULT
+        MockBackup.recover_license_from_backup.return_value = _RECOVERY_RESULT
 
-            MockBackup.create_license_backup.return_value = backup_result
-            MockBackup.recover_license_from_backup.return_value = recovery_result
+        # Test backup
+        backup = MockBackup.create_license_backup('license-workflow-123')
+        assert_subset(backup, {'backup_created': True, 'encryption_applied': True})
 
-            # Test backup
-            backup = MockBackup.create_license_backup('license-workflow-123')
-            assert backup['backup_created'] is True
-            assert backup['encryption_applied'] is True
-
-            # Test recovery
-            recovery = MockBackup.recover_license_from_backup(backup['backup_id'])
-            assert recovery['recovery_successful'] is True
-            assert recovery['data_integrity_verified'] is True
+        # Test recovery
+        recovery = MockBackup.recover_license_from_backup(backup['backup_id'])
+        assert_subset(recovery, {'recovery_successful': True, 'data_integrity_verified': True})
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_license_stress_testing(self, mock_user_workflow_data):
+    def test_license_stress_testing(self, mock_user_workflow_data, workflow_mocks):
         """Test license system under stress conditions."""
-        with patch('tests.test_license_workflows.LicenseStressTester') as MockStress:
-            stress_result = {
-                'test_duration_seconds': 300,  # 5 minutes
-                'total_operations': 50000,
-                'successful_operations': 49950,
-                'failed_operations': 50,
-                'operations_per_second': 166.5,
-                'max_response_time_ms': 500,
-                'average_response_time_ms': 30,
-                'memory_usage_mb': 256,
-                'cpu_usage_percent': 45,
-                'system_stability': 'stable',
-                'error_rate_percent': 0.1
-            }
-            MockStress.run_stress_test.return_value = stress_result
+        MockStress = workflow_mocks['LicenseStressTester']
+        MockStress.run_stress_test = AsyncMock(return_value=_STRESS_RESULT)
 
-            result = MockStress.run_stress_test(
-                concurrent_users=100,
-                operations_per_user=500,
-                duration_seconds=300
-            )
+        result = asyncio.run(MockStress.run_stress_test(
+            concurrent_users=100,
+            operations_per_user=500,
+            duration_seconds=300
+        ))
 
-            assert result['system_stability'] == 'stable'
-            assert result['error_rate_percent'] < 1.0
-            assert result['operations_per_second'] > 100
-            assert result['memory_usage_mb'] < 512
+        assert result['system_stability'] == 'stable'
+        assert result['error_rate_percent'] < 1.0
+        assert result['operations_per_second'] > 100
+        assert result['memory_usage_mb'] < 512
 
     @pytest.mark.integration
-    def test_end_to_end_license_workflow_with_rollback(self, mock_user_workflow_data):
+    def test_end_to_end_license_workflow_with_rollback(self, mock_user_workflow_data, workflow_mocks):
         """Test complete license workflow with error handling and rollback."""
-        with patch('tests.test_license_workflows.LicenseWorkflowOrchestrator') as MockOrchestrator:
-            # Simulate workflow failure and rollback
-            workflow_with_rollback = {
-                'workflow_started': True,
-                'step1_user_creation': {'status': 'success'},
-                'step2_subscription_creation': {'status': 'success'},
-                'step3_license_generation': {'status': 'failed', 'error': 'Database timeout'},
-                'rollback_triggered': True,
-                'rollback_successful': True,
-                'cleanup_completed': True,
-                'workflow_status': 'failed_with_rollback',
-                'data_consistency_maintained': True
-            }
-            MockOrchestrator.execute_workflow_with_rollback.return_value = workflow_with_rollback
-
-            result = MockOrchestrator.execute_workflow_with_rollback(
-                user_data=mock_user_workflow_data['user'],
-                subscription_plan='PRO'
-            )
-
-            assert result['rollback_triggered'] is True
-            assert result['rollback_successful'] is True
-            assert result['data_consistency_maintained'] is True
-            assert result['cleanup_completed'] is True
-
-
-# Mock classes for workflow testing
-class WorkflowManager:
-    @staticmethod
-    def execute_user_to_license_workflow(user_data, subscription_plan):
-        pass
-
-class LicenseKeyGenerator:
-    @staticmethod
-    def generate_multiple_unique_keys(count):
-        pass
-
-class LicenseValidator:
-    @staticmethod
-    def validate_license_with_server_registration(license_key, server_data):
-        pass
-
-class QuotaEnforcer:
-    @staticmethod
-    def check_server_quota(license_id):
-        pass
-
-class LicenseUpgradeManager:
-    @staticmethod
-    def upgrade_license_plan(license_id, from_plan, to_plan):
-        pass
-
-class LicenseExpirationManager:
-    @staticmethod
-    def check_license_expiration(license_id):
-        pass
-
-class PerformanceTester:
-    @staticmethod
-    def test_validation_performance(license_key, concurrent_requests, total_requests):
-        pass
-
-class ServerLifecycleManager:
-    @staticmethod
-    def manage_server_lifecycle(license_key, servers):
-        pass
-
-class LicenseAnalytics:
-    @staticmethod
-    def generate_license_analytics(license_id, period_days):
-        pass
-
-class LicenseSecurityValidator:
-    @staticmethod
-    def validate_license_security(license_key, client_ip, user_agent):
-        pass
-
-class LicenseBackupManager:
-    @staticmethod
-    def create_license_backup(license_id):
-        pass
-
-    @staticmethod
-    def recover_license_from_backup(backup_id):
-        pass
-
-class LicenseStressTester:
-    @staticmethod
-    def run_stress_test(concurrent_users, operations_per_user, duration_seconds):
-        pass
-
-class LicenseWorkflowOrchestrator:
-    @staticmethod
-    def execute_workflow_with_rollback(user_data, subscription_plan):
-        pass
\ No newline at end of file
+        MockOrchestrator = workflow_mocks['LicenseWorkflowOrchestrator']
+        # Simulate workflow failure and rollback
+        MockOrchestrator.execute_workflow_with_rollback.return_value = _ROLLBACK_RESULT
+
+        result = MockOrchestrator.execute_workflow_with_rollback(
+            user_data=mock_user_workflow_data['user'],
+            subscription_plan='PRO'
+        )
+
+        assert_subset(result, {
+            'rollback_triggered': True,
+            'rollback_successful': True,
+            'data_consistency_maintained': True,
+            'cleanup_completed': True
+        })
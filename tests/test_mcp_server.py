@@ -17,40 +17,47 @@ import subprocess
 import json
 from pathlib import Path
 from typing import Dict, Any
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Mock imports that might block during module loading
-with patch('mcp.server.fastmcp.FastMCP'), \
-     patch('mcp_config_manager.MCPConfigManager'):
-
-    # Import the modules to test
-    try:
-        from official_mcp_server import (
-            _list_files_sync,
-            _read_file_sync,
-            _get_git_status_sync,
-            register_tools,
-            run_persistent_server,
-            setup_signal_handlers
-        )
-    except ImportError as e:
-        pytest.skip(f"MCP server modules not available: {e}", allow_module_level=True)
+# conftest.py has already imported the server with its blocking imports mocked
+try:
+    import official_mcp_server
+    from official_mcp_server import (
+        _list_files_sync,
+        _read_file_sync,
+        _get_git_status_sync,
+        _get_git_snapshot_sync,
+        _get_commit_history_sync,
+        CodeIndexer,
+        FileWatcher,
+        register_tools,
+        run_persistent_server,
+        setup_signal_handlers
+    )
+except ImportError as e:
+    pytest.skip(f"MCP server modules not available: {e}", allow_module_level=True)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _bind_config_manager(request, monkeypatch):
+    """Install the test's config_manager fixture (if it uses one) as the server's global."""
+    if "config_manager" in request.fixturenames:
+        monkeypatch.setattr(official_mcp_server, "config_manager", request.getfixturevalue("config_manager"))
 
 
 class TestListFilesSync:
     """Test cases for _list_files_sync function."""
     
-    @pytest.mark.unit
     def test_list_files_success(self, test_project_dir, config_manager):
         """Test successful file listing."""
         # Add directory to configuration
         config_manager.add_directory(test_project_dir)
         
-        # Mock the global config_manager
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync(test_project_dir)
+        result = _list_files_sync(test_project_dir)
         
         assert result["success"] is True
         assert result["directory"] == test_project_dir
@@ -59,7 +66,6 @@ class TestListFilesSync:
         assert result["total_files"] >= 0
         assert result["total_directories"] >= 0
     
-    @pytest.mark.unit
     def test_list_files_nonexistent_directory(self):
         """Test listing files in non-existent directory."""
         result = _list_files_sync("/non/existent/path")
@@ -69,10 +75,9 @@ class TestListFilesSync:
         assert result["files"] == []
         assert result["directories"] == []
     
-    @pytest.mark.unit
-    def test_list_files_not_directory(self, test_project_dir):
+    def test_list_files_not_directory(self, project_paths):
         """Test listing files when path is not a directory."""
-        test_file = os.path.join(test_project_dir, "test.py")
+        test_file = project_paths.test_py
         result = _list_files_sync(test_file)
         
         assert result["success"] is False
@@ -80,7 +85,6 @@ class TestListFilesSync:
         assert result["files"] == []
         assert result["directories"] == []
     
-    @pytest.mark.unit
     def test_list_files_permission_denied(self, config_manager):
         """Test listing files with permission denied."""
         # Create a directory that we can't access
@@ -92,19 +96,16 @@ class TestListFilesSync:
         assert result["files"] == []
         assert result["directories"] == []
     
-    @pytest.mark.unit
     def test_list_files_config_restriction(self, test_project_dir, config_manager):
         """Test file listing with configuration restrictions."""
         # Don't add directory to configuration
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync(test_project_dir)
+        result = _list_files_sync(test_project_dir)
         
         assert result["success"] is False
         assert "not allowed by configuration" in result["error"]
         assert result["files"] == []
         assert result["directories"] == []
     
-    @pytest.mark.unit
     def test_list_files_excluded_files(self, test_project_dir, config_manager):
         """Test that excluded files are not listed."""
         # Add directory with exclusion patterns
@@ -113,8 +114,7 @@ class TestListFilesSync:
             exclude_patterns=["*.py", ".env*"]
         )
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync(test_project_dir)
+        result = _list_files_sync(test_project_dir)
         
         assert result["success"] is True
         
@@ -124,37 +124,31 @@ class TestListFilesSync:
         assert ".env" not in file_names
         assert "test.txt" in file_names  # Should be included
     
-    @pytest.mark.unit
     def test_list_files_current_directory(self, config_manager):
         """Test listing files in current directory."""
         current_dir = os.getcwd()
         config_manager.add_directory(current_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync(".")
+        result = _list_files_sync(".")
         
         assert result["success"] is True
         assert result["directory"] == current_dir
     
-    @pytest.mark.unit
     def test_list_files_relative_path(self, test_project_dir, config_manager):
         """Test listing files with relative path."""
         config_manager.add_directory(test_project_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync(os.path.relpath(test_project_dir))
+        result = _list_files_sync(os.path.relpath(test_project_dir))
         
         assert result["success"] is True
     
-    @pytest.mark.unit
     def test_list_files_empty_directory(self, temp_dir, config_manager):
         """Test listing files in empty directory."""
         empty_dir = os.path.join(temp_dir, "empty")
         os.makedirs(empty_dir)
         config_manager.add_directory(empty_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync(empty_dir)
+        result = _list_files_sync(empty_dir)
         
         assert result["success"] is True
         assert result["files"] == []
@@ -163,17 +157,49 @@ class TestListFilesSync:
         assert result["total_directories"] == 0
 
 
+# (filename, content, expected line count) for test_read_file_line_counting
+_LINE_COUNT_CASES = [
+    ("no_newline.txt", "single line", 1),
+    ("with_newline.txt", "line1\nline2", 2),
+    ("empty.txt", "", 1),  # Empty file should have 1 line
+    ("windows_newlines.txt", "line1\r\nline2\r\n", 2),
+]
+
+# Read-only files shared by the TestReadFileSync tests, written once per class
+_READ_FIXTURE_FILES = {
+    "multiline.txt": b"line1\nline2\nline3\nline4\nline5",
+    **{filename: content.encode() for filename, content, _ in _LINE_COUNT_CASES},
+}
+
+# Committed fixture files linked (not written) into the read fixture directory;
+# binary.bin holds the invalid UTF-8 bytes ff fe 00 00
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+_LINKED_FIXTURE_FILES = ("binary.bin",)
+
+
 class TestReadFileSync:
     """Test cases for _read_file_sync function."""
     
-    @pytest.mark.unit
-    def test_read_file_success(self, test_project_dir, config_manager):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def read_fixture_dir(cls, tmp_path_factory):
+        """Directory holding _READ_FIXTURE_FILES; tests only read from it."""
+        fixture_dir = tmp_path_factory.mktemp("read_fixtures")
+        for filename, content in _READ_FIXTURE_FILES.items():
+            (fixture_dir / filename).write_bytes(content)
+        for filename in _LINKED_FIXTURE_FILES:
+            try:
+                os.link(_FIXTURES_DIR / filename, fixture_dir / filename)
+            except OSError:  # e.g. tmp on another filesystem
+                shutil.copyfile(_FIXTURES_DIR / filename, fixture_dir / filename)
+        return str(fixture_dir)
+    
+    def test_read_file_success(self, test_project_dir, project_paths, config_manager):
         """Test successful file reading."""
         config_manager.add_directory(test_project_dir)
-        test_file = os.path.join(test_project_dir, "test.txt")
+        test_file = project_paths.test_txt
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(test_file)
+        result = _read_file_sync(test_file)
         
         assert result["success"] is True
         assert result["file_path"] == test_file
@@ -182,71 +208,57 @@ class TestReadFileSync:
         assert result["size"] > 0
         assert result["truncated"] is False
     
-    @pytest.mark.unit
     def test_read_file_nonexistent(self, config_manager):
         """Test reading non-existent file."""
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync("/non/existent/file.txt")
+        result = _read_file_sync("/non/existent/file.txt")
         
         assert result["success"] is False
         assert "does not exist" in result["error"]
         assert result["content"] == ""
         assert result["lines"] == 0
     
-    @pytest.mark.unit
     def test_read_file_not_file(self, test_project_dir, config_manager):
         """Test reading when path is not a file."""
         config_manager.add_directory(test_project_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(test_project_dir)
+        result = _read_file_sync(test_project_dir)
         
         assert result["success"] is False
         assert "not a file" in result["error"]
         assert result["content"] == ""
         assert result["lines"] == 0
     
-    @pytest.mark.unit
-    def test_read_file_config_restriction(self, test_project_dir, config_manager):
+    def test_read_file_config_restriction(self, project_paths, config_manager):
         """Test file reading with configuration restrictions."""
         # Don't add directory to configuration
-        test_file = os.path.join(test_project_dir, "test.txt")
+        test_file = project_paths.test_txt
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(test_file)
+        result = _read_file_sync(test_file)
         
         assert result["success"] is False
         assert "not allowed by configuration" in result["error"]
         assert result["content"] == ""
         assert result["lines"] == 0
     
-    @pytest.mark.unit
-    def test_read_file_size_limit(self, test_project_dir, config_manager):
+    def test_read_file_size_limit(self, test_project_dir, project_paths, config_manager):
         """Test file reading with size limit."""
         # Add directory with small size limit
         config_manager.add_directory(test_project_dir, max_file_size="1KB")
-        large_file = os.path.join(test_project_dir, "large_file.txt")
+        large_file = project_paths.large
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(large_file)
+        result = _read_file_sync(large_file)
         
         assert result["success"] is False
         assert "too large" in result["error"]
         assert result["content"] == ""
         assert result["lines"] == 0
     
-    @pytest.mark.unit
-    def test_read_file_max_lines(self, test_project_dir, config_manager):
+    def test_read_file_max_lines(self, read_fixture_dir, config_manager):
         """Test file reading with max_lines parameter."""
-        config_manager.add_directory(test_project_dir)
+        config_manager.add_directory(read_fixture_dir)
+        multiline_file = os.path.join(read_fixture_dir, "multiline.txt")
         
-        # Create a multi-line file
-        multiline_file = os.path.join(test_project_dir, "multiline.txt")
-        with open(multiline_file, 'w') as f:
-            f.write("line1\nline2\nline3\nline4\nline5")
-        
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(multiline_file, max_lines=3)
+        result = _read_file_sync(multiline_file, max_lines=3)
         
         assert result["success"] is True
         assert result["lines"] == 3
@@ -255,67 +267,65 @@ class TestReadFileSync:
         assert "line3" in result["content"]
         assert "line4" not in result["content"]
     
-    @pytest.mark.unit
-    def test_read_file_encoding_error(self, test_project_dir, config_manager):
+    def test_read_file_encoding_error(self, read_fixture_dir, config_manager):
         """Test file reading with encoding errors."""
-        config_manager.add_directory(test_project_dir)
+        config_manager.add_directory(read_fixture_dir)
+        binary_file = os.path.join(read_fixture_dir, "binary.bin")
         
-        # Create a file with invalid UTF-8 content
-        binary_file = os.path.join(test_project_dir, "binary.bin")
-        with open(binary_file, 'wb') as f:
-            f.write(b'\xff\xfe\x00\x00')  # Invalid UTF-8
-        
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(binary_file)
+        result = _read_file_sync(binary_file)
         
         # Should fall back to latin-1 encoding
         assert result["success"] is True
         assert result["content"] is not None
     
-    @pytest.mark.unit
-    def test_read_file_permission_denied(self, test_project_dir, config_manager):
+    def test_read_file_permission_denied(self, test_project_dir, project_paths, config_manager):
         """Test file reading with permission denied."""
         config_manager.add_directory(test_project_dir)
-        test_file = os.path.join(test_project_dir, "test.txt")
+        test_file = project_paths.test_txt
         
         with patch('builtins.open', side_effect=PermissionError("Permission denied")):
-            with patch('official_mcp_server.config_manager', config_manager):
-                result = _read_file_sync(test_file)
+            result = _read_file_sync(test_file)
         
         assert result["success"] is False
         assert "Permission denied" in result["error"]
         assert result["content"] == ""
         assert result["lines"] == 0
     
-    @pytest.mark.unit
-    def test_read_file_line_counting(self, test_project_dir, config_manager):
+    @pytest.mark.parametrize("filename,content,expected_lines", _LINE_COUNT_CASES)
+    def test_read_file_line_counting(self, read_fixture_dir, config_manager, filename, content, expected_lines):
         """Test accurate line counting."""
-        config_manager.add_directory(test_project_dir)
+        config_manager.add_directory(read_fixture_dir)
+        file_path = os.path.join(read_fixture_dir, filename)
         
-        # Create files with different line endings
-        test_cases = [
-            ("no_newline.txt", "single line", 1),
-            ("with_newline.txt", "line1\nline2", 2),
-            ("empty.txt", "", 1),  # Empty file should have 1 line
-            ("windows_newlines.txt", "line1\r\nline2\r\n", 2),
-        ]
+        result = _read_file_sync(file_path)
         
-        for filename, content, expected_lines in test_cases:
-            file_path = os.path.join(test_project_dir, filename)
-            with open(file_path, 'w') as f:
-                f.write(content)
-            
-            with patch('official_mcp_server.config_manager', config_manager):
-                result = _read_file_sync(file_path)
-            
-            assert result["success"] is True
-            assert result["lines"] == expected_lines, f"Failed for {filename}"
+        assert result["success"] is True
+        assert result["lines"] == expected_lines
+
+
+# Canned subprocess.run results for the mocked git status tests; never mutated
+_GIT_STATUS_OK = subprocess.CompletedProcess(
+    ["git", "status", "--porcelain"], 0,
+    stdout=" M modified.py\nA  added.py\nD  deleted.py\n?? untracked.py", stderr=""
+)
+_GIT_BRANCH_OK = subprocess.CompletedProcess(["git", "branch", "--show-current"], 0, stdout="main", stderr="")
+_GIT_FAILED = subprocess.CompletedProcess(["git", "status", "--porcelain"], 1, stdout="", stderr="Git error")
 
 
 class TestGetGitStatusSync:
     """Test cases for _get_git_status_sync function."""
     
-    @pytest.mark.unit
+    @pytest.fixture(scope="class")
+    @classmethod
+    def fake_git_repo(cls, tmp_path_factory):
+        """Directory with an empty .git, enough for tests that mock subprocess.run entirely.
+        
+        Unlike git_repo it needs no git binary and no per-test reset/clean subprocesses.
+        """
+        repo_dir = tmp_path_factory.mktemp("fake_git_repo")
+        (repo_dir / ".git").mkdir()
+        return str(repo_dir)
+    
     def test_get_git_status_success(self, git_repo):
         """Test successful git status retrieval."""
         result = _get_git_status_sync(git_repo)
@@ -330,7 +340,6 @@ class TestGetGitStatusSync:
         assert "untracked_files" in result
         assert "total_changes" in result
     
-    @pytest.mark.unit
     def test_get_git_status_not_git_repo(self, test_project_dir):
         """Test git status on non-git directory."""
         result = _get_git_status_sync(test_project_dir)
@@ -339,7 +348,6 @@ class TestGetGitStatusSync:
         assert result["is_git_repo"] is False
         assert "Not a git repository" in result["message"]
     
-    @pytest.mark.unit
     def test_get_git_status_nonexistent_directory(self):
         """Test git status on non-existent directory."""
         result = _get_git_status_sync("/non/existent/path")
@@ -348,65 +356,50 @@ class TestGetGitStatusSync:
         assert "does not exist" in result["error"]
         assert result["is_git_repo"] is False
     
-    @pytest.mark.unit
-    def test_get_git_status_not_directory(self, test_project_dir):
+    def test_get_git_status_not_directory(self, project_paths):
         """Test git status when path is not a directory."""
-        test_file = os.path.join(test_project_dir, "test.py")
+        test_file = project_paths.test_py
         result = _get_git_status_sync(test_file)
         
         assert result["success"] is False
         assert "not a directory" in result["error"]
         assert result["is_git_repo"] is False
     
-    @pytest.mark.unit
-    def test_get_git_status_git_not_found(self, git_repo):
+    def test_get_git_status_git_not_found(self, fake_git_repo):
         """Test git status when git command is not found."""
-        with patch('subprocess.run', side_effect=FileNotFoundError("git not found")):
-            result = _get_git_status_sync(git_repo)
+        with patch('official_mcp_server.pygit2', None), \
+             patch('subprocess.run', side_effect=FileNotFoundError("git not found")):
+            result = _get_git_status_sync(fake_git_repo)
         
         assert result["success"] is False
         assert "Git command not found" in result["error"]
         assert result["is_git_repo"] is True
     
-    @pytest.mark.unit
-    def test_get_git_status_timeout(self, git_repo):
+    def test_get_git_status_timeout(self, fake_git_repo):
         """Test git status with command timeout."""
-        with patch('subprocess.run', side_effect=subprocess.TimeoutExpired("git", 30)):
-            result = _get_git_status_sync(git_repo)
+        with patch('official_mcp_server.pygit2', None), \
+             patch('subprocess.run', side_effect=subprocess.TimeoutExpired("git", 30)):
+            result = _get_git_status_sync(fake_git_repo)
         
         assert result["success"] is False
         assert "timed out" in result["error"]
         assert result["is_git_repo"] is True
     
-    @pytest.mark.unit
-    def test_get_git_status_command_failure(self, git_repo):
+    def test_get_git_status_command_failure(self, fake_git_repo):
         """Test git status with command failure."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Git error"
-        
-        with patch('subprocess.run', return_value=mock_result):
-            result = _get_git_status_sync(git_repo)
+        with patch('official_mcp_server.pygit2', None), \
+             patch('subprocess.run', return_value=_GIT_FAILED):
+            result = _get_git_status_sync(fake_git_repo)
         
         assert result["success"] is False
         assert "Git command failed" in result["error"]
         assert result["is_git_repo"] is True
     
-    @pytest.mark.unit
-    def test_get_git_status_parse_output(self, git_repo):
+    def test_get_git_status_parse_output(self, fake_git_repo):
         """Test parsing of git status output."""
-        # Mock git status output
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = " M modified.py\nA  added.py\nD  deleted.py\n?? untracked.py"
-        
-        # Mock branch command
-        mock_branch_result = MagicMock()
-        mock_branch_result.returncode = 0
-        mock_branch_result.stdout = "main"
-        
-        with patch('subprocess.run', side_effect=[mock_result, mock_branch_result]):
-            result = _get_git_status_sync(git_repo)
+        with patch('official_mcp_server.pygit2', None), \
+             patch('subprocess.run', side_effect=[_GIT_STATUS_OK, _GIT_BRANCH_OK]):
+            result = _get_git_status_sync(fake_git_repo)
         
         assert result["success"] is True
         assert result["current_branch"] == "main"
@@ -415,12 +408,390 @@ class TestGetGitStatusSync:
         assert "deleted.py" in result["deleted_files"]
         assert "untracked.py" in result["untracked_files"]
         assert result["total_changes"] == 4
+    
+    def test_get_git_status_pygit2(self, temp_dir):
+        """Test in-process git status via pygit2 on a real repository."""
+        pytest.importorskip("pygit2")
+        repo_dir = os.path.join(temp_dir, "real_repo")
+        os.makedirs(repo_dir)
+        
+        def git(*args):
+            subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+        
+        git("init", "-q", "-b", "main")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        with open(os.path.join(repo_dir, "modified.py"), 'w') as f:
+            f.write("x = 1\n")
+        git("add", "modified.py")
+        git("commit", "-q", "-m", "Initial commit")
+        
+        with open(os.path.join(repo_dir, "modified.py"), 'a') as f:
+            f.write("y = 2\n")
+        with open(os.path.join(repo_dir, "added.py"), 'w') as f:
+            f.write("z = 3\n")
+        git("add", "added.py")
+        with open(os.path.join(repo_dir, "untracked.py"), 'w') as f:
+            f.write("w = 4\n")
+        
+        with patch('subprocess.run', side_effect=AssertionError("git CLI should not be used")):
+            result = _get_git_status_sync(repo_dir)
+        
+        assert result["success"] is True
+        assert result["current_branch"] == "main"
+        assert result["modified_files"] == ["modified.py"]
+        assert result["added_files"] == ["added.py"]
+        assert result["untracked_files"] == ["untracked.py"]
+        assert result["total_changes"] == 3
+    
+    def test_get_git_snapshot_cli(self, temp_dir):
+        """Test git snapshot gathers status, branch and log with two git calls and no shell."""
+        repo_dir = os.path.join(temp_dir, "snapshot_repo")
+        os.makedirs(repo_dir)
+        
+        def git(*args):
+            subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+        
+        git("init", "-q", "-b", "main")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        with open(os.path.join(repo_dir, "tracked.py"), 'w') as f:
+            f.write("x = 1\n")
+        git("add", "tracked.py")
+        git("commit", "-q", "-m", "Initial commit")
+        with open(os.path.join(repo_dir, "tracked.py"), 'a') as f:
+            f.write("y = 2\n")
+        with open(os.path.join(repo_dir, "untracked.py"), 'w') as f:
+            f.write("z = 3\n")
+        
+        with patch('official_mcp_server.pygit2', None), \
+             patch('subprocess.run', wraps=subprocess.run) as mock_run:
+            result = _get_git_snapshot_sync(repo_dir, limit=5)
+        
+        assert [call.args[0][0] for call in mock_run.call_args_list] == ["git", "git"]
+        assert result["success"] is True
+        assert result["current_branch"] == "main"
+        assert result["modified_files"] == ["tracked.py"]
+        assert result["untracked_files"] == ["untracked.py"]
+        assert len(result["commits"]) == 1
+        assert result["commits"][0]["message"] == "Initial commit"
+        assert result["commits"][0]["author"] == "Test User"
+    
+    def test_get_git_snapshot_cli_without_commits(self, temp_dir):
+        """Test a failing git log (no commits yet) still returns the status with no commits."""
+        repo_dir = os.path.join(temp_dir, "empty_repo")
+        os.makedirs(repo_dir)
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=repo_dir, check=True, capture_output=True)
+        with open(os.path.join(repo_dir, "new.py"), 'w') as f:
+            f.write("x = 1\n")
+        
+        with patch('official_mcp_server.pygit2', None):
+            result = _get_git_snapshot_sync(repo_dir, limit=5)
+        
+        assert result["success"] is True
+        assert result["current_branch"] == "main"
+        assert result["untracked_files"] == ["new.py"]
+        assert result["commits"] == []
+    
+    def test_get_commit_history_cli_parsing(self, git_repo):
+        """Test CLI commit history keeps '|' in subjects and batches commit stats."""
+        with open(os.path.join(git_repo, "feature.py"), 'w') as f:
+            f.write("a = 1\nb = 2\n")
+        subprocess.run(["git", "add", "feature.py"], cwd=git_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", "Parse a|b pipes"], cwd=git_repo, check=True, capture_output=True)
+        
+        with patch('official_mcp_server.pygit2', None), \
+             patch('subprocess.run', wraps=subprocess.run) as mock_run:
+            result = _get_commit_history_sync(git_repo, limit=5)
+        
+        assert mock_run.call_count == 2  # git log + one git show for all stats
+        assert result["success"] is True
+        assert [c["message"] for c in result["commits"]] == ["Parse a|b pipes", "Initial commit"]
+        assert result["commits"][0]["author_name"] == "Test User"
+        assert "main" in result["commits"][0]["branches"]
+        assert result["commits"][0]["statistics"] == {"files_changed": 1, "insertions": 2, "deletions": 0}
+    
+    @pytest.mark.parametrize("run", range(2))
+    def test_shared_fixtures_reset_between_tests(self, git_repo, test_project_dir, run):
+        """Test the module-scoped git_repo and test_project_dir start clean although tests dirty them."""
+        head_count = subprocess.run(["git", "rev-list", "--count", "HEAD"], cwd=git_repo,
+                                    check=True, capture_output=True, text=True).stdout.strip()
+        assert head_count == "1"
+        assert _get_git_status_sync(git_repo)["total_changes"] == 0
+        assert not os.path.exists(os.path.join(test_project_dir, "added.py"))
+        with open(os.path.join(test_project_dir, "test.py"), 'r') as f:
+            assert f.read() == "print('Hello, World!')"
+        
+        # Dirty both so the second run fails unless teardown restored them
+        for name in ("committed.py", "untracked.py"):
+            with open(os.path.join(git_repo, name), 'w') as f:
+                f.write(f"run = {run}\n")
+        subprocess.run(["git", "add", "committed.py"], cwd=git_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", "Dirty"], cwd=git_repo, check=True, capture_output=True)
+        with open(os.path.join(git_repo, "main.py"), 'a') as f:
+            f.write("\n# modified\n")
+        with open(os.path.join(test_project_dir, "added.py"), 'w') as f:
+            f.write("added = True\n")
+        with open(os.path.join(test_project_dir, "test.py"), 'w') as f:
+            f.write("changed = True\n")
+
+
+class TestCodeIndexer:
+    """Test cases for CodeIndexer batch indexing."""
+    
+    def test_index_files_parallel_matches_sequential(self, temp_dir, caplog):
+        """Test index_files with a process pool builds the same index as per-file indexing."""
+        files = []
+        for i in range(official_mcp_server._PARALLEL_INDEX_MIN_FILES + 8):
+            file_path = os.path.join(temp_dir, f"module_{i}.py")
+            with open(file_path, 'w') as f:
+                f.write(f"import os\n\ndef function_{i}():\n    return {i}\n\nclass Class_{i}:\n    pass\n")
+            files.append(file_path)
+        broken_file = os.path.join(temp_dir, "broken.py")
+        with open(broken_file, 'w') as f:
+            f.write("def broken(:\n")
+        
+        sequential = CodeIndexer()
+        for file_path in files + [broken_file]:
+            sequential.index_python_file(file_path)
+        
+        parallel = CodeIndexer()
+        with patch('official_mcp_server.ProcessPoolExecutor', wraps=official_mcp_server.ProcessPoolExecutor) as pool:
+            indexed = parallel.index_files(files + [broken_file], workers=2)
+        
+        # The batch went through the pool, started without forking the caller
+        assert pool.call_count == 1
+        assert pool.call_args.kwargs["mp_context"].get_start_method() in ("forkserver", "spawn")
+        assert "Parallel indexing unavailable" not in caplog.text
+        
+        def snapshot(indexer):
+            return {
+                name: [(s.type, s.file_path, s.line_number, s.definition) for s in symbols]
+                for name, symbols in indexer.symbols.items()
+            }
+        
+        assert indexed == len(files)
+        assert parallel.indexed_files == sequential.indexed_files
+        assert snapshot(parallel) == snapshot(sequential)
+        assert len(parallel.symbols["os"]) == len(files)
+    
+    def test_reindex_and_remove_file_update_search(self, temp_dir):
+        """Test re-indexing replaces a file's symbols and remove_file drops them."""
+        first = os.path.join(temp_dir, "first.py")
+        second = os.path.join(temp_dir, "second.py")
+        with open(first, 'w') as f:
+            f.write("class UserModel:\n    pass\n\ndef load_user():\n    pass\n")
+        with open(second, 'w') as f:
+            f.write("def load_user():\n    pass\n")
+        
+        indexer = CodeIndexer()
+        indexer.index_python_file(first)
+        indexer.index_python_file(second)
+        assert [s.file_path for s in indexer.search_symbols("load_user")] == [first, second]
+        
+        with open(first, 'w') as f:
+            f.write("class AdminModel:\n    pass\n")
+        indexer.index_python_file(first)
+        assert [s.name for s in indexer.search_symbols("usermodel")] == []
+        assert [s.name for s in indexer.search_symbols("model", symbol_type="class")] == ["AdminModel"]
+        assert [s.file_path for s in indexer.search_symbols("load_user")] == [second]
+        
+        indexer.remove_file(second)
+        assert indexer.search_symbols("load_user") == []
+        assert "load_user" not in indexer.symbols
+        assert second not in indexer.indexed_files
+    
+    def test_exact_search_is_a_name_lookup(self, temp_dir):
+        """Test exact=True matches whole names case-insensitively without scanning the index."""
+        file_path = os.path.join(temp_dir, "users.py")
+        with open(file_path, 'w') as f:
+            f.write("class User:\n    pass\n\nclass UserModel:\n    pass\n\ndef load_user():\n    pass\n")
+        indexer = CodeIndexer()
+        indexer.index_python_file(file_path)
+        assert [s.name for s in indexer.search_symbols("user")] == ["User", "UserModel", "load_user"]
+        
+        class NoScan(dict):
+            def items(self):
+                raise AssertionError("exact search scanned every name")
+        
+        indexer._names_by_lower = NoScan(indexer._names_by_lower)
+        assert [s.name for s in indexer.search_symbols("user", exact=True)] == ["User"]
+        assert indexer.search_symbols("user", symbol_type="function", exact=True) == []
+        assert indexer.search_symbols("missing", exact=True) == []
+    
+    def test_index_directory_single_walk(self, temp_dir):
+        """Test index_directory picks up every supported language and honours the filter."""
+        files = {
+            "app.py": "def app():\n    pass\n",
+            "web/client.js": "function client() {}\n",
+            "web/types.ts": "interface Client {}\n",
+            "svc/main.go": "package main\n\nfunc Serve() {}\n",
+            "notes.txt": "def not_code():\n",
+            "private/secret.py": "def secret():\n    pass\n",
+        }
+        for file_path, content in files.items():
+            full_path = os.path.join(temp_dir, file_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as f:
+                f.write(content)
+        
+        indexer = CodeIndexer()
+        submitted = indexer.index_directory(temp_dir, lambda p: "private" not in p)
+        
+        assert submitted == 4
+        assert {os.path.relpath(p, temp_dir) for p in indexer.indexed_files} == {
+            "app.py", os.path.join("web", "client.js"), os.path.join("web", "types.ts"), os.path.join("svc", "main.go")
+        }
+        assert {"app", "client", "Client", "Serve"} <= set(indexer.symbols)
+        assert indexer.index_directory(temp_dir, lambda p: "private" not in p) == 0
+        # Indexed files are keyed by normalized path, so a non-canonical root still matches
+        assert indexer.index_directory(os.path.join(temp_dir, "web", ".."), lambda p: "private" not in p) == 0
+    
+    def test_unchanged_file_is_not_reparsed(self, temp_dir):
+        """Test re-indexing skips the parse when stat or content digest is unchanged."""
+        file_path = os.path.join(temp_dir, "stable.py")
+        with open(file_path, 'w') as f:
+            f.write("def stable():\n    pass\n")
+        os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+        
+        indexer = CodeIndexer()
+        indexer.index_python_file(file_path)
+        
+        with patch('official_mcp_server._parse_python_source') as mock_parse:
+            # Same mtime and size
+            indexer.index_python_file(file_path)
+            assert indexer.index_files([file_path]) == 1
+            # Touched but identical content
+            os.utime(file_path, ns=(2_000_000_000, 2_000_000_000))
+            indexer.index_python_file(file_path)
+        mock_parse.assert_not_called()
+        
+        with open(file_path, 'w') as f:
+            f.write("def changed():\n    pass\n")
+        indexer.index_python_file(file_path)
+        assert "changed" in indexer.symbols
+        assert "stable" not in indexer.symbols
+
+
+class TestFileWatcher:
+    """Test cases for FileWatcher polling fallback."""
+    
+    def test_poll_snapshot_skips_unindexed_dirs(self, temp_dir):
+        """Test the polling listdir/stat hooks prune skipped dirs and match os.stat."""
+        from watchdog.utils.dirsnapshot import DirectorySnapshot
+        
+        for file_path in ("src/app.py", ".git/HEAD", "node_modules/pkg/index.js", "__pycache__/app.pyc"):
+            full_path = os.path.join(temp_dir, file_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as f:
+                f.write("x = 1\n")
+        
+        watcher = FileWatcher(MagicMock(), CodeIndexer())
+        snapshot = DirectorySnapshot(temp_dir, stat=watcher._poll_stat, listdir=watcher._poll_listdir)
+        
+        assert {os.path.relpath(p, temp_dir) for p in snapshot.paths} == {".", "src", os.path.join("src", "app.py")}
+        app_path = os.path.join(temp_dir, "src", "app.py")
+        assert snapshot.inode(app_path) == (os.stat(app_path).st_ino, os.stat(app_path).st_dev)
+        assert watcher._poll_stat_cache == {}
+    
+    def test_network_mount_uses_polling(self, temp_dir):
+        """Test directories on network mounts are polled while local ones use native events."""
+        local_dir = os.path.join(temp_dir, "local")
+        nfs_dir = os.path.join(temp_dir, "nfs")
+        os.makedirs(local_dir)
+        os.makedirs(nfs_dir)
+        
+        config_manager = MagicMock()
+        config_manager.config.force_polling = False
+        config_manager.config.watched_directories = [
+            MagicMock(path=local_dir, enabled=True),
+            MagicMock(path=nfs_dir, enabled=True),
+        ]
+        mounts = ((os.path.realpath(nfs_dir), "nfs4"), ("/", "ext4"))
+        
+        watcher = FileWatcher(config_manager, CodeIndexer())
+        with patch('official_mcp_server._mount_table', return_value=mounts):
+            assert watcher.start_watching()
+        try:
+            assert watcher.watch_modes == {local_dir: "native", nfs_dir: "polling"}
+            assert watcher.network_observer is not None
+            assert watcher.get_index_statistics()["watch_modes"] == watcher.watch_modes
+        finally:
+            watcher.stop_watching()
+        assert watcher.network_observer is None
+    
+    def test_wait_for_events_returns_processed_changes(self, temp_dir):
+        """Test wait_for_events wakes once the debounced change is indexed."""
+        config_manager = MagicMock()
+        config_manager.config.force_polling = False
+        config_manager.config.watched_directories = [MagicMock(path=temp_dir, enabled=True)]
+        indexer = CodeIndexer()
+        
+        watcher = FileWatcher(config_manager, indexer, debounce_delay=0.05)
+        watcher._is_supported_file = lambda file_path: file_path.endswith(".py")
+        assert watcher.start_watching()
+        try:
+            file_path = os.path.join(temp_dir, "watched.py")
+            with open(file_path, 'w') as f:
+                f.write("def watched():\n    pass\n")
+            
+            changes = watcher.wait_for_events(1, timeout=5.0)
+        finally:
+            watcher.stop_watching()
+        
+        assert [change.file_path for change in changes] == [file_path]
+        assert "watched" in indexer.symbols
+        assert watcher.wait_for_events(1, timeout=0.01) == []
+    
+    def test_reindex_future_resolves_after_indexing(self, temp_dir):
+        """Test reindex_future completes once the saved file is re-indexed."""
+        config_manager = MagicMock()
+        config_manager.config.force_polling = False
+        config_manager.config.watched_directories = [MagicMock(path=temp_dir, enabled=True)]
+        indexer = CodeIndexer()
+        file_path = os.path.join(temp_dir, "saved.py")
+        with open(file_path, 'w') as f:
+            f.write("def before():\n    pass\n")
+        
+        watcher = FileWatcher(config_manager, indexer, debounce_delay=0.05)
+        watcher._is_supported_file = lambda path: path.endswith(".py")
+        assert watcher.start_watching()
+        try:
+            future = watcher.reindex_future(file_path)
+            assert watcher.reindex_future(file_path) is future
+            with open(file_path, 'w') as f:
+                f.write("def after():\n    pass\n")
+            change = future.result(timeout=5.0)
+            
+            pending = watcher.reindex_future(os.path.join(temp_dir, "never.py"))
+        finally:
+            watcher.stop_watching()
+        
+        assert change.file_path == file_path
+        assert "after" in indexer.symbols
+        assert pending.cancelled()
+    
+    def test_any_file_event_invalidates_git_cache(self, git_repo):
+        """Test untracked non-source files drop the cached status of their repository."""
+        from watchdog.events import FileCreatedEvent
+        
+        assert _get_git_status_sync(git_repo)["untracked_files"] == []
+        notes_path = os.path.join(git_repo, "notes.txt")
+        with open(notes_path, 'w') as f:
+            f.write("todo\n")
+        # HEAD and the index are unchanged, so the cached status is still served
+        assert _get_git_status_sync(git_repo)["untracked_files"] == []
+        
+        watcher = FileWatcher(MagicMock(), CodeIndexer())
+        watcher._on_file_created(FileCreatedEvent(notes_path))
+        
+        assert watcher.pending_changes == {}
+        assert _get_git_status_sync(git_repo)["untracked_files"] == ["notes.txt"]
 
 
 class TestRegisterTools:
     """Test cases for register_tools function."""
     
-    @pytest.mark.unit
     def test_register_tools_success(self, mock_mcp_server):
         """Test successful tool registration."""
         with patch('official_mcp_server.mcp', mock_mcp_server):
@@ -430,7 +801,6 @@ class TestRegisterTools:
         assert mock_mcp_server.tool.called
         assert mock_mcp_server.tool.call_count >= 5  # At least 5 tools should be registered
     
-    @pytest.mark.unit
     def test_register_tools_with_config_manager(self, mock_mcp_server, mock_config_manager):
         """Test tool registration with configuration manager."""
         with patch('official_mcp_server.mcp', mock_mcp_server), \
@@ -443,53 +813,46 @@ class TestRegisterTools:
 
 class TestRunPersistentServer:
     """Test cases for run_persistent_server function."""
-    
-    @pytest.mark.unit
-    def test_run_persistent_server_success(self, mock_mcp_server, mock_config_manager):
-        """Test successful server startup."""
-        with patch('official_mcp_server.MCPConfigManager', return_value=mock_config_manager), \
-             patch('official_mcp_server.FastMCP', return_value=mock_mcp_server), \
-             patch('official_mcp_server.register_tools'), \
-             patch('official_mcp_server.mcp', mock_mcp_server), \
-             patch('official_mcp_server.setup_signal_handlers'):
 
-            # Mock the run method to avoid infinite loop
-            mock_mcp_server.run.side_effect = KeyboardInterrupt()
+    @pytest.fixture
+    def server_patches(self, monkeypatch, mock_mcp_server, mock_config_manager):
+        """Stub out the server's collaborators; returns the MCPConfigManager mock."""
+        config_manager_cls = MagicMock(return_value=mock_config_manager)
+        monkeypatch.setattr(official_mcp_server, "MCPConfigManager", config_manager_cls)
+        monkeypatch.setattr(official_mcp_server, "FastMCP", MagicMock(return_value=mock_mcp_server))
+        monkeypatch.setattr(official_mcp_server, "register_tools", MagicMock())
+        monkeypatch.setattr(official_mcp_server, "mcp", mock_mcp_server)
+        monkeypatch.setattr(official_mcp_server, "setup_signal_handlers", MagicMock())
 
-            with pytest.raises(KeyboardInterrupt):
-                run_persistent_server()
+        # Mock the run method to avoid infinite loop
+        mock_mcp_server.run.side_effect = KeyboardInterrupt()
+        return config_manager_cls
+
+    def test_run_persistent_server_success(self, server_patches):
+        """Test successful server startup."""
+        with pytest.raises(KeyboardInterrupt):
+            run_persistent_server()
     
-    @pytest.mark.unit
     def test_run_persistent_server_config_error(self):
         """Test server startup with configuration error."""
         with patch('official_mcp_server.MCPConfigManager', side_effect=Exception("Config error")):
             with pytest.raises(Exception, match="Config error"):
                 run_persistent_server()
     
-    @pytest.mark.unit
-    def test_run_persistent_server_with_config_path(self, mock_mcp_server, mock_config_manager):
+    def test_run_persistent_server_with_config_path(self, server_patches):
         """Test server startup with custom config path."""
         config_path = "/custom/config.json"
 
-        with patch('official_mcp_server.MCPConfigManager', return_value=mock_config_manager) as mock_manager, \
-             patch('official_mcp_server.FastMCP', return_value=mock_mcp_server), \
-             patch('official_mcp_server.register_tools'), \
-             patch('official_mcp_server.mcp', mock_mcp_server), \
-             patch('official_mcp_server.setup_signal_handlers'):
-
-            mock_mcp_server.run.side_effect = KeyboardInterrupt()
-
-            with pytest.raises(KeyboardInterrupt):
-                run_persistent_server(config_path)
+        with pytest.raises(KeyboardInterrupt):
+            run_persistent_server(config_path)
 
-            # Verify config manager was called with correct path
-            mock_manager.assert_called_once_with(config_path)
+        # Verify config manager was called with correct path
+        server_patches.assert_called_once_with(config_path)
 
 
 class TestSetupSignalHandlers:
     """Test cases for setup_signal_handlers function."""
     
-    @pytest.mark.unit
     def test_setup_signal_handlers(self):
         """Test signal handler setup."""
         with patch('signal.signal') as mock_signal:
@@ -504,7 +867,6 @@ class TestSetupSignalHandlers:
 class TestErrorHandling:
     """Test cases for error handling and edge cases."""
     
-    @pytest.mark.unit
     def test_unexpected_errors_handled(self, config_manager):
         """Test that unexpected errors are properly handled."""
         with patch('pathlib.Path.resolve', side_effect=Exception("Unexpected error")):
@@ -513,7 +875,6 @@ class TestErrorHandling:
         assert result["success"] is False
         assert "Unexpected error" in result["error"]
     
-    @pytest.mark.unit
     def test_file_access_without_config_manager(self):
         """Test file access when config_manager is None."""
         with patch('official_mcp_server.config_manager', None):
@@ -522,13 +883,11 @@ class TestErrorHandling:
         # Should work without config manager (permissive mode)
         assert "success" in result
     
-    @pytest.mark.unit
     def test_config_manager_without_config(self, config_manager):
         """Test operations when config_manager has no config."""
         config_manager.config = None
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _list_files_sync("/some/path")
+        result = _list_files_sync("/some/path")
         
         # Should work without config (permissive mode)
         assert "success" in result
@@ -536,9 +895,10 @@ class TestErrorHandling:
 
 class TestSecurityFeatures:
     """Test cases for security features."""
+
+    pytestmark = pytest.mark.security
     
-    @pytest.mark.security
-    def test_path_traversal_protection(self, config_manager):
+    def test_path_traversal_protection(self, config_manager, subtests):
         """Test protection against path traversal attacks."""
         config_manager.add_directory("/safe/directory")
         
@@ -548,14 +908,12 @@ class TestSecurityFeatures:
             "/safe/directory/./././etc/shadow",
         ]
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            for malicious_path in malicious_paths:
-                result = _read_file_sync(malicious_path)
+        for malicious_path in malicious_paths:
+            with subtests.test(path=malicious_path):
                 # Should be blocked by configuration
-                assert result["success"] is False
+                assert _read_file_sync(malicious_path)["success"] is False
     
-    @pytest.mark.security
-    def test_system_directory_protection(self, config_manager):
+    def test_system_directory_protection(self, config_manager, subtests):
         """Test protection against accessing system directories."""
         system_paths = [
             "/etc/passwd",
@@ -564,20 +922,17 @@ class TestSecurityFeatures:
             "/proc/1/status",
         ]
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            for system_path in system_paths:
-                result = _read_file_sync(system_path)
+        for system_path in system_paths:
+            with subtests.test(path=system_path):
                 # Should be blocked
-                assert result["success"] is False
+                assert _read_file_sync(system_path)["success"] is False
     
-    @pytest.mark.security
-    def test_file_size_limits(self, test_project_dir, config_manager):
+    def test_file_size_limits(self, test_project_dir, project_paths, config_manager):
         """Test file size limit enforcement."""
         # Set very small size limit
         config_manager.add_directory(test_project_dir, max_file_size="1B")
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(os.path.join(test_project_dir, "test.txt"))
+        result = _read_file_sync(project_paths.test_txt)
         
         assert result["success"] is False
         assert "too large" in result["error"]
@@ -585,105 +940,99 @@ class TestSecurityFeatures:
 
 class TestConfigurationIntegration:
     """Test cases for configuration integration."""
+
+    pytestmark = pytest.mark.config
     
-    @pytest.mark.config
-    def test_config_manager_integration(self, test_project_dir, config_manager):
+    def test_config_manager_integration(self, test_project_dir, project_paths, config_manager):
         """Test integration with configuration manager."""
         config_manager.add_directory(test_project_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            # Test that configuration is respected
-            result = _list_files_sync(test_project_dir)
-            assert result["success"] is True
+        # Test that configuration is respected
+        result = _list_files_sync(test_project_dir)
+        assert result["success"] is True
             
-            # Test that excluded files are not accessible
-            env_file = os.path.join(test_project_dir, ".env")
-            result = _read_file_sync(env_file)
-            assert result["success"] is False
+        # Test that excluded files are not accessible
+        env_file = project_paths.env
+        result = _read_file_sync(env_file)
+        assert result["success"] is False
     
-    @pytest.mark.config
     def test_config_reload_handling(self, test_project_dir, config_manager):
         """Test handling of configuration reloads."""
         config_manager.add_directory(test_project_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            # Initial access should work
-            result = _list_files_sync(test_project_dir)
-            assert result["success"] is True
+        # Initial access should work
+        result = _list_files_sync(test_project_dir)
+        assert result["success"] is True
             
-            # Simulate config reload by changing the config
-            config_manager.config.enabled = False
+        # Simulate config reload by changing the config
+        config_manager.config.enabled = False
             
-            # Access should now be denied
-            result = _list_files_sync(test_project_dir)
-            assert result["success"] is False
+        # Access should now be denied
+        result = _list_files_sync(test_project_dir)
+        assert result["success"] is False
 
 
 # Integration tests that require more complex setup
 class TestIntegration:
     """Integration tests for MCP server functionality."""
+
+    pytestmark = pytest.mark.integration
     
-    @pytest.mark.integration
-    def test_full_workflow(self, test_project_dir, config_manager):
+    def test_full_workflow(self, test_project_dir, project_paths, config_manager):
         """Test complete workflow from configuration to file access."""
         # Setup configuration
         config_manager.add_directory(test_project_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            # List files
-            list_result = _list_files_sync(test_project_dir)
-            assert list_result["success"] is True
+        # List files
+        list_result = _list_files_sync(test_project_dir)
+        assert list_result["success"] is True
             
-            # Read a file
-            test_file = os.path.join(test_project_dir, "test.txt")
-            read_result = _read_file_sync(test_file)
-            assert read_result["success"] is True
-            assert read_result["content"] == "This is a test file"
+        # Read a file
+        test_file = project_paths.test_txt
+        read_result = _read_file_sync(test_file)
+        assert read_result["success"] is True
+        assert read_result["content"] == "This is a test file"
             
-            # Check git status (if it's a git repo)
-            git_result = _get_git_status_sync(test_project_dir)
-            assert git_result["success"] is True
+        # Check git status (if it's a git repo)
+        git_result = _get_git_status_sync(test_project_dir)
+        assert git_result["success"] is True
     
-    @pytest.mark.integration
     def test_multiple_directories(self, test_project_dir, test_docs_dir, config_manager):
         """Test working with multiple directories."""
         config_manager.add_directory(test_project_dir)
         config_manager.add_directory(test_docs_dir)
         
-        with patch('official_mcp_server.config_manager', config_manager):
-            # Test project directory
-            result1 = _list_files_sync(test_project_dir)
-            assert result1["success"] is True
+        # Test project directory
+        result1 = _list_files_sync(test_project_dir)
+        assert result1["success"] is True
             
-            # Test docs directory
-            result2 = _list_files_sync(test_docs_dir)
-            assert result2["success"] is True
+        # Test docs directory
+        result2 = _list_files_sync(test_docs_dir)
+        assert result2["success"] is True
             
-            # Test cross-directory access (should fail)
-            cross_file = os.path.join(test_docs_dir, "readme.txt")
-            result3 = _read_file_sync(cross_file)
-            assert result3["success"] is True  # Should work since docs_dir is configured
+        # Test cross-directory access (should fail)
+        cross_file = os.path.join(test_docs_dir, "readme.txt")
+        result3 = _read_file_sync(cross_file)
+        assert result3["success"] is True  # Should work since docs_dir is configured
     
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_large_file_handling(self, temp_dir, config_manager):
         """Test handling of large files."""
         large_dir = os.path.join(temp_dir, "large_files")
         os.makedirs(large_dir)
 
-        # Create a smaller file for faster testing (100KB instead of 10MB)
+        # Only the size matters here, so a sparse 100KB file avoids writing any data
         large_file = os.path.join(large_dir, "large.txt")
-        with open(large_file, 'w') as f:
-            f.write("x" * (100 * 1024))  # 100KB instead of 10MB
+        with open(large_file, 'wb') as f:
+            f.truncate(100 * 1024)
 
         config_manager.add_directory(large_dir, max_file_size="50KB")  # Set limit below file size
 
-        with patch('official_mcp_server.config_manager', config_manager):
-            result = _read_file_sync(large_file)
-            assert result["success"] is False
-            assert "too large" in result["error"]
+        result = _read_file_sync(large_file)
+        assert result["success"] is False
+        assert "too large" in result["error"]
 
-            # Increase size limit
-            config_manager.config.watched_directories[0].max_file_size = "200KB"
-            result = _read_file_sync(large_file)
-            assert result["success"] is True
+        # Increase size limit
+        config_manager.config.watched_directories[0].max_file_size = "200KB"
+        result = _read_file_sync(large_file)
+        assert result["success"] is True
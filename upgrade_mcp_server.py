@@ -7,9 +7,6 @@ This script upgrades existing MCP server installations to the enhanced version.
 
 import os
 import sys
-import shutil
-import json
-from pathlib import Path
 
 def upgrade_mcp_server():
     """Upgrade MCP server to enhanced version"""
@@ -22,6 +19,10 @@ def upgrade_mcp_server():
         print("Please run this script from the MCP server directory")
         return False
     
+    # Imported only once we know the upgrade will run
+    import shutil
+    from pathlib import Path
+    
     # Backup existing configuration
     config_path = Path.home() / ".mcp" / "config.json"
     if config_path.exists():